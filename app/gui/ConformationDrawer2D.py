@@ -41,10 +41,10 @@ class ConformationDrawer2D(ConformationDrawer):
             # index of the residue in the protein
             found_index = None
 
-            for index, amino_acid in enumerate(self.conformation.protein.sequence):
-                if amino_acid.id == residue.id:
-                    found_index = index
-                    break  # Stop searching after the first match
+            try:
+                found_index = self.conformation.protein.index_of(residue)
+            except ValueError:
+                pass
 
             if found_index is None:
                 point["label"] = "?"
@@ -0,0 +1,277 @@
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.managers import DictProxy, SyncManager
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.ProteinHP import ProteinHP
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.REMC import REMC, TEMPERATURE_LADDERS
+
+
+def _run_job(
+    job_id: str,
+    protein: ProteinHP,
+    lattice_dims: Tuple[int, ...],
+    hyperparameters: dict[str, object],
+    progress: DictProxy,
+    cancelled: DictProxy,
+) -> dict[str, object]:
+    """Runs REMC on a protein in a process of the job pool.
+
+    Parameters
+    ----------
+    job_id : str
+        Identifier of the job.
+    protein : ProteinHP
+        Protein to be folded.
+    lattice_dims : Tuple[int, ...]
+        Dimensions of the lattice.
+    hyperparameters : dict[str, object]
+        Hyperparameters of REMC (phi, khi, tmin, tmax, max_iter, rho, nb_workers, asynchronous),
+        name of its temperature ladder (see TEMPERATURE_LADDERS), optional budgets of the run
+        (time_budget, patience, 0 for no limit) and seed of the run.
+    progress : DictProxy
+        Shared dictionary in which the last snapshot of the run is published under its job id.
+    cancelled : DictProxy
+        Shared dictionary holding the job ids of the cancelled jobs.
+
+    Returns
+    -------
+    dict[str, object]
+        Initial and optimal energies, encoded optimal conformation, and reason for which the
+        run ended.
+    """
+    # Independent streams for the initial conformation and for REMC
+    conformation_seed, remc_seed = np.random.SeedSequence(
+        int(hyperparameters["seed"])
+    ).spawn(2)
+    conf_manager = ConformationManager(protein)
+    initial_conformation = conf_manager.create_initial_conformation(
+        lattice_dims, RandomStream(conformation_seed)
+    )
+    initial_energy = initial_conformation.compute_energy()
+    max_iter = int(hyperparameters["max_iter"])
+    remc = REMC(
+        int(hyperparameters["phi"]),
+        int(hyperparameters["khi"]),
+        int(hyperparameters["tmin"]),
+        int(hyperparameters["tmax"]),
+        conf_manager,
+        max_iter=max_iter,
+        rho=float(hyperparameters["rho"]),
+        nb_workers=int(hyperparameters["nb_workers"]),
+        asynchronous=bool(hyperparameters["asynchronous"]),
+        seed=remc_seed,
+        temperature_ladder=TEMPERATURE_LADDERS[
+            str(hyperparameters.get("ladder", "geometric"))
+        ](),
+        time_budget=float(hyperparameters.get("time_budget", 0)) or None,
+        patience=int(hyperparameters.get("patience", 0)) or None,
+    )
+
+    def publish(snapshot) -> bool:
+        progress[job_id] = {
+            "iteration": snapshot.iteration,
+            "max_iter": max_iter,
+            "best_energy": snapshot.best_energy,
+        }
+        return job_id in cancelled
+
+    # About a hundred snapshots, whatever the number of iterations
+    optimal_conformation = remc.optimize(
+        initial_conformation,
+        protein.e_star,
+        callback=publish,
+        every=max(1, max_iter // 100),
+    )
+    return {
+        "initial_energy": int(initial_energy),
+        "energy": int(optimal_conformation.computed_energy),
+        "conformation": optimal_conformation.encode(),
+        "lattice_dims": tuple(lattice_dims),
+        "cancelled": job_id in cancelled,
+        "termination_reason": str(remc.termination_reason),
+    }
+
+
+class JobManager:
+    """Class that runs the REMC jobs of the web interface in a pool of processes.
+
+    The jobs outlive the Streamlit script runs that submitted them: the pages only keep their job
+    id, and poll the manager for their progress and result.
+    """
+
+    _executor: ProcessPoolExecutor  # Pool of processes running the jobs
+    _manager: SyncManager  # Manager of the dictionaries shared with the processes
+    _progress: DictProxy  # Last snapshot of each running job
+    _cancelled: DictProxy  # Job ids of the cancelled jobs
+    _jobs: dict[str, Future]  # Future of each job
+    _lock: threading.Lock  # Lock of the jobs, shared by the sessions of the server
+
+    def __init__(self, nb_processes: Optional[int] = None) -> None:
+        """Constructor for the JobManager class.
+
+        Parameters
+        ----------
+        nb_processes : Optional[int], optional
+            Number of jobs running at the same time, by default None (one per core).
+        """
+        self._executor = ProcessPoolExecutor(max_workers=nb_processes)
+        self._manager = SyncManager()
+        self._manager.start()
+        self._progress = self._manager.dict()
+        self._cancelled = self._manager.dict()
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        protein: ProteinHP,
+        lattice_dims: Tuple[int, ...],
+        hyperparameters: dict[str, object],
+    ) -> str:
+        """Submits a REMC run.
+
+        Parameters
+        ----------
+        protein : ProteinHP
+            Protein to be folded.
+        lattice_dims : Tuple[int, ...]
+            Dimensions of the lattice.
+        hyperparameters : dict[str, object]
+            Hyperparameters of REMC (phi, khi, tmin, tmax, max_iter, rho, nb_workers,
+            asynchronous), name of its temperature ladder, optional budgets of the run
+            (time_budget, patience) and seed of the run.
+
+        Returns
+        -------
+        str
+            Identifier of the job.
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = self._executor.submit(
+                _run_job,
+                job_id,
+                protein,
+                tuple(lattice_dims),
+                hyperparameters,
+                self._progress,
+                self._cancelled,
+            )
+        return job_id
+
+    def get_status(self, job_id: str) -> str:
+        """Gets the status of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+
+        Returns
+        -------
+        str
+            "unknown", "pending", "running", "cancelled", "failed" or "done".
+        """
+        with self._lock:
+            future = self._jobs.get(job_id)
+        if future is None:
+            return "unknown"
+        if future.cancelled():
+            return "cancelled"
+        if not future.done():
+            return "running" if future.running() else "pending"
+        if future.exception() is not None:
+            return "failed"
+        return "done"
+
+    def get_progress(self, job_id: str) -> Optional[dict[str, int]]:
+        """Gets the last snapshot of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+
+        Returns
+        -------
+        Optional[dict[str, int]]
+            Iteration, maximum number of iterations and best energy of the job, None before its
+            first snapshot.
+        """
+        return self._progress.get(job_id)
+
+    def get_result(self, job_id: str) -> dict[str, object]:
+        """Gets the result of a finished job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+
+        Returns
+        -------
+        dict[str, object]
+            Initial and optimal energies, and encoded optimal conformation of the job.
+        """
+        with self._lock:
+            future = self._jobs[job_id]
+        return future.result(timeout=0)
+
+    def cancel(self, job_id: str) -> None:
+        """Cancels a job.
+
+        A running job stops at its next snapshot, with the best conformation found so far as
+        result.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+        """
+        with self._lock:
+            future = self._jobs.get(job_id)
+        if future is not None and not future.cancel():
+            self._cancelled[job_id] = True
+
+    def forget(self, job_id: str) -> None:
+        """Releases a job, cancelling it if it is not finished.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+        """
+        with self._lock:
+            future = self._jobs.pop(job_id, None)
+        if future is None or future.done():
+            self._release(job_id)
+            return
+
+        if not future.cancel():
+            self._cancelled[job_id] = True
+        # The running job must still see that it is cancelled
+        future.add_done_callback(lambda _: self._release(job_id))
+
+    def _release(self, job_id: str) -> None:
+        """Removes the shared entries of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+        """
+        self._progress.pop(job_id, None)
+        self._cancelled.pop(job_id, None)
+
+    def shutdown(self) -> None:
+        """Cancels the pending jobs, and stops the processes once the running ones are over."""
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+        self._manager.shutdown()
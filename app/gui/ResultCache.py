@@ -0,0 +1,171 @@
+import base64
+import hashlib
+import json
+import os
+from typing import Optional
+
+from app.src.Models.ProteinHP import ProteinHP
+
+# Hyperparameters that determine the result of a run
+KEY_HYPERPARAMETERS = (
+    "phi",
+    "khi",
+    "tmin",
+    "tmax",
+    "max_iter",
+    "rho",
+    "asynchronous",
+    "ladder",
+    "time_budget",
+    "patience",
+    "seed",
+)
+
+
+class ResultCache:
+    """Class that keeps the results of the REMC runs of the web interface on the disk.
+
+    A result is stored in a JSON file named after the hash of the HP sequence and optimal energy
+    of the protein, the dimensions of the lattice and the hyperparameters of the run. When the files exceed the
+    size of the cache, the least recently used results are evicted.
+    """
+
+    _directory: str  # Directory of the files of the results
+    _max_size: int  # Maximum total size of the files, in bytes
+
+    def __init__(self, directory: str, max_size: int = 64 * 1024 * 1024) -> None:
+        """Constructor for the ResultCache class.
+
+        Parameters
+        ----------
+        directory : str
+            Directory of the files of the results, created if needed.
+        max_size : int, optional
+            Maximum total size of the files, in bytes, by default 64 MiB
+        """
+        if max_size < 1:
+            raise ValueError("The size of the cache must be at least 1 byte.")
+        self._directory = directory
+        self._max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        protein: ProteinHP,
+        lattice_dims: tuple[int, ...],
+        hyperparameters: dict[str, object],
+    ) -> str:
+        """Computes the key of a run.
+
+        Parameters
+        ----------
+        protein : ProteinHP
+            Protein folded by the run. Its optimal energy is part of the key, as the run stops
+            when it is reached.
+        lattice_dims : tuple[int, ...]
+            Dimensions of the lattice.
+        hyperparameters : dict[str, object]
+            Hyperparameters of REMC, only those of KEY_HYPERPARAMETERS are part of the key.
+
+        Returns
+        -------
+        str
+            Key of the run.
+        """
+        description = {
+            "sequence": "".join(str(amino_acid) for amino_acid in protein.sequence),
+            "e_star": int(protein.e_star),
+            "lattice_dims": [int(dim) for dim in lattice_dims],
+            **{name: hyperparameters[name] for name in KEY_HYPERPARAMETERS},
+        }
+        return hashlib.sha256(
+            json.dumps(description, sort_keys=True).encode()
+        ).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        """Gets the path of the file of a result.
+
+        Parameters
+        ----------
+        key : str
+            Key of the run.
+
+        Returns
+        -------
+        str
+            Path of the file.
+        """
+        return os.path.join(self._directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict[str, object]]:
+        """Gets the result of a run.
+
+        Parameters
+        ----------
+        key : str
+            Key of the run.
+
+        Returns
+        -------
+        Optional[dict[str, object]]
+            Result of the run (see JobManager), None if it is not in the cache.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "r") as file:
+                result = json.load(file)
+            # The modification time of the file is the time it was last used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        result["conformation"] = base64.b64decode(result["conformation"])
+        result["lattice_dims"] = tuple(result["lattice_dims"])
+        return result
+
+    def put(self, key: str, result: dict[str, object]) -> None:
+        """Stores the result of a run, then evicts the oldest results if the cache is full.
+
+        Parameters
+        ----------
+        key : str
+            Key of the run.
+        result : dict[str, object]
+            Result of the run (see JobManager).
+        """
+        path = self._get_path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(
+                {
+                    **result,
+                    "conformation": base64.b64encode(result["conformation"]).decode(),
+                    "lattice_dims": list(result["lattice_dims"]),
+                },
+                file,
+            )
+        os.replace(temporary_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used results until the cache fits in its size."""
+        entries = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self._directory, name))
+            except OSError:
+                # Removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, name in sorted(entries):
+            if size <= self._max_size:
+                break
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except OSError:
+                pass
+            size -= file_size
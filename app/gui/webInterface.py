@@ -1,14 +1,16 @@
-import copy
 import os
+import time
 
 import streamlit as st
 
 from app.gui.ConformationDrawer2D import ConformationDrawer2D
 from app.gui.ConformationDrawer3D import ConformationDrawer3D
-from app.src.Controllers.ConformationManager import ConformationManager
+from app.gui.JobManager import JobManager
+from app.gui.ResultCache import ResultCache
 from app.src.DataHandlers.JSONProteinIO import JSONProteinIO
 from app.src.Models.AminoAcidHP import AminoAcidHP
 from app.src.Models.Conformation2D import Conformation2D
+from app.src.Models.Conformation3D import Conformation3D
 from app.src.Models.Coordinates2D import Coordinates2D
 from app.src.Models.Coordinates3D import Coordinates3D
 from app.src.Models.Lattice2D import Lattice2D
@@ -16,9 +18,161 @@ from app.src.Models.Lattice3D import Lattice3D
 from app.src.Models.Polarity import Polarity
 from app.src.Models.ProteinHP import ProteinHP
 from app.src.Models.ProteinModel import ProteinModel
-from app.src.Optimizers.REMC import REMC
+from app.src.Optimizers.REMC import TEMPERATURE_LADDERS
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data")
+CACHE_PATH = os.environ.get(
+    "REMC_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "remc", "results"),
+)
+CACHE_SIZE = int(os.environ.get("REMC_CACHE_SIZE", 64 * 1024 * 1024))
+
+
+@st.cache_resource
+def get_job_manager():
+    """Gets the job manager shared by all the sessions of the server.
+
+    Returns
+    -------
+    JobManager
+        Job manager running the REMC jobs.
+    """
+    return JobManager()
+
+
+@st.cache_resource
+def get_result_cache():
+    """Gets the cache of the results of the REMC runs.
+
+    Returns
+    -------
+    ResultCache
+        Cache of the results, in CACHE_PATH.
+    """
+    return ResultCache(CACHE_PATH, CACHE_SIZE)
+
+
+def submit_job(protein, lattice_dims, hyperparameters, colors):
+    """Submits a REMC run for the current session, releasing its previous one.
+
+    The run is not submitted when its result is in the cache.
+
+    Parameters
+    ----------
+    protein : ProteinHP
+        Protein to be folded.
+    lattice_dims : list[int]
+        Dimensions of the lattice.
+    hyperparameters : dict[str, object]
+        Hyperparameters of REMC.
+    colors : dict
+        Colors of the residues in the drawing of the optimal conformation.
+    """
+    job_manager = get_job_manager()
+    if "id" in st.session_state.get("job", {}):
+        job_manager.forget(st.session_state["job"]["id"])
+    st.session_state.pop("job", None)
+
+    key = ResultCache.make_key(protein, tuple(lattice_dims), hyperparameters)
+    job = {"key": key, "protein": protein, "colors": colors}
+    result = get_result_cache().get(key)
+    if result is None:
+        job["id"] = job_manager.submit(protein, tuple(lattice_dims), hyperparameters)
+    else:
+        job["result"] = result
+    st.session_state["job"] = job
+
+
+def show_result(job):
+    """Displays the result of a REMC run.
+
+    Parameters
+    ----------
+    job : dict
+        Job of the run, holding its protein, its result and the colors of the drawing.
+    """
+    result = job["result"]
+    protein = job["protein"]
+    lattice_dims = result["lattice_dims"]
+
+    st.write("Theoretical protein energy : ", protein.e_star)
+    st.write("Initial Conformation energy: ", result["initial_energy"])
+    if result["cancelled"]:
+        st.warning("The run was stopped before its end.")
+    elif result.get("termination_reason") == "time_budget":
+        st.warning("The run was stopped at the end of its time budget.")
+    elif result.get("termination_reason") == "stagnation":
+        st.info("The run was stopped as the best energy no longer improved.")
+    st.write("Optimal energy found by REMC: ", result["energy"])
+
+    if len(lattice_dims) == 2:
+        optimal_conformation = Conformation2D.decode(
+            protein, Lattice2D(lattice_dims), result["conformation"]
+        )
+        drawer = ConformationDrawer2D(optimal_conformation, job["colors"])
+    else:
+        optimal_conformation = Conformation3D.decode(
+            protein, Lattice3D(lattice_dims), result["conformation"]
+        )
+        drawer = ConformationDrawer3D(optimal_conformation, job["colors"])
+    st.plotly_chart(drawer.draw())
+
+
+def show_job():
+    """Displays the progress or the result of the REMC run of the current session.
+
+    The page is refreshed every second while the run is not over, the computation itself goes on
+    in the processes of the job manager whatever the user does. Once the run is over, its result
+    is moved to the session and, unless the run was stopped or ran out of time, to the result
+    cache.
+    """
+    if "job" not in st.session_state:
+        return
+
+    job = st.session_state["job"]
+    st.divider()
+    st.subheader("REMC run")
+
+    if "result" in job:
+        show_result(job)
+        return
+
+    job_manager = get_job_manager()
+    status = job_manager.get_status(job["id"])
+
+    if status in ("pending", "running"):
+        progress = job_manager.get_progress(job["id"])
+        if progress is None:
+            st.progress(0.0, text="Waiting for the run to start...")
+        else:
+            st.progress(
+                min(progress["iteration"] / progress["max_iter"], 1.0),
+                text=f"Iteration {progress['iteration']}/{progress['max_iter']} - "
+                f"best energy : {progress['best_energy']}",
+            )
+        if st.button("Stop REMC"):
+            job_manager.cancel(job["id"])
+        time.sleep(1)
+        st.rerun()
+
+    elif status == "failed":
+        try:
+            job_manager.get_result(job["id"])
+        except Exception as e:
+            st.error(e)
+            print(e)
+
+    elif status == "done":
+        job["result"] = job_manager.get_result(job["id"])
+        # A run cut by its time budget depends on the load of the server
+        if job["result"]["termination_reason"] not in ("stopped", "time_budget"):
+            get_result_cache().put(job["key"], job["result"])
+        job_manager.forget(job.pop("id"))
+        show_result(job)
+
+    else:
+        # The server was restarted, or the run was cancelled before it started
+        del st.session_state["job"]
 
 
 def main():
@@ -65,6 +219,14 @@ def main():
             "Number of replicas", value=5, step=1, min_value=1, max_value=300
         )
 
+        ladder = st.selectbox(
+            "Temperature ladder",
+            tuple(TEMPERATURE_LADDERS),
+            format_func=str.capitalize,
+            help="The adaptive ladder retunes the temperatures during the run, "
+            "to keep the replica exchanges accepted about a quarter of the time.",
+        )
+
         prob_pull_moves = st.number_input(
             "Probability to use pull moves",
             value=0.0,
@@ -73,6 +235,36 @@ def main():
             max_value=1.0,
         )
 
+        nb_workers = st.number_input(
+            "Number of worker processes",
+            value=1,
+            step=1,
+            min_value=1,
+            max_value=os.cpu_count() or 1,
+        )
+
+        asynchronous = st.checkbox("Asynchronous replica exchange", value=False)
+
+        time_budget = st.number_input(
+            "Time budget in seconds (0 for none)",
+            value=0.0,
+            step=10.0,
+            min_value=0.0,
+            max_value=86400.0,
+        )
+
+        patience = st.number_input(
+            "Iterations without improvement before stopping (0 for none)",
+            value=0,
+            step=10,
+            min_value=0,
+            max_value=1000000,
+        )
+
+        seed = st.number_input(
+            "Random seed", value=0, step=1, min_value=0, max_value=2**32 - 1
+        )
+
     st.title("Replica Exchange Monte Carlo (REMC) for the AB Initio problem")
     st.divider()
 
@@ -156,59 +348,25 @@ def main():
                         (lattice_dims[0], lattice_dims[1], lattice_dims[2])
                     )
 
-                conf_manager = ConformationManager(proteins[chosen_idx - 1])
-
-                try:
-                    initial_conformation = conf_manager.create_initial_conformation(
-                        lattice.dimensions
-                    )
-
-                    st.write(
-                        "Theoretical protein energy : ", proteins[chosen_idx - 1].e_star
-                    )
-                    st.write(
-                        "Initial Conformation energy: ",
-                        initial_conformation.compute_energy(),
-                    )
-
-                    MC = REMC(
-                        int(search_steps),
-                        int(nb_replicas),
-                        int(min_temp),
-                        int(max_temp),
-                        conf_manager,
-                        max_iter=int(max_iterations),
-                        rho=prob_pull_moves,
-                    )
-
-                    optimal_conformation = copy.deepcopy(initial_conformation)
-                    with st.spinner(
-                        text="Running REMC, this may take a moment depending on the parameters..."
-                    ):
-                        optimal_conformation = MC.optimize(
-                            initial_conformation, initial_conformation.protein.e_star
-                        )
-
-                    st.write(
-                        "Optimal energy found by REMC: ",
-                        optimal_conformation.compute_energy(),
-                    )
-
-                    if dims == 2:
-                        drawer = ConformationDrawer2D(
-                            optimal_conformation, {"H": 0, "P": 1}
-                        )
-                        st.plotly_chart(drawer.draw())
-                    else:
-                        drawer = ConformationDrawer3D(
-                            optimal_conformation, {"H": "black", "P": "red"}
-                        )
-                        st.plotly_chart(drawer.draw())
-
-                except Exception as e:
-                    st.error(e)
-                    print(e)
-                    st.stop()
+                submit_job(
+                    proteins[chosen_idx - 1],
+                    lattice.dimensions,
+                    {
+                        "phi": int(search_steps),
+                        "khi": int(nb_replicas),
+                        "tmin": int(min_temp),
+                        "tmax": int(max_temp),
+                        "max_iter": int(max_iterations),
+                        "rho": prob_pull_moves,
+                        "nb_workers": int(nb_workers),
+                        "asynchronous": asynchronous,
+                        "ladder": ladder,
+                        "time_budget": float(time_budget),
+                        "patience": int(patience),
+                        "seed": int(seed),
+                    },
+                    {"H": 0, "P": 1} if dims == 2 else {"H": "black", "P": "red"},
+                )
 
     elif option == "Custom one":
         custom_sequence = st.text_input(
@@ -308,64 +466,35 @@ def main():
                         (lattice_dims[0], lattice_dims[1], lattice_dims[2])
                     )
 
-                conf_manager = ConformationManager(prot)
-
-                try:
-                    initial_conformation = conf_manager.create_initial_conformation(
-                        lattice.dimensions
-                    )
-
-                    st.write(
-                        "Theoretical protein energy : ",
-                        initial_conformation.protein.e_star,
-                    )
-                    st.write(
-                        "Initial Conformation energy: ",
-                        initial_conformation.compute_energy(),
-                    )
-
-                    MC = REMC(
-                        int(search_steps),
-                        int(nb_replicas),
-                        int(min_temp),
-                        int(max_temp),
-                        conf_manager,
-                        max_iter=int(max_iterations),
-                        rho=prob_pull_moves,
-                    )
-
-                    optimal_conformation = copy.deepcopy(initial_conformation)
-                    with st.spinner(
-                        text="Running REMC, this may take a moment depending on the parameters..."
-                    ):
-                        optimal_conformation = MC.optimize(
-                            initial_conformation, initial_conformation.protein.e_star
-                        )
-
-                    st.write(
-                        "Optimal energy found by REMC: ",
-                        optimal_conformation.compute_energy(),
-                    )
-
-                    if dimensions == "2D":
-                        drawer = ConformationDrawer2D(
-                            optimal_conformation, {"H": 1, "P": 0}
-                        )
-                        st.plotly_chart(drawer.draw())
-                    else:
-                        drawer = ConformationDrawer3D(
-                            optimal_conformation, {"H": "black", "P": "red"}
-                        )
-                        st.plotly_chart(drawer.draw())
-
-                except Exception as e:
-                    st.error(e)
-                    print(e)
-                    st.stop()
+                submit_job(
+                    prot,
+                    lattice.dimensions,
+                    {
+                        "phi": int(search_steps),
+                        "khi": int(nb_replicas),
+                        "tmin": int(min_temp),
+                        "tmax": int(max_temp),
+                        "max_iter": int(max_iterations),
+                        "rho": prob_pull_moves,
+                        "nb_workers": int(nb_workers),
+                        "asynchronous": asynchronous,
+                        "ladder": ladder,
+                        "time_budget": float(time_budget),
+                        "patience": int(patience),
+                        "seed": int(seed),
+                    },
+                    (
+                        {"H": 1, "P": 0}
+                        if dimensions == "2D"
+                        else {"H": "black", "P": "red"}
+                    ),
+                )
 
     else:
         pass
 
+    show_job()
+
 
 if __name__ == "__main__":
     main()
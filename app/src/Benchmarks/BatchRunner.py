@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from ..Controllers.ConformationManager import ConformationManager
+from ..DataHandlers.JSONProteinIO import JSONProteinIO
+from ..Models.ProteinHP import ProteinHP
+from ..Models.ProteinModel import ProteinModel
+from ..Models.RandomStream import RandomStream
+from ..Optimizers.REMC import REMC, TEMPERATURE_LADDERS
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+
+
+def _run_job(
+    protein: ProteinHP, seed: int, hyperparameters: dict[str, object]
+) -> dict[str, object]:
+    """Runs REMC once on a protein.
+
+    Parameters
+    ----------
+    protein : ProteinHP
+        Protein to be folded.
+    seed : int
+        Seed of the random streams of the run.
+    hyperparameters : dict[str, object]
+        Hyperparameters of REMC (phi, khi, tmin, tmax, rho, max_iter), name of its temperature
+        ladder (see TEMPERATURE_LADDERS, geometric by default) and optional budgets of the run
+        (max_steps, time_budget, patience).
+
+    Returns
+    -------
+    dict[str, object]
+        Result of the run.
+    """
+    # Independent streams for the initial conformation and for REMC
+    conformation_seed, remc_seed = np.random.SeedSequence(seed).spawn(2)
+
+    # The lattice is large enough for any conformation of the chain
+    side = 2 * len(protein.sequence)
+    lattice_dims = (side,) * protein.recommended_dimension
+
+    start = time.perf_counter()
+    conf_manager = ConformationManager(protein)
+    initial_conformation = conf_manager.create_initial_conformation(
+        lattice_dims, RandomStream(conformation_seed)
+    )
+    remc = REMC(
+        int(hyperparameters["phi"]),
+        int(hyperparameters["khi"]),
+        int(hyperparameters["tmin"]),
+        int(hyperparameters["tmax"]),
+        conf_manager,
+        max_iter=int(hyperparameters["max_iter"]),
+        rho=hyperparameters["rho"],
+        seed=remc_seed,
+        temperature_ladder=TEMPERATURE_LADDERS[
+            hyperparameters.get("ladder", "geometric")
+        ](),
+        max_steps=hyperparameters.get("max_steps"),
+        time_budget=hyperparameters.get("time_budget"),
+        patience=hyperparameters.get("patience"),
+    )
+    optimal_conformation = remc.optimize(initial_conformation, protein.e_star)
+    wall_time = time.perf_counter() - start
+
+    best_energy = optimal_conformation.computed_energy
+    return {
+        "protein": protein.name,
+        "dimension": protein.recommended_dimension,
+        "length": len(protein.sequence),
+        "seed": seed,
+        "e_star": protein.e_star,
+        "best_energy": best_energy,
+        "reached_e_star": best_energy <= protein.e_star,
+        "wall_time": wall_time,
+        "mc_steps": remc.nb_steps,
+        "termination_reason": str(remc.termination_reason),
+    }
+
+
+class BatchRunner:
+    """Class that runs REMC many times on a set of proteins to measure its run-length distributions."""
+
+    _proteins: list[ProteinHP]  # Proteins to be folded
+    _nb_runs: int  # Number of runs per protein
+    _nb_processes: Optional[
+        int
+    ]  # Number of processes running the jobs (None: one per core)
+    _seed: int  # Seed of the first run, the following runs use the next seeds
+    _hyperparameters: dict[str, float]  # Hyperparameters of REMC
+
+    def __init__(
+        self,
+        proteins: list[ProteinHP],
+        nb_runs: int,
+        hyperparameters: dict[str, float],
+        nb_processes: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        """Constructor for the BatchRunner class.
+
+        Parameters
+        ----------
+        proteins : list[ProteinHP]
+            Proteins to be folded.
+        nb_runs : int
+            Number of runs per protein.
+        hyperparameters : dict[str, float]
+            Hyperparameters of REMC (phi, khi, tmin, tmax, rho, max_iter).
+        nb_processes : Optional[int], optional
+            Number of processes running the jobs, by default None (one per core).
+        seed : int, optional
+            Seed of the first run, by default 0. The following runs use the next seeds.
+        """
+        if nb_runs < 1:
+            raise ValueError("The number of runs must be at least 1.")
+
+        self._proteins = proteins
+        self._nb_runs = nb_runs
+        self._hyperparameters = hyperparameters
+        self._nb_processes = nb_processes
+        self._seed = seed
+
+    def run(self) -> dict[str, object]:
+        """Runs all the (protein, seed) jobs on a pool of processes.
+
+        Returns
+        -------
+        dict[str, object]
+            Report of the batch: its parameters, the result of each run, and for each protein
+            the run-length distribution of the successful runs.
+        """
+        jobs = [
+            (protein, self._seed + i * self._nb_runs + run)
+            for i, protein in enumerate(self._proteins)
+            for run in range(self._nb_runs)
+        ]
+
+        with ProcessPoolExecutor(max_workers=self._nb_processes) as executor:
+            futures = [
+                executor.submit(_run_job, protein, seed, self._hyperparameters)
+                for protein, seed in jobs
+            ]
+            runs = [future.result() for future in futures]
+
+        return {
+            "parameters": {
+                "nb_runs": self._nb_runs,
+                "seed": self._seed,
+                **self._hyperparameters,
+            },
+            "runs": runs,
+            "summary": self._summarize(runs),
+        }
+
+    def _summarize(self, runs: list[dict[str, object]]) -> dict[str, dict[str, object]]:
+        """Computes the run-length distribution of each protein.
+
+        Parameters
+        ----------
+        runs : list[dict[str, object]]
+            Results of the runs.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+            For each protein, its success rate, the sorted wall times and MC steps of the runs that
+            reached E* and their medians.
+        """
+        summary = {}
+        for protein in self._proteins:
+            protein_runs = [run for run in runs if run["protein"] == protein.name]
+            successes = [run for run in protein_runs if run["reached_e_star"]]
+            wall_times = sorted(run["wall_time"] for run in successes)
+            mc_steps = sorted(run["mc_steps"] for run in successes)
+            summary[protein.name] = {
+                "e_star": protein.e_star,
+                "best_energy": min(run["best_energy"] for run in protein_runs),
+                "success_rate": len(successes) / len(protein_runs),
+                "wall_times": wall_times,
+                "mc_steps": mc_steps,
+                "median_wall_time": (
+                    statistics.median(wall_times) if wall_times else None
+                ),
+                "median_mc_steps": statistics.median(mc_steps) if mc_steps else None,
+            }
+        return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs REMC many times on a set of proteins and reports its run-length distributions."
+    )
+    parser.add_argument(
+        "--proteins",
+        default=os.path.join(DATA_PATH, "proteins.json"),
+        help="JSON file of the proteins.",
+    )
+    parser.add_argument(
+        "--names",
+        nargs="*",
+        help="Names of the proteins to run, by default all of them.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="Number of runs per protein."
+    )
+    parser.add_argument(
+        "--processes", type=int, help="Number of processes, by default one per core."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first run.")
+    parser.add_argument("--phi", type=int, default=500, help="Number of search steps.")
+    parser.add_argument("--khi", type=int, default=5, help="Number of replicas.")
+    parser.add_argument("--tmin", type=int, default=160, help="Minimum temperature.")
+    parser.add_argument("--tmax", type=int, default=220, help="Maximum temperature.")
+    parser.add_argument(
+        "--rho", type=float, default=0.5, help="Probability to use pull moves."
+    )
+    parser.add_argument(
+        "--max-iter", type=int, default=1000, help="Maximum number of iterations."
+    )
+    parser.add_argument(
+        "--max-steps", type=int, help="Maximum number of Monte Carlo steps of a run."
+    )
+    parser.add_argument(
+        "--time-budget", type=float, help="Maximum duration of a run, in seconds."
+    )
+    parser.add_argument(
+        "--patience",
+        type=int,
+        help="Maximum number of iterations of a run without improvement.",
+    )
+    parser.add_argument(
+        "--ladder",
+        choices=sorted(TEMPERATURE_LADDERS),
+        default="geometric",
+        help="Strategy placing the temperatures of the replicas.",
+    )
+    parser.add_argument(
+        "--output", default="batch_report.json", help="File of the JSON report."
+    )
+    args = parser.parse_args()
+
+    proteins = JSONProteinIO(args.proteins).load_proteins(
+        ProteinModel.HYDROPHOBIC_POLAR
+    )
+    if args.names:
+        proteins = [protein for protein in proteins if protein.name in args.names]
+
+    runner = BatchRunner(
+        proteins,
+        args.runs,
+        {
+            "phi": args.phi,
+            "khi": args.khi,
+            "tmin": args.tmin,
+            "tmax": args.tmax,
+            "rho": args.rho,
+            "max_iter": args.max_iter,
+            "ladder": args.ladder,
+            "max_steps": args.max_steps,
+            "time_budget": args.time_budget,
+            "patience": args.patience,
+        },
+        nb_processes=args.processes,
+        seed=args.seed,
+    )
+
+    report = runner.run()
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
@@ -0,0 +1,293 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+from ..Controllers.ConformationManager import ConformationManager
+from ..Models.AminoAcidHP import AminoAcidHP
+from ..Models.Conformation import Conformation
+from ..Models.Polarity import Polarity
+from ..Models.ProteinHP import ProteinHP
+from ..Models.RandomStream import RandomStream
+from ..Optimizers.SimpleMonteCarlo import SimpleMonteCarlo
+
+CHAIN_LENGTHS = (20, 50, 100)  # Default lengths of the benchmarked chains
+# Default sides of the lattices, as multiples of the chain length
+LATTICE_FACTORS = (1, 2)
+
+
+def _make_protein(length: int, dimension: int, rng: RandomStream) -> ProteinHP:
+    """Creates a random HP protein.
+
+    Parameters
+    ----------
+    length : int
+        Number of residues of the protein.
+    dimension : int
+        Dimension of the lattice of the protein.
+    rng : RandomStream
+        Random stream drawing the polarities of the residues.
+
+    Returns
+    -------
+    ProteinHP
+        Random protein.
+    """
+    sequence = [
+        AminoAcidHP(i, "", "", rng.choice((Polarity.HYDROPHOBIC, Polarity.POLAR)))
+        for i in range(length)
+    ]
+    return ProteinHP(f"Random-{length}", sequence, 0, dimension)
+
+
+def _time(function: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Times a function.
+
+    Parameters
+    ----------
+    function : Callable[[], object]
+        Function to be timed.
+    repeat : int
+        Number of measures, each of them calling the function enough times to last 0.2 second.
+
+    Returns
+    -------
+    dict[str, float]
+        Number of calls of a measure, and best and mean time of a call in seconds.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"number": number, "best": min(times), "mean": sum(times) / len(times)}
+
+
+def _compute_end_and_corner_moves(
+    conformation: Conformation, kind: str
+) -> list[Tuple[int, ...]]:
+    """Computes the end or corner moves of all the residues that allow them.
+
+    Parameters
+    ----------
+    conformation : Conformation
+        Conformation whose moves are computed.
+    kind : str
+        "end" or "corner".
+
+    Returns
+    -------
+    list[Tuple[int, ...]]
+        New possible positions of the residues.
+    """
+    last_index = len(conformation.protein.sequence) - 1
+    indices = (0, last_index) if kind == "end" else range(1, last_index)
+    compute_moves = (
+        conformation.lattice.compute_residue_end_moves
+        if kind == "end"
+        else conformation.lattice.compute_residue_corner_moves
+    )
+
+    positions = []
+    for index in indices:
+        positions.extend(compute_moves(index, conformation.positions))
+    return positions
+
+
+def run_benchmarks(
+    lengths: Tuple[int, ...] = CHAIN_LENGTHS,
+    lattice_factors: Tuple[int, ...] = LATTICE_FACTORS,
+    dimensions: Tuple[int, ...] = (2, 3),
+    repeat: int = 5,
+    phi: int = 100,
+    seed: int = 0,
+) -> dict[str, object]:
+    """Times the hot paths of the folding code on random proteins.
+
+    Parameters
+    ----------
+    lengths : Tuple[int, ...], optional
+        Lengths of the benchmarked chains, by default CHAIN_LENGTHS
+    lattice_factors : Tuple[int, ...], optional
+        Sides of the lattices as multiples of the chain length, by default LATTICE_FACTORS
+    dimensions : Tuple[int, ...], optional
+        Dimensions of the lattices, by default (2, 3)
+    repeat : int, optional
+        Number of measures of each benchmark, by default 5
+    phi : int, optional
+        Number of search steps of the benchmarked Monte Carlo sweep, by default 100
+    seed : int, optional
+        Seed of the random proteins and conformations, by default 0
+
+    Returns
+    -------
+    dict[str, object]
+        Description of the environment and timing of each benchmark, in seconds per call.
+    """
+    results = []
+    for dimension in dimensions:
+        for length in lengths:
+            for factor in lattice_factors:
+                protein = _make_protein(length, dimension, RandomStream(seed))
+                lattice_dims = (factor * length,) * dimension
+                conf_manager = ConformationManager(protein)
+                conformation = conf_manager.create_initial_conformation(
+                    lattice_dims, RandomStream(seed)
+                )
+                conformation.compute_energy()
+                monte_carlo = SimpleMonteCarlo(phi, seed=seed)
+
+                def sweep() -> None:
+                    # Each sweep starts from the same conformation
+                    monte_carlo.optimize(conformation.copy(), 160, conf_manager)
+
+                benchmarks = {
+                    "compute_energy": conformation.compute_energy,
+                    "is_valid": conformation.is_valid,
+                    "compute_vhsd_neighbourhood": partial(
+                        conf_manager.compute_vhsd_neighbourhood, conformation
+                    ),
+                    "create_initial_conformation": partial(
+                        conf_manager.create_initial_conformation,
+                        lattice_dims,
+                        RandomStream(seed),
+                    ),
+                    "compute_end_moves": partial(
+                        _compute_end_and_corner_moves, conformation, "end"
+                    ),
+                    "compute_corner_moves": partial(
+                        _compute_end_and_corner_moves, conformation, "corner"
+                    ),
+                    "monte_carlo_sweep": sweep,
+                }
+
+                for name, function in benchmarks.items():
+                    results.append(
+                        {
+                            "name": name,
+                            "dimension": dimension,
+                            "length": length,
+                            "lattice": list(lattice_dims),
+                            **_time(function, repeat),
+                        }
+                    )
+
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "phi": phi,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare_benchmarks(
+    previous: dict[str, object], current: dict[str, object], threshold: float = 1.2
+) -> list[dict[str, object]]:
+    """Compares two benchmark reports to find the regressions.
+
+    Parameters
+    ----------
+    previous : dict[str, object]
+        Reference report (see run_benchmarks).
+    current : dict[str, object]
+        New report.
+    threshold : float, optional
+        Ratio of the best times above which a benchmark is regressed, by default 1.2
+
+    Returns
+    -------
+    list[dict[str, object]]
+        Benchmarks of the new report that are slower than in the reference one, with the ratio
+        of their best times.
+    """
+
+    def key(result: dict[str, object]) -> Tuple[object, ...]:
+        return (
+            result["name"],
+            result["dimension"],
+            result["length"],
+            tuple(result["lattice"]),
+        )
+
+    reference = {key(result): result for result in previous["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = reference.get(key(result))
+        if old is not None and result["best"] > threshold * old["best"]:
+            regressions.append({**result, "ratio": result["best"] / old["best"]})
+    return regressions
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    """Runs the benchmarks from the command line.
+
+    Parameters
+    ----------
+    arguments : Optional[list[str]], optional
+        Command line arguments, by default None (those of the process).
+
+    Returns
+    -------
+    int
+        Exit code: 1 if regressions were found against the reference report, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description="Times the hot paths of the folding code and reports them in JSON."
+    )
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=CHAIN_LENGTHS, help="Chain lengths."
+    )
+    parser.add_argument(
+        "--lattice-factors",
+        type=int,
+        nargs="+",
+        default=LATTICE_FACTORS,
+        help="Sides of the lattices, as multiples of the chain length.",
+    )
+    parser.add_argument(
+        "--dimensions", type=int, nargs="+", default=(2, 3), help="Lattice dimensions."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Measures per benchmark.")
+    parser.add_argument("--phi", type=int, default=100, help="Steps of the MC sweep.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the proteins.")
+    parser.add_argument(
+        "--output", default="benchmarks.json", help="File of the JSON report."
+    )
+    parser.add_argument("--compare", help="Reference JSON report to check against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Slowdown ratio above which a benchmark is reported as a regression.",
+    )
+    args = parser.parse_args(arguments)
+
+    report = run_benchmarks(
+        tuple(args.lengths),
+        tuple(args.lattice_factors),
+        tuple(args.dimensions),
+        args.repeat,
+        args.phi,
+        args.seed,
+    )
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare, "r") as file:
+        previous = json.load(file)
+    regressions = compare_benchmarks(previous, report, args.threshold)
+    for regression in regressions:
+        print(
+            f"{regression['name']} ({regression['dimension']}D, n={regression['length']}, "
+            f"lattice={regression['lattice']}) : x{regression['ratio']:.2f}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
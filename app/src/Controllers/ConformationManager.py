@@ -1,6 +1,5 @@
-import copy
-import random
-from typing import Tuple
+from collections import deque
+from typing import Callable, Optional, Tuple
 
 from ..Models.Conformation import Conformation
 from ..Models.Conformation2D import Conformation2D
@@ -9,7 +8,10 @@ from ..Models.Coordinates2D import Coordinates2D
 from ..Models.Coordinates3D import Coordinates3D
 from ..Models.Lattice2D import Lattice2D
 from ..Models.Lattice3D import Lattice3D
+from ..Models.Move import Move
+from ..Models.MoveType import MoveType
 from ..Models.ProteinHP import ProteinHP
+from ..Models.RandomStream import RandomStream
 
 
 class ConformationManager:
@@ -17,18 +19,28 @@ class ConformationManager:
 
     _protein: ProteinHP  # Protein of the conformations
 
-    _conformations: list[Conformation]  # Conformations of the protein
+    _conformations: deque[
+        Tuple[Tuple[int, ...], bytes]
+    ]  # History of the conformations of the protein (lattice dimensions, encoded positions)
+    _rng: RandomStream  # Random stream used when none is given
 
-    def __init__(self, protein: ProteinHP) -> None:
+    def __init__(self, protein: ProteinHP, history_size: int = 0) -> None:
         """Constructor for the ConformationManager class.
 
         Parameters
         ----------
         protein : ProteinHP
             Protein of the conformations.
+        history_size : int, optional
+            Number of generated conformations kept in the history, by default 0 (no history).
+            Once full, the oldest conformations are dropped.
         """
+        if history_size < 0:
+            raise ValueError("The history size must be positive.")
+
         self._protein = protein
-        self._conformations = []
+        self._conformations = deque(maxlen=history_size)
+        self._rng = RandomStream()
 
     @property
     def protein(self) -> ProteinHP:
@@ -52,16 +64,47 @@ class ConformationManager:
         """
         self._protein = protein
 
+    @property
+    def history_size(self) -> int:
+        """Getter for the attribute history_size of the ConformationManager.
+
+        Returns
+        -------
+        int
+            Number of generated conformations kept in the history (0 if the history is disabled).
+        """
+        return self._conformations.maxlen
+
+    @history_size.setter
+    def history_size(self, history_size: int) -> None:
+        """Setter for the attribute history_size of the ConformationManager.
+
+        Parameters
+        ----------
+        history_size : int
+            Number of generated conformations kept in the history to be assigned (0 disables it).
+        """
+        if history_size < 0:
+            raise ValueError("The history size must be positive.")
+        self._conformations = deque(self._conformations, maxlen=history_size)
+
     @property
     def conformations(self) -> list[Conformation]:
         """Getter for the attribute conformations of the ConformationManager.
 
+        The history is stored in compact form, the conformations are rebuilt on each access.
+
         Returns
         -------
         list[Conformation]
-            Conformations of the protein.
+            Conformations of the protein kept in the history, from the oldest to the newest.
         """
-        return self._conformations
+        return [
+            Conformation2D.decode(self._protein, Lattice2D(dims), data)
+            if len(dims) == 2
+            else Conformation3D.decode(self._protein, Lattice3D(dims), data)
+            for dims, data in self._conformations
+        ]
 
     @conformations.setter
     def conformations(self, conformations: list[Conformation]) -> None:
@@ -70,17 +113,37 @@ class ConformationManager:
         Parameters
         ----------
         conformations : list[Conformation]
-            Conformations of the protein to be assigned.
+            Conformations of the protein to be assigned. Only the newest ones are kept if they
+            exceed the size of the history.
         """
-        self._conformations = conformations
+        self._conformations.clear()
+        for conformation in conformations:
+            self._record_conformation(conformation)
 
-    def create_initial_conformation(self, lattice_dims=Tuple[int, ...]) -> Conformation:
+    def _record_conformation(self, conformation: Conformation) -> None:
+        """Adds a conformation to the history if it is enabled.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            Conformation to be recorded.
+        """
+        if self._conformations.maxlen:
+            self._conformations.append(
+                (tuple(conformation.lattice.dimensions), conformation.encode())
+            )
+
+    def create_initial_conformation(
+        self, lattice_dims=Tuple[int, ...], rng: Optional[RandomStream] = None
+    ) -> Conformation:
         """Creates the initial conformation of the protein and adds it to the list of conformations.
 
         Parameters
         ----------
         lattice_dims : Tuple[int, ...]
             Dimensions of the lattice.
+        rng : Optional[RandomStream], optional
+            Random stream placing the residues, by default None (the stream of the manager).
 
         Returns
         -------
@@ -93,6 +156,8 @@ class ConformationManager:
             lattice = Lattice3D(lattice_dims)
         else:
             raise ValueError("The lattice dimensions must be 2 or 3.")
+        if rng is None:
+            rng = self._rng
 
         i = 0
         search_valid_conformation = True
@@ -105,7 +170,7 @@ class ConformationManager:
                     pos = []
                     # We sample a random position for the first amino acid
                     for axe in range(len(lattice_dims)):
-                        pos.append(random.randint(0, lattice_dims[axe] - 1))
+                        pos.append(rng.randrange(lattice_dims[axe]))
                     dict_coords[tuple(pos)] = amino_acid
 
                     if len(lattice_dims) == 2:
@@ -127,7 +192,7 @@ class ConformationManager:
                     # We choose an adjacent position for the next amino acid that is not occupied
                     try:
                         position = lattice.get_random_adjacent_cell(
-                            last_amino_coords, list(dict_coords.keys())
+                            last_amino_coords, list(dict_coords.keys()), rng
                         )
 
                         dict_coords[position] = amino_acid
@@ -161,7 +226,7 @@ class ConformationManager:
 
                 if conformation.is_valid():
                     search_valid_conformation = False
-                    self._conformations.append(conformation)
+                    self._record_conformation(conformation)
                     return conformation
                 else:
                     dict_coords = {}
@@ -175,11 +240,251 @@ class ConformationManager:
                 last_amino_coords = None
                 lattice.reset_lattice()
 
+    def compute_residue_moves(
+        self, conformation: Conformation, index: int
+    ) -> list[Move]:
+        """Computes the VHSd moves (end, corner and crankshaft) of a single residue.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        index : int
+            Index of the residue in the sequence.
+
+        Returns
+        -------
+        list[Move]
+            Possible moves of the residue.
+        """
+        last_index = len(conformation.protein.sequence) - 1
+        coord = conformation.get_position(index)
+
+        # End moves are made on the first and last amino acids of the protein
+        if index in (0, last_index):
+            move_type = MoveType.END
+            new_positions = conformation.lattice.compute_residue_end_moves(
+                index, conformation.positions
+            )
+        # Corner moves are made on the rest of the residues
+        else:
+            move_type = MoveType.CORNER
+            new_positions = conformation.lattice.compute_residue_corner_moves(
+                index, conformation.positions
+            )
+
+        moves = [
+            Move(move_type, (index,), (coord,), (new_pos,)) for new_pos in new_positions
+        ]
+
+        # Crankshaft moves rotate the residue together with the next one
+        for crankshaft in conformation.lattice.compute_crankshaft_moves(
+            index, conformation.positions
+        ):
+            moves.append(
+                Move(
+                    MoveType.CRANKSHAFT,
+                    (index, index + 1),
+                    (coord, conformation.get_position(index + 1)),
+                    (crankshaft[index], crankshaft[index + 1]),
+                )
+            )
+
+        return moves
+
+    def compute_residue_pull_moves(
+        self, conformation: Conformation, index: int
+    ) -> list[Move]:
+        """Computes the pull moves of a single residue of a conformation.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        index : int
+            Index of the residue in the sequence.
+
+        Returns
+        -------
+        list[Move]
+            Possible pull moves of the residue.
+        """
+        return [
+            self._make_pull_move(conformation, index, pull)
+            for pull in self._compute_residue_pulls(conformation, index)
+        ]
+
+    def _compute_residue_pulls(
+        self, conformation: Conformation, index: int
+    ) -> list[dict[int, Tuple[int, ...]]]:
+        """Computes the pull moves of a single residue, without the chain pulled behind it.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        index : int
+            Index of the residue in the sequence.
+
+        Returns
+        -------
+        list[dict[int, Tuple[int, ...]]]
+            Possible pull moves of the residue, as returned by the compute_pull_moves of the lattice.
+        """
+        return conformation.lattice.compute_pull_moves(index, conformation.positions)
+
+    def _keep_move(self, conformation: Conformation, index: int, move: Move) -> Move:
+        """Returns a VHSd move unchanged, as it is already complete.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        index : int
+            Index of the moved residue in the sequence.
+        move : Move
+            The move.
+
+        Returns
+        -------
+        Move
+            The same move.
+        """
+        return move
+
+    def _make_pull_move(
+        self, conformation: Conformation, index: int, pull: dict[int, Tuple[int, ...]]
+    ) -> Move:
+        """Builds the move of a pull, with the rest of the chain pulled behind the residue.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        index : int
+            Index of the pulled residue in the sequence.
+        pull : dict[int, Tuple[int, ...]]
+            Pull move of the residue, as returned by the compute_pull_moves of the lattice.
+
+        Returns
+        -------
+        Move
+            The pull move.
+        """
+        moved = conformation.lattice.pull_chain(index, conformation.positions, pull)
+        indices = tuple(moved.keys())
+        return Move(
+            MoveType.PULL,
+            indices,
+            tuple(conformation.get_position(i) for i in indices),
+            tuple(moved.values()),
+        )
+
+    def propose_move(
+        self,
+        conformation: Conformation,
+        rho: float = 0.0,
+        record_neighbourhood: Optional[Callable[[int], None]] = None,
+        rng: Optional[RandomStream] = None,
+    ) -> Optional[Move]:
+        """Samples a single move uniformly from the neighbourhood of a conformation.
+
+        The neighbourhood is the VHSd neighbourhood, or the pull moves neighbourhood with probability
+        rho. It is not materialised: a residue and a move slot are drawn and the draw is rejected
+        when the residue has no move in that slot. Every move of the neighbourhood is thus proposed
+        with the same probability, as when choosing among the whole neighbourhood.
+
+        After as many rejected draws as there are residues (a nearly frozen conformation, whose
+        residues have few moves), the neighbourhood is enumerated residue by residue and a move is
+        chosen uniformly among all of them. A move is thus proposed whenever the conformation has
+        one, at the cost of a full enumeration.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved.
+        rho : float, optional
+            Probability to use pull moves, by default 0.0
+        record_neighbourhood : Optional[Callable[[int], None]], optional
+            Called with the size of each residue neighbourhood computed (e.g. to update the
+            statistics of the replica), by default None
+        rng : Optional[RandomStream], optional
+            Random stream of the replica, by default None (the stream of the manager).
+
+        Returns
+        -------
+        Optional[Move]
+            The proposed move, None if the conformation has no neighbour.
+        """
+        if rng is None:
+            rng = self._rng
+        dim = len(conformation.lattice.dimensions)
+        if rho > 0 and rng.random() < rho:
+            # The chain pulled behind a residue is only built for the drawn move
+            compute_moves = self._compute_residue_pulls
+            make_move = self._make_pull_move
+            # A chain end has at most (2d - 1)^2 end pulls and 2d - 2 pulls towards its neighbour
+            max_moves = (2 * dim - 1) ** 2 + 2 * dim - 2
+        else:
+            compute_moves = self.compute_residue_moves
+            make_move = self._keep_move
+            # Each move sends the residue to a different free cell next to its neighbour in the
+            # chain (its predecessor, or the second residue for the first one), and there are at
+            # most 2d - 1 such cells besides the one of the residue
+            max_moves = 2 * dim - 1
+
+        nb_residues = len(conformation.protein.sequence)
+        for _ in range(nb_residues):
+            index = rng.randrange(nb_residues)
+            slot = rng.randrange(max_moves)
+            moves = compute_moves(conformation, index)
+            if record_neighbourhood is not None:
+                record_neighbourhood(len(moves))
+            if slot < len(moves):
+                return make_move(conformation, index, moves[slot])
+
+        # Too many rejections (nearly frozen conformation): we enumerate the moves instead
+        moves = []
+        for index in range(nb_residues):
+            residue_moves = compute_moves(conformation, index)
+            if record_neighbourhood is not None:
+                record_neighbourhood(len(residue_moves))
+            moves.extend((index, move) for move in residue_moves)
+
+        if len(moves) == 0:
+            return None
+        index, move = rng.choice(moves)
+        return make_move(conformation, index, move)
+
+    def create_moved_conformation(
+        self, conformation: Conformation, move: Move
+    ) -> Conformation:
+        """Creates the conformation obtained by applying a move to a conformation.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            The conformation to be moved. It is left unchanged.
+        move : Move
+            The move to apply.
+
+        Returns
+        -------
+        Conformation
+            The moved conformation.
+        """
+        new_conf = conformation.copy()
+        new_conf.apply_move(move)
+        return new_conf
+
     def compute_vhsd_neighbourhood(
         self, conformation: Conformation
     ) -> list[Conformation]:
         """Computes the VHSd neighbourhood of a conformation.
 
+        The computed energy of each neighbour is derived incrementally from the computed energy of
+        the conformation, which must therefore be up to date.
+
         Parameters
         ----------
         conformation : Conformation
@@ -190,116 +495,19 @@ class ConformationManager:
         List[Conformation]
             VHSd neighbourhood of the conformation.
         """
-        neighbourhood = []
-
-        dim = None
-        if len(conformation.lattice.dimensions) == 2:
-            dim = 2
-        elif len(conformation.lattice.dimensions) == 3:
-            dim = 3
-        else:
+        if len(conformation.lattice.dimensions) not in (2, 3):
             raise ValueError("The lattice dimensions must be 2 or 3.")
 
-        for coord in conformation.amino_acid_coordinates:
-            new_positions = []
-            # We first compute the possible end moves
-            # End moves are made on the first and last amino acids of the protein
-
-            if coord in [
-                conformation.get_amino_acid_coordinates(
-                    conformation.protein.sequence[0]
-                ).coordinates,
-                conformation.get_amino_acid_coordinates(
-                    conformation.protein.sequence[
-                        len(conformation.protein.sequence) - 1
-                    ]
-                ).coordinates,
-            ]:
-                try:
-                    if dim == 2:
-                        new_end_positions = conformation.lattice.compute_end_moves(
-                            Coordinates2D(coord),
-                            conformation.protein,
-                            conformation.amino_acid_coordinates,
-                        )
-                    else:
-                        new_end_positions = conformation.lattice.compute_end_moves(
-                            Coordinates3D(coord),
-                            conformation.protein,
-                            conformation.amino_acid_coordinates,
-                        )
-
-                    for pos in new_end_positions:
-                        new_positions.append(pos)
-                except Exception as e:
-                    # print(e)
-                    # print(
-                    #    f"No end moves possible for {coord} in {conformation.protein}"
-                    # )
-                    pass
-
-            # Then we compute corner moves when possible on the rest of the residues
-            if coord not in [
-                conformation.get_amino_acid_coordinates(
-                    conformation.protein.sequence[0]
-                ).coordinates,
-                conformation.get_amino_acid_coordinates(
-                    conformation.protein.sequence[
-                        len(conformation.protein.sequence) - 1
-                    ]
-                ).coordinates,
-            ]:
-                try:
-                    if dim == 2:
-                        new_corner_position = conformation.lattice.compute_corner_moves(
-                            Coordinates2D(coord),
-                            conformation.protein,
-                            conformation.amino_acid_coordinates,
-                        )
-                    else:
-                        new_corner_position = conformation.lattice.compute_corner_moves(
-                            Coordinates3D(coord),
-                            conformation.protein,
-                            conformation.amino_acid_coordinates,
-                        )
-                    for pos in new_corner_position:
-                        new_positions.append(pos)
-                except Exception as e:
-                    # print(e)
-                    # print(
-                    #    f"No corner moves possible for {coord} in {conformation.protein}"
-                    # )
-                    pass
-
-            if len(new_positions) > 0:
-                for new_pos in new_positions:
-                    new_lattice = copy.deepcopy(conformation.lattice)
-
-                    if dim == 2:
-                        new_lattice.set_cell_value(Coordinates2D(coord), False)
-                        new_lattice.set_cell_value(Coordinates2D(new_pos), True)
-                    else:
-                        new_lattice.set_cell_value(Coordinates3D(coord), False)
-                        new_lattice.set_cell_value(Coordinates3D(new_pos), True)
-
-                    dict_cells = copy.deepcopy(conformation.amino_acid_coordinates)
-                    dict_cells[new_pos] = dict_cells.pop(coord)
-
-                    new_conf = None
-
-                    if dim == 2:
-                        new_conf = Conformation2D(
-                            conformation.protein, new_lattice, dict_cells
-                        )
-                    else:
-                        new_conf = Conformation3D(
-                            conformation.protein, new_lattice, dict_cells
-                        )
-
-                    self._conformations.append(new_conf)
-                    neighbourhood.append(new_conf)
-            else:
-                # print(f"/!/ No moves possible for {coord} in {conformation.protein}")
-                pass
+        neighbourhood = []
+        for index in range(len(conformation.protein.sequence)):
+            for move in self.compute_residue_moves(conformation, index):
+                new_conf = self.create_moved_conformation(conformation, move)
+                new_conf.computed_energy = (
+                    conformation.computed_energy
+                    + conformation.compute_energy_delta(move.as_dict())
+                )
+
+                self._record_conformation(new_conf)
+                neighbourhood.append(new_conf)
 
         return neighbourhood
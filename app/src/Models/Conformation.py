@@ -1,9 +1,14 @@
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from .AminoAcidHP import AminoAcidHP
 from .Lattice import Lattice
+from .Move import Move
+from .Polarity import Polarity
 from .ProteinHP import ProteinHP
 from .TopoCoordinates import TopoCoordinates
 
@@ -14,9 +19,15 @@ class Conformation(ABC):
 
     _protein: ProteinHP  # Protein of the conformation
 
-    _amino_acid_coordinates: dict[
-        Tuple[int, ...], AminoAcidHP
-    ]  # Coordinates of the amino acids in the conformation
+    _positions: np.ndarray  # (n, d) array of coordinates, row i is the position of the i-th residue of the sequence
+
+    _position_index: dict[
+        Tuple[int, ...], int
+    ]  # Index of the residue occupying each coordinate of the conformation
+
+    _amino_acid_coordinates: Optional[
+        dict[Tuple[int, ...], AminoAcidHP]
+    ]  # Lazily-built view of the coordinates of the amino acids (None until requested)
 
     _lattice: Lattice  # Lattice of the conformation
 
@@ -44,15 +55,45 @@ class Conformation(ABC):
         """
         self._protein = protein
 
+    @property
+    def positions(self) -> np.ndarray:
+        """Getter for the attribute positions of the conformation.
+
+        Returns
+        -------
+        np.ndarray
+            (n, d) array of coordinates, row i is the position of the i-th residue of the sequence.
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: np.ndarray) -> None:
+        """Setter for the attribute positions of the conformation.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            (n, d) array of coordinates to be assigned, ordered as the sequence of the protein.
+        """
+        self._set_positions(positions)
+
     @property
     def amino_acid_coordinates(self) -> dict[Tuple[int, ...], AminoAcidHP]:
         """Getter for the attribute amino_acid_coordinates of the conformation.
 
+        The dictionary is only a compatibility view of the positions array: it is built on first access
+        and kept until the positions of the conformation change.
+
         Returns
         -------
         dict[Tuple[int, ...], AminoAcidHP]
             Coordinates of the amino acids in the conformation.
         """
+        if self._amino_acid_coordinates is None:
+            sequence = self._protein.sequence
+            self._amino_acid_coordinates = {
+                coords: sequence[index] for coords, index in self._position_index.items()
+            }
         return self._amino_acid_coordinates
 
     @amino_acid_coordinates.setter
@@ -66,7 +107,7 @@ class Conformation(ABC):
         amino_acid_coordinates : dict[Tuple[int, ...], AminoAcidHP]
             Coordinates of the amino acids in the conformation to be assigned.
         """
-        self._amino_acid_coordinates = amino_acid_coordinates
+        self._set_amino_acid_coordinates(amino_acid_coordinates)
 
     @property
     def lattice(self) -> Lattice:
@@ -112,6 +153,420 @@ class Conformation(ABC):
         """
         self._computed_energy = computed_energy
 
+    @classmethod
+    def from_positions(
+        cls, protein: ProteinHP, lattice: Lattice, positions: np.ndarray
+    ) -> "Conformation":
+        """Creates a conformation directly from an array of positions.
+
+        Parameters
+        ----------
+        protein : ProteinHP
+            Protein of the conformation.
+        lattice : Lattice
+            Lattice of the conformation. The cells of the positions are marked as occupied.
+        positions : np.ndarray
+            (n, d) array of coordinates, ordered as the sequence of the protein.
+
+        Returns
+        -------
+        Conformation
+            Conformation of the protein.
+        """
+        conformation = cls.__new__(cls)
+        conformation._protein = protein
+        conformation._lattice = lattice
+        conformation._computed_energy = 0
+        conformation._set_positions(positions)
+        return conformation
+
+    def encode(self) -> bytes:
+        """Encodes the positions of the conformation in a compact form.
+
+        Returns
+        -------
+        bytes
+            Positions of the residues, as 16-bit integers in the order of the sequence.
+        """
+        return self._positions.astype(np.int16).tobytes()
+
+    @classmethod
+    def decode(
+        cls, protein: ProteinHP, lattice: Lattice, data: bytes
+    ) -> "Conformation":
+        """Creates a conformation from its compact form (see encode).
+
+        Parameters
+        ----------
+        protein : ProteinHP
+            Protein of the conformation.
+        lattice : Lattice
+            Lattice of the conformation. The cells of the positions are marked as occupied.
+        data : bytes
+            Encoded positions of the residues.
+
+        Returns
+        -------
+        Conformation
+            Decoded conformation.
+        """
+        positions = np.frombuffer(data, dtype=np.int16).reshape(
+            len(protein.sequence), len(lattice.dimensions)
+        )
+        return cls.from_positions(protein, lattice, positions)
+
+    def copy(self) -> "Conformation":
+        """Copies the conformation.
+
+        The protein is shared with the copy, the positions and the lattice are copied.
+
+        Returns
+        -------
+        Conformation
+            Copy of the conformation.
+        """
+        conformation = type(self).__new__(type(self))
+        conformation._protein = self._protein
+        conformation._lattice = copy.deepcopy(self._lattice)
+        conformation._computed_energy = self._computed_energy
+        conformation._positions = self._positions.copy()
+        conformation._position_index = dict(self._position_index)
+        conformation._amino_acid_coordinates = None
+        return conformation
+
+    def apply_move(self, move: Move, energy_delta: Optional[int] = None) -> None:
+        """Applies a move to the conformation in place.
+
+        Parameters
+        ----------
+        move : Move
+            The move to apply.
+        energy_delta : Optional[int], optional
+            Energy change of the move (see compute_energy_delta), added to the computed energy
+            when given, by default None
+        """
+        self._relocate_residues(
+            move.residue_indices, move.old_positions, move.new_positions
+        )
+        if energy_delta is not None:
+            self._computed_energy += energy_delta
+
+    def undo_move(self, move: Move, energy_delta: Optional[int] = None) -> None:
+        """Reverts a move previously applied to the conformation.
+
+        Parameters
+        ----------
+        move : Move
+            The move to revert.
+        energy_delta : Optional[int], optional
+            Energy change that was given when the move was applied, by default None
+        """
+        self._relocate_residues(
+            move.residue_indices, move.new_positions, move.old_positions
+        )
+        if energy_delta is not None:
+            self._computed_energy -= energy_delta
+
+    def _relocate_residues(
+        self,
+        indices: Tuple[int, ...],
+        old_positions: Tuple[Tuple[int, ...], ...],
+        new_positions: Tuple[Tuple[int, ...], ...],
+    ) -> None:
+        """Moves residues to new coordinates, updating the positions, the lattice and the views.
+
+        Parameters
+        ----------
+        indices : Tuple[int, ...]
+            Indices of the moved residues in the sequence.
+        old_positions : Tuple[Tuple[int, ...], ...]
+            Current coordinates of the residues.
+        new_positions : Tuple[Tuple[int, ...], ...]
+            New coordinates of the residues.
+        """
+        # All the cells are freed first since a residue can take the old cell of another one
+        for coords in old_positions:
+            del self._position_index[coords]
+            self._lattice.set_cell_value(self._make_coordinates(coords), False)
+            if self._amino_acid_coordinates is not None:
+                del self._amino_acid_coordinates[coords]
+
+        for index, coords in zip(indices, new_positions):
+            self._positions[index] = coords
+            self._position_index[coords] = index
+            self._lattice.set_cell_value(self._make_coordinates(coords), True)
+            if self._amino_acid_coordinates is not None:
+                self._amino_acid_coordinates[coords] = self._protein.sequence[index]
+
+    def _set_amino_acid_coordinates(
+        self, amino_acid_coordinates: dict[Tuple[int, ...], AminoAcidHP]
+    ) -> None:
+        """Fills the positions array from a dictionary of coordinates.
+
+        Parameters
+        ----------
+        amino_acid_coordinates : dict[Tuple[int, ...], AminoAcidHP]
+            Coordinates of the amino acids in the conformation.
+        """
+        positions = np.zeros(
+            (len(self._protein.sequence), len(self._lattice.dimensions)), dtype=int
+        )
+        position_index = {}
+        for coords, amino_acid in amino_acid_coordinates.items():
+            index = self._protein.index_of(amino_acid)
+            positions[index] = coords
+            position_index[tuple(coords)] = index
+
+        # Residues missing from the dictionary are not registered in the coordinate hash
+        self._release_cells()
+        self._positions = positions
+        self._position_index = position_index
+        self._amino_acid_coordinates = None
+        for coords in position_index:
+            self._lattice.set_cell_value(self._make_coordinates(coords), True)
+
+    def _set_positions(self, positions: np.ndarray) -> None:
+        """Assigns the positions array and rebuilds the coordinate to index hash.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            (n, d) array of coordinates, ordered as the sequence of the protein.
+        """
+        self._release_cells()
+        self._positions = np.asarray(positions, dtype=int)
+        self._position_index = {
+            tuple(coords): i for i, coords in enumerate(self._positions.tolist())
+        }
+        self._amino_acid_coordinates = None
+        for coords in self._position_index:
+            self._lattice.set_cell_value(self._make_coordinates(coords), True)
+
+    def _release_cells(self) -> None:
+        """Frees the cells of the lattice occupied by the current positions, if any."""
+        try:
+            position_index = self._position_index
+        except AttributeError:
+            # The positions of a new conformation are being assigned for the first time
+            return
+        for coords in position_index:
+            self._lattice.occupied_cells.discard(coords)
+
+    def get_position(self, index: int) -> Tuple[int, ...]:
+        """Gets the coordinates of the residue at a given index of the sequence.
+
+        Parameters
+        ----------
+        index : int
+            Index of the residue in the sequence.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            Coordinates of the residue.
+        """
+        return tuple(self._positions[index].tolist())
+
+    def get_residue_index(self, coords: Tuple[int, ...]) -> Optional[int]:
+        """Gets the index of the residue occupying a given coordinate.
+
+        Parameters
+        ----------
+        coords : Tuple[int, ...]
+            Coordinates in the lattice.
+
+        Returns
+        -------
+        Optional[int]
+            Index of the residue in the sequence, None if the coordinates are free.
+        """
+        return self._position_index.get(coords)
+
+    def _index_of(self, amino_acid: AminoAcidHP) -> int:
+        """Gets the index of an amino acid in the sequence of the conformation.
+
+        Parameters
+        ----------
+        amino_acid : AminoAcidHP
+            Amino acid.
+
+        Returns
+        -------
+        int
+            Index of the amino acid in the sequence.
+        """
+        index = self._protein.index_of(amino_acid)
+        if self._position_index.get(self.get_position(index)) != index:
+            raise ValueError("Amino acid not found in the conformation.")
+        return index
+
+    def _is_valid_chain(self) -> bool:
+        """Checks that the residues are all placed, self-avoiding and connected.
+
+        Returns
+        -------
+        bool
+            True if the chain is a valid self-avoiding walk, False otherwise.
+        """
+        if len(self._position_index) != len(self._protein.sequence):
+            return False
+
+        # Each residue must be at a distance of exactly one from the next one in the sequence
+        steps = np.abs(np.diff(self._positions, axis=0)).sum(axis=1)
+        return bool(np.all(steps == 1))
+
+    def get_adjacent_coordinates(
+        self, coords: Tuple[int, ...]
+    ) -> list[Tuple[int, ...]]:
+        """Gets the lattice coordinates that are adjacent to given coordinates.
+
+        The bounds of the lattice are not checked: cells outside of it are never occupied.
+
+        Parameters
+        ----------
+        coords : Tuple[int, ...]
+            Coordinates.
+
+        Returns
+        -------
+        list[Tuple[int, ...]]
+            The 2d adjacent coordinates.
+        """
+        adjacent = []
+        for axis in range(len(coords)):
+            for step in (-1, 1):
+                cell = list(coords)
+                cell[axis] += step
+                adjacent.append(tuple(cell))
+        return adjacent
+
+    def compute_energy_delta(self, moves: dict[int, Tuple[int, ...]]) -> int:
+        """Computes the energy change caused by moving some residues, without applying the move.
+
+        Only the lattice neighbours of the old and new positions of the moved residues are inspected,
+        so the cost does not depend on the length of the chain.
+
+        Parameters
+        ----------
+        moves : dict[int, Tuple[int, ...]]
+            New coordinates of the moved residues (key: index of the residue in the sequence).
+
+        Returns
+        -------
+        int
+            Energy of the moved conformation minus the energy of the current one.
+        """
+        sequence = self._protein.sequence
+        moved_to = {coords: index for index, coords in moves.items()}
+
+        lost_contacts = 0
+        gained_contacts = 0
+        for index, new_coords in moves.items():
+            if sequence[index].polarity != Polarity.HYDROPHOBIC:
+                continue
+
+            # H-H contacts of the residue at its old position
+            for cell in self.get_adjacent_coordinates(self.get_position(index)):
+                other = self._position_index.get(cell)
+                if (
+                    other is not None
+                    and abs(other - index) > 1
+                    and sequence[other].polarity == Polarity.HYDROPHOBIC
+                    # A contact between two moved residues is only counted once
+                    and not (other in moves and other < index)
+                ):
+                    lost_contacts += 1
+
+            # H-H contacts of the residue at its new position
+            for cell in self.get_adjacent_coordinates(new_coords):
+                other = moved_to.get(cell)
+                if other is None:
+                    other = self._position_index.get(cell)
+                    if other in moves:
+                        # This residue left the cell
+                        other = None
+                if (
+                    other is not None
+                    and abs(other - index) > 1
+                    and sequence[other].polarity == Polarity.HYDROPHOBIC
+                    and not (other in moves and other < index)
+                ):
+                    gained_contacts += 1
+
+        # Each H-H topological contact contributes -1 to the energy
+        return lost_contacts - gained_contacts
+
+    def _compute_contact_energy(self) -> int:
+        """Computes the energy of the conformation in linear time.
+
+        Only the 2d lattice neighbours of each H residue can be in contact with it, so they are probed
+        in the coordinate hash instead of comparing every pair of residues.
+
+        Returns
+        -------
+        int
+            Energy of the conformation.
+        """
+        sequence = self._protein.sequence
+        energy = 0
+        for coords, index in self._position_index.items():
+            if sequence[index].polarity != Polarity.HYDROPHOBIC:
+                continue
+            for cell in self.get_adjacent_coordinates(coords):
+                other = self._position_index.get(cell)
+                # Each contact is counted from its residue of lowest index only
+                if (
+                    other is not None
+                    and other > index + 1
+                    and sequence[other].polarity == Polarity.HYDROPHOBIC
+                ):
+                    # Topological H neighbours
+                    energy += -1
+        return energy
+
+    def compute_energy_pairwise(self) -> int:
+        """Computes the energy of the conformation by comparing every pair of residues.
+
+        This is the quadratic reference implementation of compute_energy, it does not update the
+        computed energy of the conformation.
+
+        Returns
+        -------
+        int
+            Energy of the conformation.
+        """
+        sequence = self._protein.sequence
+        energy = 0
+        for i in range(len(sequence) - 1):
+            for j in range(i + 1, len(sequence)):
+                if abs(j - i) > 1:  # Not connected in the sequence
+                    cur_coords = self._make_coordinates(self.get_position(i))
+                    next_coords = self._make_coordinates(self.get_position(j))
+                    if (
+                        (self._lattice.are_adjacent(cur_coords, next_coords))
+                        and (sequence[i].polarity == Polarity.HYDROPHOBIC)
+                        and (sequence[j].polarity == Polarity.HYDROPHOBIC)
+                    ):
+                        # Topological H neighbours
+                        energy += -1
+        return energy
+
+    @abstractmethod
+    def _make_coordinates(self, coords: Tuple[int, ...]) -> TopoCoordinates:
+        """Wraps a tuple in the topological coordinates of the conformation.
+
+        Parameters
+        ----------
+        coords : Tuple[int, ...]
+            Coordinates.
+
+        Returns
+        -------
+        TopoCoordinates
+            Topological coordinates.
+        """
+        pass
+
     @abstractmethod
     def is_valid(self) -> bool:
         """Checks if the conformation is valid.
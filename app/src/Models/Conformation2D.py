@@ -6,7 +6,6 @@ from app.src.Models.Coordinates2D import Coordinates2D
 from .AminoAcidHP import AminoAcidHP
 from .Conformation import Conformation
 from .Lattice2D import Lattice2D
-from .Polarity import Polarity
 from .ProteinHP import ProteinHP
 
 
@@ -31,13 +30,26 @@ class Conformation2D(Conformation):
         self._lattice = lattice
         self._computed_energy = 0
 
-        self._amino_acid_coordinates = amino_acid_coordinates
         try:
-            for coord in amino_acid_coordinates.keys():
-                self._lattice.set_cell_value(Coordinates2D(coord), True)
+            self._set_amino_acid_coordinates(amino_acid_coordinates)
         except Exception as e:
             raise e
 
+    def _make_coordinates(self, coords: Tuple[int, int]) -> Coordinates2D:
+        """Wraps a tuple in 2D coordinates.
+
+        Parameters
+        ----------
+        coords : Tuple[int, int]
+            Coordinates.
+
+        Returns
+        -------
+        Coordinates2D
+            Coordinates of the cell.
+        """
+        return Coordinates2D(coords)
+
     def get_amino_acid_coordinates(self, amino_acid: AminoAcidHP) -> Coordinates2D:
         """Gets the coordinates of an amino acid in the conformation.
 
@@ -51,11 +63,7 @@ class Conformation2D(Conformation):
         Coordinates2D
             Coordinates of the amino acid.
         """
-        for key, value in self._amino_acid_coordinates.items():
-            if value.id == amino_acid.id:
-                return Coordinates2D(key)
-
-        raise ValueError("Amino acid not found in the conformation.")
+        return Coordinates2D(self.get_position(self._index_of(amino_acid)))
 
     def is_valid(self) -> bool:
         """Checks if the conformation is valid.
@@ -65,46 +73,9 @@ class Conformation2D(Conformation):
         bool
             True if the conformation is valid, False otherwise.
         """
-        valid_conformation = True
-        # It is enough to check that each amino acid that is adjacent to the next one in the sequence is adjacent in the lattice space.
-        for i in range(len(self._protein.sequence)):
-            try:
-                cur_coords = self.get_amino_acid_coordinates(self._protein.sequence[i])
-
-                if i == 0:
-                    next_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[i + 1]
-                    )
-                    # Check if the amino acids are adjacent
-                    if not self._lattice.are_adjacent(cur_coords, next_coords):
-                        valid_conformation = False
-                        break
-                elif i == len(self._protein.sequence) - 1:
-                    prec_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[i - 1]
-                    )
-                    # Check if the amino acids are adjacent
-                    if not self._lattice.are_adjacent(cur_coords, prec_coords):
-                        valid_conformation = False
-                        break
-                else:
-                    prec_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[i - 1]
-                    )
-                    next_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[i + 1]
-                    )
-                    # Check if the amino acids are adjacent
-                    if (not self._lattice.are_adjacent(cur_coords, next_coords)) or (
-                        not self._lattice.are_adjacent(cur_coords, prec_coords)
-                    ):
-                        valid_conformation = False
-                        break
-            except ValueError:
-                valid_conformation = False
-                break
-
-        return valid_conformation
+        # It is enough to check that the residues are self-avoiding and that each amino acid is adjacent
+        # to the next one in the sequence.
+        return self._is_valid_chain()
 
     def compute_energy(self) -> int:
         """Computes the energy of the conformation.
@@ -114,24 +85,7 @@ class Conformation2D(Conformation):
         int
             Energy of the conformation.
         """
-        energy = 0
-        for i in range(len(self._protein.sequence) - 1):
-            for j in range(i + 1, len(self._protein.sequence)):
-                if abs(j - i) > 1:  # Not connected in the sequence
-                    cur_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[i]
-                    )
-                    next_coords = self.get_amino_acid_coordinates(
-                        self._protein.sequence[j]
-                    )
-                    if (
-                        (self._lattice.are_adjacent(cur_coords, next_coords))
-                        and (self._protein.sequence[i].polarity == Polarity.HYDROPHOBIC)
-                        and (self._protein.sequence[j].polarity == Polarity.HYDROPHOBIC)
-                    ):
-                        # Topological H neighbours
-                        energy += -1
-
+        energy = self._compute_contact_energy()
         self._computed_energy = energy
         return energy
 
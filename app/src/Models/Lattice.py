@@ -1,19 +1,64 @@
+import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple
+from typing import ClassVar, Tuple
+
+import numpy as np
 
 from .TopoCoordinates import TopoCoordinates
 
 
+def build_crankshaft_table(
+    nb_dimensions: int,
+) -> dict[Tuple[Tuple[int, ...], ...], list[Tuple[Tuple[int, ...], Tuple[int, ...]]]]:
+    """Builds the table of the crankshaft moves of a lattice.
+
+    Parameters
+    ----------
+    nb_dimensions : int
+        Number of dimensions of the lattice.
+
+    Returns
+    -------
+    dict[Tuple[Tuple[int, ...], ...], list[Tuple[Tuple[int, ...], Tuple[int, ...]]]]
+        For each U turn, given by the directions of its three bonds (u, v, -u), the new offsets
+        of the two rotated residues from the residue preceding the U.
+    """
+    directions = []
+    for axis in range(nb_dimensions):
+        for step in (-1, 1):
+            direction = [0] * nb_dimensions
+            direction[axis] = step
+            directions.append(tuple(direction))
+
+    table = {}
+    for u in directions:
+        for v in directions:
+            if any(a != 0 and b != 0 for a, b in zip(u, v)):
+                # v must be orthogonal to u
+                continue
+            opposite = tuple(-a for a in u)
+            table[(u, v, opposite)] = [
+                (w, tuple(a + b for a, b in zip(w, v)))
+                for w in directions
+                if w != u and not any(a != 0 and b != 0 for a, b in zip(w, v))
+            ]
+    return table
+
+
 @dataclass(slots=True)
 class Lattice(ABC):
     """Abstract class that represents a lattice."""
 
     _dimensions: Tuple[int, ...]  # Dimensions of the lattice (x, y)
 
-    _cell_values: dict[
-        Tuple[int, ...], bool
-    ]  # Values of the cells of the lattice (False : empty, True : occupied
+    _occupied_cells: set[
+        Tuple[int, ...]
+    ]  # Occupied cells of the lattice (cells that are not in the set are empty)
+
+    _crankshaft_table: ClassVar[
+        dict[Tuple[Tuple[int, ...], ...], list[Tuple[Tuple[int, ...], Tuple[int, ...]]]]
+    ]  # Crankshaft moves of the lattice (see build_crankshaft_table)
 
     @property
     def dimensions(self) -> Tuple[int, ...]:
@@ -37,27 +82,74 @@ class Lattice(ABC):
         """
         self._dimensions = dimensions
 
+    @property
+    def occupied_cells(self) -> set[Tuple[int, ...]]:
+        """Getter for the attribute occupied_cells of the lattice.
+
+        Returns
+        -------
+        set[Tuple[int, ...]]
+            Occupied cells of the lattice.
+        """
+        return self._occupied_cells
+
+    @occupied_cells.setter
+    def occupied_cells(self, occupied_cells: set[Tuple[int, ...]]) -> None:
+        """Setter for the attribute occupied_cells of the lattice.
+
+        Parameters
+        ----------
+        occupied_cells : set[Tuple[int, ...]]
+            Occupied cells of the lattice to be assigned.
+        """
+        self._occupied_cells = occupied_cells
+
     @property
     def cell_values(self) -> dict[Tuple[int, ...], bool]:
-        """Getter for the attribute cell_values of the lattice.
+        """Getter for the values of all the cells of the lattice.
+
+        The lattice only stores its occupied cells, this dense dictionary is built on demand
+        for compatibility and costs as much as the number of cells of the lattice.
 
         Returns
         -------
         dict[Tuple[int, ...], bool]
-            Values of the cells of the lattice.
+            Values of the cells of the lattice (False : empty, True : occupied).
         """
-        return self._cell_values
+        return {
+            cell: cell in self._occupied_cells
+            for cell in itertools.product(*(range(dim) for dim in self._dimensions))
+        }
 
     @cell_values.setter
     def cell_values(self, cell_values: dict[Tuple[int, ...], bool]) -> None:
-        """Setter for the attribute cell_values of the lattice.
+        """Setter for the values of the cells of the lattice.
 
         Parameters
         ----------
         cell_values : dict[Tuple[int, ...], bool]
-            Values of the cells of the lattice to be assigned.
+            Values of the cells of the lattice to be assigned (False : empty, True : occupied).
+        """
+        self._occupied_cells = {cell for cell, value in cell_values.items() if value}
+
+    def reset_lattice(self) -> None:
+        """Resets the lattice to its initial state."""
+        self._occupied_cells.clear()
+
+    def is_occupied(self, cell: Tuple[int, ...]) -> bool:
+        """Checks if a cell is occupied.
+
+        Parameters
+        ----------
+        cell : Tuple[int, ...]
+            Coordinates of the cell.
+
+        Returns
+        -------
+        bool
+            True if the cell is occupied, False otherwise.
         """
-        self._cell_values = cell_values
+        return cell in self._occupied_cells
 
     @abstractmethod
     def are_adjacent(self, cell1: TopoCoordinates, cell2: TopoCoordinates) -> bool:
@@ -109,34 +201,280 @@ class Lattice(ABC):
         """
         pass
 
-    @abstractmethod
-    def compute_crankshaft_moves(self, cell: TopoCoordinates) -> list[TopoCoordinates]:
-        """Computes the crankshaft moves of a cell.
+    def compute_residue_end_moves(
+        self, index: int, positions: np.ndarray
+    ) -> list[Tuple[int, ...]]:
+        """Computes the end moves of a residue at one end of the chain.
+
+        The residue pivots to any free cell adjacent to its only connected neighbour.
 
         Parameters
         ----------
-        cell : TopoCoordinates
-            Cell.
+        index : int
+            Index of the residue in the sequence.
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues, whose cells must be occupied in the lattice.
 
         Returns
         -------
-        list[TopoCoordinates]
-            New possible positions of the cell after crankshaft moves.
+        list[Tuple[int, ...]]
+            New possible coordinates of the residue, none if it is not a chain end.
         """
-        pass
+        last_index = len(positions) - 1
+        if last_index < 1 or index not in (0, last_index):
+            return []
 
-    @abstractmethod
-    def compute_pull_moves(self, cell: TopoCoordinates) -> list[TopoCoordinates]:
-        """Computes the pull moves of a cell.
+        neighbour = 1 if index == 0 else last_index - 1
+        return self._get_free_adjacent_cells(tuple(positions[neighbour].tolist()))
+
+    def compute_residue_corner_moves(
+        self, index: int, positions: np.ndarray
+    ) -> list[Tuple[int, ...]]:
+        """Computes the corner moves of a residue inside the chain.
+
+        The residue moves to the free cell diagonally opposite to it, adjacent to both its connected
+        neighbours, when the chain makes a corner at the residue.
 
         Parameters
         ----------
-        cell : TopoCoordinates
-            Cell.
+        index : int
+            Index of the residue in the sequence.
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues, whose cells must be occupied in the lattice.
 
         Returns
         -------
-        list[TopoCoordinates]
-            New possible positions of the cell after pull moves.
+        list[Tuple[int, ...]]
+            New possible coordinates of the residue, none if it is a chain end.
         """
-        pass
+        if index < 1 or index > len(positions) - 2:
+            return []
+
+        previous = tuple(positions[index - 1].tolist())
+        following = tuple(positions[index + 1].tolist())
+        return [
+            cell
+            for cell in self._get_free_adjacent_cells(previous)
+            if sum(abs(c - f) for c, f in zip(cell, following)) == 1
+        ]
+
+    def compute_crankshaft_moves(
+        self, index: int, positions: np.ndarray
+    ) -> list[dict[int, Tuple[int, ...]]]:
+        """Computes the crankshaft moves of a residue and its successor in the chain.
+
+        The residues i and i + 1 form a crankshaft when the chain makes a U turn around them
+        (bond directions u, v, -u). Both residues are then rotated around the axis of the U.
+        The candidate positions are read from the crankshaft table of the lattice, so only the
+        cells of the rotated residues need to be checked.
+
+        Parameters
+        ----------
+        index : int
+            Index of the first residue of the crankshaft in the sequence.
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues, whose cells must be occupied in the lattice.
+
+        Returns
+        -------
+        list[dict[int, Tuple[int, ...]]]
+            Possible crankshaft moves, each one giving the new coordinates of the two moved residues
+            (key: index of the residue in the sequence).
+        """
+        if index < 1 or index > len(positions) - 3:
+            return []
+
+        anchor = tuple(positions[index - 1].tolist())
+        pattern = tuple(
+            tuple(
+                b - a for a, b in zip(positions[i].tolist(), positions[i + 1].tolist())
+            )
+            for i in range(index - 1, index + 2)
+        )
+
+        moves = []
+        for offset_first, offset_second in self._crankshaft_table.get(pattern, ()):
+            first = tuple(a + o for a, o in zip(anchor, offset_first))
+            second = tuple(a + o for a, o in zip(anchor, offset_second))
+            if (
+                self.is_inside(first)
+                and self.is_inside(second)
+                and first not in self._occupied_cells
+                and second not in self._occupied_cells
+            ):
+                moves.append({index: first, index + 1: second})
+
+        return moves
+
+    def is_inside(self, cell: Tuple[int, ...]) -> bool:
+        """Checks if a cell is inside the bounds of the lattice.
+
+        Parameters
+        ----------
+        cell : Tuple[int, ...]
+            Coordinates of the cell.
+
+        Returns
+        -------
+        bool
+            True if the cell is inside the lattice, False otherwise.
+        """
+        return all(0 <= value < dim for value, dim in zip(cell, self._dimensions))
+
+    def _get_free_adjacent_cells(self, cell: Tuple[int, ...]) -> list[Tuple[int, ...]]:
+        """Gets the free cells of the lattice that are adjacent to a cell.
+
+        Parameters
+        ----------
+        cell : Tuple[int, ...]
+            Coordinates of the cell.
+
+        Returns
+        -------
+        list[Tuple[int, ...]]
+            Free adjacent cells.
+        """
+        free_cells = []
+        for axis in range(len(cell)):
+            for step in (-1, 1):
+                adjacent = list(cell)
+                adjacent[axis] += step
+                adjacent = tuple(adjacent)
+                if self.is_inside(adjacent) and adjacent not in self._occupied_cells:
+                    free_cells.append(adjacent)
+        return free_cells
+
+    def compute_pull_moves(
+        self, index: int, positions: np.ndarray
+    ) -> list[dict[int, Tuple[int, ...]]]:
+        """Computes the pull moves of a residue (Lesh et al., 2003), without the rest of the chain.
+
+        The residue is moved to a free cell L adjacent to one of its connected neighbours and
+        diagonal to its current cell, its other connected neighbour is moved to the cell C completing
+        the square, and the rest of the chain follows (each residue takes the cell freed two
+        residues before it) until the chain is connected again. A chain end can also be pulled to
+        any two free adjacent cells.
+
+        Only the (L, C) pairs are enumerated: the chain pulled behind them is built by
+        pull_chain for the move that is actually used. Each move is returned once, even when it can
+        be reached from both neighbours of the residue.
+
+        Parameters
+        ----------
+        index : int
+            Index of the residue in the sequence.
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues, whose cells must be occupied in the lattice.
+
+        Returns
+        -------
+        list[dict[int, Tuple[int, ...]]]
+            Possible pull moves, each one giving the new coordinates of the residue (L) and, when it
+            has to move, of the neighbour pulled behind it (C) (key: index of the residue in the
+            sequence).
+        """
+        nb_residues = len(positions)
+        current = tuple(positions[index].tolist())
+        # The same move can be found from both sides of the residue, it is kept once
+        moves = {}
+
+        for step in (1, -1):
+            # The chain behind the residue follows in the opposite direction of the pull
+            trail = -step
+            anchor = index + step
+
+            if 0 <= anchor < nb_residues:
+                anchor_coords = tuple(positions[anchor].tolist())
+                bond = [c - a for c, a in zip(current, anchor_coords)]
+                for cell_l in self._get_free_adjacent_cells(anchor_coords):
+                    direction = [l - a for l, a in zip(cell_l, anchor_coords)]
+                    # L must be diagonal to the residue: its direction from the anchor is orthogonal to the bond
+                    if sum(b * d for b, d in zip(bond, direction)) != 0:
+                        continue
+                    cell_c = tuple(c + d for c, d in zip(current, direction))
+
+                    follower = index + trail
+                    if not 0 <= follower < nb_residues or (
+                        tuple(positions[follower].tolist()) == cell_c
+                    ):
+                        # Nothing to pull: the residue simply moves to L
+                        move = {index: cell_l}
+                    elif self.is_inside(cell_c) and cell_c not in self._occupied_cells:
+                        move = {index: cell_l, follower: cell_c}
+                    else:
+                        continue
+                    moves.setdefault(frozenset(move.items()), move)
+
+            elif 0 <= index + trail < nb_residues:
+                # The residue is a chain end, it is pulled to L and the next residue to C
+                follower = index + trail
+                for cell_c in self._get_free_adjacent_cells(current):
+                    for cell_l in self._get_free_adjacent_cells(cell_c):
+                        move = {index: cell_l, follower: cell_c}
+                        moves.setdefault(frozenset(move.items()), move)
+
+        return list(moves.values())
+
+    def pull_chain(
+        self, index: int, positions: np.ndarray, pull: dict[int, Tuple[int, ...]]
+    ) -> dict[int, Tuple[int, ...]]:
+        """Completes a pull move of a residue with the rest of the chain pulled behind it.
+
+        Parameters
+        ----------
+        index : int
+            Index of the pulled residue in the sequence.
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues.
+        pull : dict[int, Tuple[int, ...]]
+            Pull move of the residue, as returned by compute_pull_moves. It is left unchanged.
+
+        Returns
+        -------
+        dict[int, Tuple[int, ...]]
+            New coordinates of all the moved residues (key: index of the residue in the sequence).
+        """
+        moved = dict(pull)
+        if len(moved) == 1:
+            return moved
+        follower = next(i for i in moved if i != index)
+        return self._pull_chain(positions, moved, follower, follower - index)
+
+    def _pull_chain(
+        self,
+        positions: np.ndarray,
+        moved: dict[int, Tuple[int, ...]],
+        last_moved: int,
+        trail: int,
+    ) -> dict[int, Tuple[int, ...]]:
+        """Pulls the rest of the chain behind the residues already moved by a pull move.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            (n, d) array of the coordinates of the residues.
+        moved : dict[int, Tuple[int, ...]]
+            New coordinates of the two residues moved by the pull move (completed in place).
+        last_moved : int
+            Index of the last residue that was moved.
+        trail : int
+            Direction (+1 or -1) in which the chain follows.
+
+        Returns
+        -------
+        dict[int, Tuple[int, ...]]
+            New coordinates of all the moved residues.
+        """
+        nb_residues = len(positions)
+        following = last_moved + trail
+        while 0 <= following < nb_residues:
+            coords = tuple(positions[following].tolist())
+            if sum(abs(c - m) for c, m in zip(coords, moved[last_moved])) == 1:
+                # The chain is connected again
+                break
+            # The residue takes the cell freed by the residue two positions ahead of it
+            moved[following] = tuple(positions[following - 2 * trail].tolist())
+            last_moved = following
+            following += trail
+
+        return moved
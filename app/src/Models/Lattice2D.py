@@ -1,17 +1,19 @@
-import random
 from dataclasses import dataclass
 from typing import Tuple
 
 from .AminoAcidHP import AminoAcidHP
 from .Coordinates2D import Coordinates2D
-from .Lattice import Lattice
+from .Lattice import Lattice, build_crankshaft_table
 from .ProteinHP import ProteinHP
+from .RandomStream import RandomStream
 
 
 @dataclass(slots=True)
 class Lattice2D(Lattice):
     """Class that represents a 2D lattice."""
 
+    _crankshaft_table = build_crankshaft_table(2)
+
     def __init__(self, dimensions: Tuple[int, int]) -> None:
         """Constructor for the Lattice2D class.
 
@@ -24,17 +26,7 @@ class Lattice2D(Lattice):
             raise ValueError("Dimensions must be a tuple of two integers.")
 
         self._dimensions = dimensions
-        values = {}
-        for i in range(dimensions[0]):
-            for j in range(dimensions[1]):
-                values[(i, j)] = False
-        self._cell_values = values
-
-    def reset_lattice(self) -> None:
-        """Resets the lattice to its initial state."""
-        for i in range(self._dimensions[0]):
-            for j in range(self._dimensions[1]):
-                self._cell_values[(i, j)] = False
+        self._occupied_cells = set()
 
     def set_cell_value(self, cell: Coordinates2D, value: bool) -> None:
         """Sets the value of a single cell.
@@ -52,7 +44,10 @@ class Lattice2D(Lattice):
             and cell.coordinates[0] < self.dimensions[0]
             and cell.coordinates[1] < self.dimensions[1]
         ):
-            self._cell_values[cell.coordinates] = value
+            if value:
+                self._occupied_cells.add(cell.coordinates)
+            else:
+                self._occupied_cells.discard(cell.coordinates)
 
         else:
             raise ValueError("Cell coordinates out of bounds.")
@@ -87,7 +82,10 @@ class Lattice2D(Lattice):
         return adjacent
 
     def get_random_adjacent_cell(
-        self, cell: Coordinates2D, exclude: list[Coordinates2D]
+        self,
+        cell: Coordinates2D,
+        exclude: list[Coordinates2D],
+        rng: RandomStream,
     ) -> Tuple[int, int]:
         """Returns a random adjacent cell.
 
@@ -97,6 +95,8 @@ class Lattice2D(Lattice):
             Cell.
         exclude : list[Coordinates2D]
             List of cells to exclude from the sampling.
+        rng : RandomStream
+            Random stream of the sampling, owned by the caller so that the sampling can be seeded.
 
         Returns
         -------
@@ -127,8 +127,7 @@ class Lattice2D(Lattice):
         elif len(candidates) == 1:
             return candidates[0]
         else:
-            random_index = random.randint(0, len(candidates) - 1)
-            return candidates[random_index]
+            return rng.choice(candidates)
 
     def get_all_adjacent_cells(self, cell: Coordinates2D) -> list[Tuple[int, int]]:
         """Returns all adjacent cells.
@@ -189,7 +188,7 @@ class Lattice2D(Lattice):
         neighbour_counter = 0
 
         for adjacent_cell in adjacent_cells:
-            if self._cell_values[adjacent_cell]:
+            if adjacent_cell in self._occupied_cells:
                 if protein.are_neighbours(
                     amino_acid_coords[adjacent_cell],
                     amino_acid_coords[cell.coordinates],
@@ -215,7 +214,7 @@ class Lattice2D(Lattice):
 
         new_positions = []
         for neighbour_adjacent_cell in neighbour_adjacent_cells:
-            if not self._cell_values[neighbour_adjacent_cell]:
+            if neighbour_adjacent_cell not in self._occupied_cells:
                 new_positions.append(neighbour_adjacent_cell)
 
         if len(new_positions) == 0:
@@ -256,7 +255,7 @@ class Lattice2D(Lattice):
         # We make sure there are exactly two connected neighbours:
         neighbours = []
         for adjacent_cell in adjacent_cells:
-            if self._cell_values[adjacent_cell]:
+            if adjacent_cell in self._occupied_cells:
                 if protein.are_neighbours(
                     amino_acid_coords[adjacent_cell],
                     amino_acid_coords[cell.coordinates],
@@ -292,7 +291,7 @@ class Lattice2D(Lattice):
         new_positions = []
         for coordinates in neighbour_adjacent_cells[0]:
             if coordinates in neighbour_adjacent_cells[1]:
-                if not self._cell_values[coordinates]:
+                if coordinates not in self._occupied_cells:
                     new_positions.append(coordinates)
 
         if len(new_positions) == 0:
@@ -311,9 +310,3 @@ class Lattice2D(Lattice):
             Dictionary containing the U structures found in the lattice. The keys are ids and the values are lists of
         """
         pass
-
-    def compute_crankshaft_moves(self, cell: Coordinates2D) -> list[Coordinates2D]:
-        pass
-
-    def compute_pull_moves(self, cell: Coordinates2D) -> list[Coordinates2D]:
-        pass
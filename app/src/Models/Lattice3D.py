@@ -1,17 +1,19 @@
-import random
 from dataclasses import dataclass
 from typing import Tuple
 
 from .AminoAcidHP import AminoAcidHP
 from .Coordinates3D import Coordinates3D
-from .Lattice import Lattice
+from .Lattice import Lattice, build_crankshaft_table
 from .ProteinHP import ProteinHP
+from .RandomStream import RandomStream
 
 
 @dataclass(slots=True)
 class Lattice3D(Lattice):
     """Class that represents a 3D lattice."""
 
+    _crankshaft_table = build_crankshaft_table(3)
+
     def __init__(self, dimensions: Tuple[int, int, int]) -> None:
         """Constructor for the Lattice3D class.
 
@@ -24,19 +26,7 @@ class Lattice3D(Lattice):
             raise ValueError("Dimensions must be a tuple of two integers.")
 
         self._dimensions = dimensions
-        values = {}
-        for i in range(dimensions[0]):
-            for j in range(dimensions[1]):
-                for k in range(dimensions[2]):
-                    values[(i, j, k)] = False
-        self._cell_values = values
-
-    def reset_lattice(self) -> None:
-        """Resets the lattice to its initial state."""
-        for i in range(self._dimensions[0]):
-            for j in range(self._dimensions[1]):
-                for k in range(self._dimensions[2]):
-                    self._cell_values[(i, j, k)] = False
+        self._occupied_cells = set()
 
     def set_cell_value(self, cell: Coordinates3D, value: bool) -> None:
         """Sets the value of a single cell.
@@ -56,7 +46,10 @@ class Lattice3D(Lattice):
             and cell.coordinates[1] < self.dimensions[1]
             and cell.coordinates[2] < self.dimensions[2]
         ):
-            self._cell_values[cell.coordinates] = value
+            if value:
+                self._occupied_cells.add(cell.coordinates)
+            else:
+                self._occupied_cells.discard(cell.coordinates)
 
         else:
             raise ValueError("Cell coordinates out of bounds.")
@@ -101,7 +94,10 @@ class Lattice3D(Lattice):
         return adjacent
 
     def get_random_adjacent_cell(
-        self, cell: Coordinates3D, exclude: list[Coordinates3D]
+        self,
+        cell: Coordinates3D,
+        exclude: list[Coordinates3D],
+        rng: RandomStream,
     ) -> Tuple[int, int, int]:
         """Gets a random adjacent cell.
 
@@ -111,6 +107,8 @@ class Lattice3D(Lattice):
             Cell.
         exclude : list[Coordinates3D]
             List of cells to exclude.
+        rng : RandomStream
+            Random stream of the sampling, owned by the caller so that the sampling can be seeded.
 
         Returns
         -------
@@ -174,7 +172,7 @@ class Lattice3D(Lattice):
         elif len(candidates) == 1:
             return candidates[0]
         else:
-            return candidates[random.randint(0, len(candidates) - 1)]
+            return rng.choice(candidates)
 
     def get_all_adjacent_cells(self, cell: Coordinates3D) -> list[Tuple[int, int, int]]:
         """Gets all adjacent cells of a given cell.
@@ -251,7 +249,7 @@ class Lattice3D(Lattice):
         neighbour = None
         neighbour_counter = 0
         for adjacent_cell in adjacent_cells:
-            if self._cell_values[adjacent_cell]:
+            if adjacent_cell in self._occupied_cells:
                 if protein.are_neighbours(
                     amino_acid_coords[adjacent_cell],
                     amino_acid_coords[cell.coordinates],
@@ -278,7 +276,7 @@ class Lattice3D(Lattice):
 
         new_positions = []
         for neighbour_adjacent_cell in neighbour_adjacent_cells:
-            if not self._cell_values[neighbour_adjacent_cell]:
+            if neighbour_adjacent_cell not in self._occupied_cells:
                 new_positions.append(neighbour_adjacent_cell)
 
         if len(new_positions) == 0:
@@ -319,7 +317,7 @@ class Lattice3D(Lattice):
         # We make sure there are exactly two adjacent cells that are occupied:
         neighbours = []
         for adjacent_cell in adjacent_cells:
-            if self._cell_values[adjacent_cell]:
+            if adjacent_cell in self._occupied_cells:
                 if protein.are_neighbours(
                     amino_acid_coords[adjacent_cell],
                     amino_acid_coords[cell.coordinates],
@@ -355,7 +353,7 @@ class Lattice3D(Lattice):
         new_positions = []
         for coordinates in neighbour_adjacent_cells[0]:
             if coordinates in neighbour_adjacent_cells[1]:
-                if not self._cell_values[coordinates]:
+                if coordinates not in self._occupied_cells:
                     new_positions.append(coordinates)
 
         if len(new_positions) == 0:
@@ -364,9 +362,3 @@ class Lattice3D(Lattice):
             )
 
         return new_positions
-
-    def compute_crankshaft_moves(self, cell: Coordinates3D) -> list[Coordinates3D]:
-        pass
-
-    def compute_pull_moves(self, cell: Coordinates3D) -> list[Coordinates3D]:
-        pass
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from .MoveType import MoveType
+
+
+@dataclass(slots=True)
+class Move:
+    """Move is a lightweight descriptor of the residues relocated by a move on a conformation."""
+
+    _move_type: MoveType  # Type of the move
+    _residue_indices: Tuple[int, ...]  # Indices in the sequence of the moved residues
+    _old_positions: Tuple[Tuple[int, ...], ...]  # Coordinates before the move
+    _new_positions: Tuple[Tuple[int, ...], ...]  # Coordinates after the move
+
+    @property
+    def move_type(self) -> MoveType:
+        """Getter for the attribute move_type of the move.
+
+        Returns
+        -------
+        MoveType
+            Type of the move.
+        """
+        return self._move_type
+
+    @property
+    def residue_indices(self) -> Tuple[int, ...]:
+        """Getter for the attribute residue_indices of the move.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            Indices in the sequence of the moved residues.
+        """
+        return self._residue_indices
+
+    @property
+    def old_positions(self) -> Tuple[Tuple[int, ...], ...]:
+        """Getter for the attribute old_positions of the move.
+
+        Returns
+        -------
+        Tuple[Tuple[int, ...], ...]
+            Coordinates of the residues before the move.
+        """
+        return self._old_positions
+
+    @property
+    def new_positions(self) -> Tuple[Tuple[int, ...], ...]:
+        """Getter for the attribute new_positions of the move.
+
+        Returns
+        -------
+        Tuple[Tuple[int, ...], ...]
+            Coordinates of the residues after the move.
+        """
+        return self._new_positions
+
+    def as_dict(self) -> dict[int, Tuple[int, ...]]:
+        """Returns the new coordinates of the moved residues.
+
+        Returns
+        -------
+        dict[int, Tuple[int, ...]]
+            New coordinates of the moved residues (key: index of the residue in the sequence).
+        """
+        return dict(zip(self._residue_indices, self._new_positions))
@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class MoveType(Enum):
+    """Types of moves that can be applied to a conformation."""
+
+    END = 0  # Pivots a chain end around its connected neighbour
+    CORNER = 1  # Flips a residue across the corner of its two connected neighbours
+    PULL = 2  # Pulls a residue to a diagonal cell, the chain following it
+    CRANKSHAFT = 3  # Rotates two residues forming a U turn around the axis of the U
+
+    def __str__(self) -> str:
+        """Returns a string representation of the type of the move.
+
+        Returns
+        -------
+        str
+            String representation of the type of the move.
+        """
+        return self.name
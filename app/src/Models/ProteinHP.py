@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .AminoAcidHP import AminoAcidHP
 from .Protein import Protein
@@ -10,6 +10,42 @@ class ProteinHP(Protein):
 
     _e_star: int  # Optimal (Theoretical) Energy of the protein in the HP-Model.
     _recommended_dimension: int  # Recommended dimension of the protein (2D or 3D) in the HP-Model.
+    _residue_indices: dict[int, int] = field(
+        init=False, repr=False, compare=False
+    )  # Index of each amino acid in the sequence (key: id of the amino acid).
+
+    def __post_init__(self) -> None:
+        """Builds the index table of the residues once the protein is created."""
+        self._build_residue_indices()
+
+    def _build_residue_indices(self) -> None:
+        """Builds the table giving the index of each amino acid in the sequence."""
+        self._residue_indices = {
+            amino_acid.id: i for i, amino_acid in enumerate(self._sequence)
+        }
+
+    @property
+    def sequence(self) -> list[AminoAcidHP]:
+        """Getter for the attribute sequence of the protein.
+
+        Returns
+        -------
+        list[AminoAcidHP]
+            Sequence of amino acids that compose the protein.
+        """
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, sequence: list[AminoAcidHP]) -> None:
+        """Setter for the attribute sequence of the protein.
+
+        Parameters
+        ----------
+        sequence : list[AminoAcidHP]
+            Sequence of amino acids that compose the protein to be assigned.
+        """
+        self._sequence = sequence
+        self._build_residue_indices()
 
     @property
     def e_star(self) -> int:
@@ -72,23 +108,49 @@ class ProteinHP(Protein):
         bool
             True if the amino acids are neighbours, False otherwise.
         """
-        index_amino1 = None
-        index_amino2 = None
-        for i, residue in enumerate(self.sequence):
-            if residue.id == amino_acid_1.id:
-                index_amino1 = i
-            elif residue.id == amino_acid_2.id:
-                index_amino2 = i
-
-            if index_amino1 is not None and index_amino2 is not None:
-                break
+        index_amino1 = self._residue_indices.get(amino_acid_1.id)
+        index_amino2 = self._residue_indices.get(amino_acid_2.id)
 
         if index_amino1 is None or index_amino2 is None:
             return False
 
         else:
-            neighbours = abs(index_amino1 - index_amino2) == 1
-            return neighbours
+            return self.are_neighbours_at(index_amino1, index_amino2)
+
+    def are_neighbours_at(self, index_1: int, index_2: int) -> bool:
+        """Checks if the residues at two indices of the sequence are neighbours in the protein.
+
+        Parameters
+        ----------
+        index_1 : int
+            Index of the first residue.
+        index_2 : int
+            Index of the second residue.
+
+        Returns
+        -------
+        bool
+            True if the residues are neighbours, False otherwise.
+        """
+        return abs(index_1 - index_2) == 1
+
+    def index_of(self, amino_acid: AminoAcidHP) -> int:
+        """Gets the index of an amino acid in the sequence of the protein.
+
+        Parameters
+        ----------
+        amino_acid : AminoAcidHP
+            Amino acid.
+
+        Returns
+        -------
+        int
+            Index of the amino acid in the sequence.
+        """
+        index = self._residue_indices.get(amino_acid.id)
+        if index is None:
+            raise ValueError("Amino acid not found in the protein.")
+        return index
 
     def protein_model(self) -> str:
         return "Hydrophobic-Polar"
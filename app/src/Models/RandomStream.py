@@ -0,0 +1,138 @@
+from typing import Optional, Sequence, TypeVar, Union
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class RandomStream:
+    """RandomStream is an independent stream of random numbers, drawn by blocks from a NumPy
+    Generator.
+
+    Drawing a block of uniform numbers at once is much cheaper than calling the generator for
+    each number, which matters in the Monte Carlo loops where a few numbers are used per step.
+    Streams spawned from the same seed are statistically independent, so each replica of a run
+    can use its own, in any process.
+    """
+
+    _seed_sequence: np.random.SeedSequence  # Seed sequence of the stream
+    _generator: np.random.Generator  # Generator drawing the blocks
+    _block_size: int  # Number of uniform numbers drawn at once
+    _block: list[float]  # Current block of uniform numbers
+    _position: int  # Index of the next number of the block
+
+    def __init__(
+        self,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        block_size: int = 1024,
+    ) -> None:
+        """Constructor for the RandomStream class.
+
+        Parameters
+        ----------
+        seed : Optional[Union[int, np.random.SeedSequence]], optional
+            Seed of the stream, by default None (seeded from the entropy of the system).
+        block_size : int, optional
+            Number of uniform numbers drawn at once, by default 1024
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1.")
+        if isinstance(seed, np.random.SeedSequence):
+            self._seed_sequence = seed
+        else:
+            self._seed_sequence = np.random.SeedSequence(seed)
+        self._generator = np.random.default_rng(self._seed_sequence)
+        self._block_size = block_size
+        self._block = []
+        self._position = 0
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Getter for the attribute generator of the stream.
+
+        Returns
+        -------
+        np.random.Generator
+            Generator drawing the blocks, for the draws the stream does not provide.
+        """
+        return self._generator
+
+    def spawn(self, nb_streams: int) -> list["RandomStream"]:
+        """Creates independent child streams.
+
+        Parameters
+        ----------
+        nb_streams : int
+            Number of streams to be created.
+
+        Returns
+        -------
+        list[RandomStream]
+            Child streams, independent of this stream and of each other.
+        """
+        return [
+            RandomStream(seed_sequence, self._block_size)
+            for seed_sequence in self._seed_sequence.spawn(nb_streams)
+        ]
+
+    def random(self) -> float:
+        """Draws a uniform number.
+
+        Returns
+        -------
+        float
+            Uniform number in [0, 1).
+        """
+        if self._position == len(self._block):
+            self._block = self._generator.random(self._block_size).tolist()
+            self._position = 0
+        self._position += 1
+        return self._block[self._position - 1]
+
+    def randrange(self, stop: int) -> int:
+        """Draws an integer uniformly.
+
+        Parameters
+        ----------
+        stop : int
+            Upper bound (excluded) of the integer.
+
+        Returns
+        -------
+        int
+            Integer in [0, stop).
+        """
+        return int(self.random() * stop)
+
+    def choice(self, sequence: Sequence[T]) -> T:
+        """Draws an element of a sequence uniformly.
+
+        Parameters
+        ----------
+        sequence : Sequence[T]
+            Non empty sequence.
+
+        Returns
+        -------
+        T
+            Element of the sequence.
+        """
+        return sequence[self.randrange(len(sequence))]
+
+    def sample(self, population: Sequence[T], k: int) -> list[T]:
+        """Draws distinct elements of a sequence.
+
+        Parameters
+        ----------
+        population : Sequence[T]
+            Sequence of at least k elements.
+        k : int
+            Number of elements to be drawn.
+
+        Returns
+        -------
+        list[T]
+            Elements of the sequence, in the order they were drawn.
+        """
+        indices = self._generator.choice(len(population), size=k, replace=False)
+        return [population[int(i)] for i in indices]
@@ -0,0 +1,213 @@
+import math
+from typing import Optional
+
+from .GeometricLadder import GeometricLadder
+from .TemperatureLadder import TemperatureLadder
+
+
+class AdaptiveLadder(TemperatureLadder):
+    """AdaptiveLadder retunes the spacing of the temperatures of the replicas during the run, so
+    that the exchanges between neighbouring rungs are accepted at a target ratio.
+
+    Every few iterations, the logarithmic gap between two neighbouring rungs is widened when
+    their exchanges were accepted more often than the target, and narrowed otherwise, the lowest
+    rung staying at the minimum temperature. When the widened ladder would go past the maximum
+    temperature, the target cannot be reached with this number of rungs: the highest rung is pinned
+    at the maximum temperature instead, and the gaps are redistributed between both ends so that
+    the acceptance ratios of all the gaps converge to the same value (Katzgraber et al., 2006).
+    """
+
+    _initial_ladder: TemperatureLadder  # Ladder of the first iterations
+    _target_ratio: float = 0.23  # Target acceptance ratio of the exchanges
+    _interval: int = 10  # Number of iterations between two retunings
+    _gain: float = 1.0  # Gain of the retuning of the gaps
+    _tmax: float  # Maximum temperature
+    _nb_iterations: int = 0  # Number of iterations since the last retuning
+    _attempts: list[int]  # Number of exchanges attempted above each rung
+    _acceptances: list[int]  # Number of exchanges accepted above each rung
+
+    def __init__(
+        self,
+        target_ratio: float = 0.23,
+        interval: int = 10,
+        gain: float = 1.0,
+        initial_ladder: Optional[TemperatureLadder] = None,
+    ) -> None:
+        """Constructor for the AdaptiveLadder class.
+
+        Parameters
+        ----------
+        target_ratio : float, optional
+            Target acceptance ratio of the exchanges between neighbouring rungs, by default 0.23
+        interval : int, optional
+            Number of iterations between two retunings, by default 10
+        gain : float, optional
+            Gain of the retuning of the gaps, by default 1.0
+        initial_ladder : Optional[TemperatureLadder], optional
+            Ladder of the first iterations, by default None (a geometric ladder).
+        """
+        if not 0 < target_ratio < 1:
+            raise ValueError("target_ratio must be between 0 and 1.")
+        if interval < 1:
+            raise ValueError("interval must be at least 1.")
+        if gain <= 0:
+            raise ValueError("gain must be positive.")
+        self._target_ratio = target_ratio
+        self._interval = interval
+        self._gain = gain
+        self._initial_ladder = (
+            initial_ladder if initial_ladder is not None else GeometricLadder()
+        )
+        self._attempts = []
+        self._acceptances = []
+
+    @property
+    def target_ratio(self) -> float:
+        """Getter for the attribute target_ratio of the ladder.
+
+        Returns
+        -------
+        float
+            Target acceptance ratio of the exchanges between neighbouring rungs.
+        """
+        return self._target_ratio
+
+    @property
+    def interval(self) -> int:
+        """Getter for the attribute interval of the ladder.
+
+        Returns
+        -------
+        int
+            Number of iterations between two retunings.
+        """
+        return self._interval
+
+    @property
+    def gain(self) -> float:
+        """Getter for the attribute gain of the ladder.
+
+        Returns
+        -------
+        float
+            Gain of the retuning of the gaps.
+        """
+        return self._gain
+
+    def create(self, tmin: float, tmax: float, nb_rungs: int) -> list[float]:
+        """Creates the rungs of the ladder.
+
+        Parameters
+        ----------
+        tmin : float
+            Minimum temperature, strictly positive.
+        tmax : float
+            Maximum temperature.
+        nb_rungs : int
+            Number of rungs (one per replica).
+
+        Returns
+        -------
+        list[float]
+            Temperatures of the rungs, in increasing order.
+        """
+        if tmin <= 0:
+            raise ValueError(
+                "The minimum temperature of an adaptive ladder must be positive."
+            )
+        self._tmax = tmax
+        self._nb_iterations = 0
+        self._attempts = [0] * (nb_rungs - 1)
+        self._acceptances = [0] * (nb_rungs - 1)
+        return self._initial_ladder.create(tmin, tmax, nb_rungs)
+
+    def record_swap(self, rung: int, accepted: bool) -> None:
+        """Records an exchange attempted between two neighbouring rungs.
+
+        Parameters
+        ----------
+        rung : int
+            Lowest of the two rungs.
+        accepted : bool
+            Whether the exchange was accepted.
+        """
+        self._attempts[rung] += 1
+        if accepted:
+            self._acceptances[rung] += 1
+
+    def retune(self, rungs: list[float]) -> list[float]:
+        """Retunes the rungs of the ladder, once every replica completed an iteration.
+
+        Parameters
+        ----------
+        rungs : list[float]
+            Temperatures of the rungs, in increasing order.
+
+        Returns
+        -------
+        list[float]
+            New temperatures of the rungs, in increasing order.
+        """
+        self._nb_iterations += 1
+        if self._nb_iterations < self._interval or len(rungs) < 2:
+            return rungs
+
+        gaps = []
+        ratios = []
+        for rung in range(len(rungs) - 1):
+            gaps.append(math.log(rungs[rung + 1] / rungs[rung]))
+            # A gap without exchanges keeps its width
+            ratios.append(
+                self._acceptances[rung] / self._attempts[rung]
+                if self._attempts[rung] > 0
+                else None
+            )
+
+        # Each gap moves towards the target ratio
+        retuned_gaps = self._scale_gaps(gaps, ratios, self._target_ratio)
+
+        width = math.log(self._tmax / rungs[0])
+        if sum(retuned_gaps) > width:
+            # The highest rung is pinned at the maximum temperature, and the gaps move towards
+            # their mean ratio instead
+            measured = [ratio for ratio in ratios if ratio is not None]
+            mean_ratio = (
+                sum(measured) / len(measured) if measured else self._target_ratio
+            )
+            retuned_gaps = self._scale_gaps(gaps, ratios, mean_ratio)
+            total = sum(retuned_gaps)
+            retuned_gaps = [gap * width / total for gap in retuned_gaps]
+
+        retuned = [rungs[0]]
+        for gap in retuned_gaps:
+            # The rounding errors must not push the highest rung past the maximum temperature
+            retuned.append(min(retuned[-1] * math.exp(gap), self._tmax))
+
+        self._nb_iterations = 0
+        self._attempts = [0] * len(gaps)
+        self._acceptances = [0] * len(gaps)
+        return retuned
+
+    def _scale_gaps(
+        self, gaps: list[float], ratios: list[Optional[float]], reference: float
+    ) -> list[float]:
+        """Widens the gaps whose acceptance ratio is above a reference, and narrows the others.
+
+        Parameters
+        ----------
+        gaps : list[float]
+            Logarithmic gaps between neighbouring rungs.
+        ratios : list[Optional[float]]
+            Acceptance ratios of the exchanges across each gap, None when none was attempted.
+        reference : float
+            Acceptance ratio leaving a gap unchanged.
+
+        Returns
+        -------
+        list[float]
+            Scaled gaps.
+        """
+        return [
+            gap if ratio is None else gap * math.exp(self._gain * (ratio - reference))
+            for gap, ratio in zip(gaps, ratios)
+        ]
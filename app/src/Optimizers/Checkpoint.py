@@ -0,0 +1,223 @@
+import os
+import pickle
+from dataclasses import dataclass
+from typing import Tuple
+
+from ..Models.RandomStream import RandomStream
+from .TemperatureLadder import TemperatureLadder
+
+
+@dataclass(slots=True)
+class Checkpoint:
+    """Checkpoint is a snapshot of the full state of a synchronous REMC run, from which it resumes.
+
+    The replicas and the best conformation are kept in their compact form (see
+    Conformation.encode), and the random streams of the run and of its replicas are saved with
+    them so that a resumed run draws the same numbers as the original one.
+    """
+
+    _iteration: int  # Next iteration of the run
+    _offset: int  # Offset of the next exchange step
+    _temperatures: list[float]  # Temperature of each replica
+    _lattice_dimensions: Tuple[int, ...]  # Dimensions of the lattice of the replicas
+    _replicas: list[bytes]  # Encoded conformation of each replica
+    _energies: list[int]  # Energy of each replica
+    _optimal_energy: int  # Best energy found so far
+    _optimal_replica: bytes  # Encoded best conformation found so far
+    _nb_improvements: int  # Number of improvements of the best energy so far
+    _nb_steps: int  # Number of Monte Carlo steps made so far
+    _last_improvement: int  # Iteration of the last improvement of the best energy
+    _random_stream: RandomStream  # Random stream of the exchanges of the run
+    _replica_streams: list[RandomStream]  # Random stream of each replica
+    _temperature_ladder: TemperatureLadder  # Strategy placing the temperatures
+
+    @property
+    def iteration(self) -> int:
+        """Getter for the attribute iteration of the checkpoint.
+
+        Returns
+        -------
+        int
+            Next iteration of the run.
+        """
+        return self._iteration
+
+    @property
+    def offset(self) -> int:
+        """Getter for the attribute offset of the checkpoint.
+
+        Returns
+        -------
+        int
+            Offset of the next exchange step.
+        """
+        return self._offset
+
+    @property
+    def temperatures(self) -> list[float]:
+        """Getter for the attribute temperatures of the checkpoint.
+
+        Returns
+        -------
+        list[float]
+            Temperature of each replica.
+        """
+        return self._temperatures
+
+    @property
+    def lattice_dimensions(self) -> Tuple[int, ...]:
+        """Getter for the attribute lattice_dimensions of the checkpoint.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            Dimensions of the lattice of the replicas.
+        """
+        return self._lattice_dimensions
+
+    @property
+    def replicas(self) -> list[bytes]:
+        """Getter for the attribute replicas of the checkpoint.
+
+        Returns
+        -------
+        list[bytes]
+            Encoded conformation of each replica.
+        """
+        return self._replicas
+
+    @property
+    def energies(self) -> list[int]:
+        """Getter for the attribute energies of the checkpoint.
+
+        Returns
+        -------
+        list[int]
+            Energy of each replica.
+        """
+        return self._energies
+
+    @property
+    def optimal_energy(self) -> int:
+        """Getter for the attribute optimal_energy of the checkpoint.
+
+        Returns
+        -------
+        int
+            Best energy found so far.
+        """
+        return self._optimal_energy
+
+    @property
+    def optimal_replica(self) -> bytes:
+        """Getter for the attribute optimal_replica of the checkpoint.
+
+        Returns
+        -------
+        bytes
+            Encoded best conformation found so far.
+        """
+        return self._optimal_replica
+
+    @property
+    def nb_improvements(self) -> int:
+        """Getter for the attribute nb_improvements of the checkpoint.
+
+        Returns
+        -------
+        int
+            Number of improvements of the best energy so far.
+        """
+        return self._nb_improvements
+
+    @property
+    def nb_steps(self) -> int:
+        """Getter for the attribute nb_steps of the checkpoint.
+
+        Returns
+        -------
+        int
+            Number of Monte Carlo steps made so far.
+        """
+        return self._nb_steps
+
+    @property
+    def last_improvement(self) -> int:
+        """Getter for the attribute last_improvement of the checkpoint.
+
+        Returns
+        -------
+        int
+            Iteration of the last improvement of the best energy, from which the patience of the
+            run is counted.
+        """
+        return self._last_improvement
+
+    @property
+    def random_stream(self) -> RandomStream:
+        """Getter for the attribute random_stream of the checkpoint.
+
+        Returns
+        -------
+        RandomStream
+            Random stream of the exchanges of the run.
+        """
+        return self._random_stream
+
+    @property
+    def replica_streams(self) -> list[RandomStream]:
+        """Getter for the attribute replica_streams of the checkpoint.
+
+        Returns
+        -------
+        list[RandomStream]
+            Random stream of each replica.
+        """
+        return self._replica_streams
+
+    @property
+    def temperature_ladder(self) -> TemperatureLadder:
+        """Getter for the attribute temperature_ladder of the checkpoint.
+
+        Returns
+        -------
+        TemperatureLadder
+            Strategy placing the temperatures, with the exchanges it recorded.
+        """
+        return self._temperature_ladder
+
+    def save(self, path: str) -> None:
+        """Writes the checkpoint to a file.
+
+        The checkpoint is first written next to the file, then renamed, so that a crash while
+        writing never leaves a truncated checkpoint behind.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def load(path: str) -> "Checkpoint":
+        """Reads a checkpoint from a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Returns
+        -------
+        Checkpoint
+            Checkpoint of the file.
+        """
+        with open(path, "rb") as file:
+            checkpoint = pickle.load(file)
+        if not isinstance(checkpoint, Checkpoint):
+            raise ValueError(f"{path} is not a REMC checkpoint.")
+        return checkpoint
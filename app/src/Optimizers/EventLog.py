@@ -0,0 +1,132 @@
+import json
+import time
+from typing import IO, Optional
+
+
+class EventLog:
+    """EventLog writes the events of a REMC run to a JSON Lines file for post-run analysis.
+
+    Each event is a compact JSON object holding its name, the time elapsed since the log was
+    opened and its fields. The events are buffered in memory and written by batches, so that
+    recording an event in the optimization loop does not cost a write to the disk.
+    """
+
+    _path: str  # Path of the JSON Lines file
+    _buffer_size: int  # Number of events buffered before they are written
+    _buffer: list[str]  # Encoded events not written yet
+    _file: Optional[IO[str]]  # File of the events, while the log is open
+    _start: float  # Time at which the log was opened
+
+    def __init__(self, path: str, buffer_size: int = 256) -> None:
+        """Constructor for the EventLog class.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON Lines file, overwritten when the log is opened.
+        buffer_size : int, optional
+            Number of events buffered before they are written, by default 256
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1.")
+        self._path = path
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._file = None
+        self._start = time.perf_counter()
+
+    def __enter__(self) -> "EventLog":
+        """Opens the event log when entering a with block.
+
+        Returns
+        -------
+        EventLog
+            The opened event log.
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Writes the buffered events and closes the event log when leaving a with block.
+
+        Parameters
+        ----------
+        exc_type : Optional[type]
+            Type of the exception raised in the block, None if no exception was raised.
+        exc_value : Optional[BaseException]
+            Exception raised in the block, None if no exception was raised.
+        traceback : Optional[TracebackType]
+            Traceback of the exception raised in the block, None if no exception was raised.
+        """
+        self.close()
+
+    @property
+    def path(self) -> str:
+        """Getter for the attribute path of the event log.
+
+        Returns
+        -------
+        str
+            Path of the JSON Lines file.
+        """
+        return self._path
+
+    def open(self) -> None:
+        """Opens the file of the events."""
+        if self._file is None:
+            self._file = open(self._path, "w")
+            self._start = time.perf_counter()
+
+    def emit(self, event: str, **fields: object) -> None:
+        """Records an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        **fields : object
+            JSON-serialisable fields of the event.
+        """
+        if self._file is None:
+            self.open()
+        self._buffer.append(
+            json.dumps(
+                {"event": event, "time": time.perf_counter() - self._start, **fields},
+                separators=(",", ":"),
+            )
+        )
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered events to the file."""
+        if self._file is None or len(self._buffer) == 0:
+            return
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._file.flush()
+        self._buffer = []
+
+    def close(self) -> None:
+        """Writes the buffered events and closes the file."""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    @staticmethod
+    def read(path: str) -> list[dict[str, object]]:
+        """Reads the events of a JSON Lines file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON Lines file.
+
+        Returns
+        -------
+        list[dict[str, object]]
+            Events of the file, in the order they were recorded.
+        """
+        with open(path, "r") as file:
+            return [json.loads(line) for line in file if line.strip()]
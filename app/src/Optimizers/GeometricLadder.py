@@ -0,0 +1,37 @@
+from .TemperatureLadder import TemperatureLadder
+
+
+class GeometricLadder(TemperatureLadder):
+    """GeometricLadder spaces the temperatures of the replicas with a constant ratio between the
+    minimum and the maximum temperature.
+
+    The rungs are closer at low temperatures, where the energies of the replicas are further
+    apart, which keeps the exchange rates between neighbouring rungs more even than a linear
+    ladder does.
+    """
+
+    def create(self, tmin: float, tmax: float, nb_rungs: int) -> list[float]:
+        """Creates the rungs of the ladder.
+
+        Parameters
+        ----------
+        tmin : float
+            Minimum temperature, strictly positive.
+        tmax : float
+            Maximum temperature.
+        nb_rungs : int
+            Number of rungs (one per replica).
+
+        Returns
+        -------
+        list[float]
+            Temperatures of the rungs, in increasing order.
+        """
+        if tmin <= 0:
+            raise ValueError(
+                "The minimum temperature of a geometric ladder must be positive."
+            )
+        if nb_rungs == 1:
+            return [float(tmin)]
+        ratio = (tmax / tmin) ** (1 / (nb_rungs - 1))
+        return [tmin * ratio**rung for rung in range(nb_rungs)]
@@ -0,0 +1,28 @@
+from .TemperatureLadder import TemperatureLadder
+
+
+class LinearLadder(TemperatureLadder):
+    """LinearLadder spaces the temperatures of the replicas evenly between the minimum and the
+    maximum temperature."""
+
+    def create(self, tmin: float, tmax: float, nb_rungs: int) -> list[float]:
+        """Creates the rungs of the ladder.
+
+        Parameters
+        ----------
+        tmin : float
+            Minimum temperature.
+        tmax : float
+            Maximum temperature.
+        nb_rungs : int
+            Number of rungs (one per replica).
+
+        Returns
+        -------
+        list[float]
+            Temperatures of the rungs, in increasing order.
+        """
+        if nb_rungs == 1:
+            return [float(tmin)]
+        step = (tmax - tmin) / (nb_rungs - 1)
+        return [tmin + rung * step for rung in range(nb_rungs)]
@@ -1,23 +1,71 @@
 import copy
+import logging
 import math
-import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+import numpy as np
 
 from ..Controllers.ConformationManager import ConformationManager
 from ..Models.Conformation import Conformation
-from .SimpleMonteCarlo import SimpleMonteCarlo
+from ..Models.RandomStream import RandomStream
+from .AdaptiveLadder import AdaptiveLadder
+from .Checkpoint import Checkpoint
+from .EventLog import EventLog
+from .GeometricLadder import GeometricLadder
+from .LinearLadder import LinearLadder
+from .RemoteReplicaPool import RemoteReplicaPool
+from .ReplicaPool import ReplicaPool
+from .RunProgress import RunProgress
+from .RunStatistics import RunStatistics
+from .TemperatureLadder import TemperatureLadder
+from .TerminationReason import TerminationReason
+
+logger = logging.getLogger(__name__)
+
+# Temperature ladders by name, for the command line and the web interface
+TEMPERATURE_LADDERS = {
+    "geometric": GeometricLadder,
+    "linear": LinearLadder,
+    "adaptive": AdaptiveLadder,
+}
 
 
 class REMC:
     """Class for Replica Exchange Monte Carlo optimization algorithm in the AB-Initio context."""
 
     _max_iters: int = 100  # Maximum number of iterations
+    _max_steps: Optional[int] = None  # Maximum number of Monte Carlo steps
+    _time_budget: Optional[float] = None  # Maximum duration of a run, in seconds
+    _patience: Optional[int] = None  # Maximum number of iterations without improvement
     _phi: int  # Number of search steps.
     _khi: int  # Number of replicas
     _rho: float = 0.0  # Probability to use pull moves
     _conformation_manager: ConformationManager  # Conformation manager
     _tmin: int  # Minimum temperature
     _tmax: int  # Maximum temperature
-    _sampled_temperatures: list[float]  # List of replicas
+    _sampled_temperatures: list[float]  # Temperature of each replica
+    _temperature_ladder: TemperatureLadder  # Strategy placing the temperatures
+    _seed: Optional[Union[int, np.random.SeedSequence]] = None  # Seed of the streams
+    _rng: RandomStream  # Random stream of the exchanges, parent of the replica streams
+    _nb_workers: int = 1  # Number of worker processes sweeping the replicas
+    _asynchronous: bool = False  # Whether replicas are exchanged asynchronously
+    _address: Optional[Tuple[str, int]] = None  # Address for remote workers
+    _authkey: Optional[bytes] = None  # Authentication key of the remote workers
+    _optimal_energy: int  # Best energy found by the current run
+    _optimal_replica: Conformation  # Best conformation found by the current run
+    _optimal_data: Optional[bytes] = None  # Encoded best conformation, once computed
+    _nb_improvements: int  # Number of improvements of the best energy
+    _nb_steps: int = 0  # Number of Monte Carlo steps of the last run
+    _start_time: float = 0.0  # Time at which the current run started
+    _last_improvement: int = 0  # Iteration of the last improvement of the best energy
+    _termination_reason: Optional[TerminationReason] = None  # Why the last run ended
+    _statistics: Optional[RunStatistics] = None  # Statistics of the last run
+    _event_log: Optional[EventLog] = None  # Log recording the events of the runs
+    _checkpoint_path: Optional[str] = None  # File of the checkpoints of the runs
+    _checkpoint_interval: int = 100  # Number of iterations between two checkpoints
+    _checkpoint_writer: Optional[ThreadPoolExecutor] = None  # Thread writing them
 
     def __init__(
         self,
@@ -28,6 +76,18 @@ class REMC:
         conf_manager: ConformationManager,
         max_iter: int = 100,
         rho: float = 0.0,
+        nb_workers: int = 1,
+        asynchronous: bool = False,
+        address: Optional[Tuple[str, int]] = None,
+        authkey: Optional[bytes] = None,
+        event_log: Optional[EventLog] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 100,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        temperature_ladder: Optional[TemperatureLadder] = None,
+        max_steps: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        patience: Optional[int] = None,
     ) -> None:
         """Constructor for the REMC class.
 
@@ -47,8 +107,58 @@ class REMC:
             Maximum number of iterations, by default 100
         rho : float, optional
             Probability to use pull moves, by default 0.0
+        nb_workers : int, optional
+            Number of worker processes sweeping the replicas in parallel, by default 1
+            (the replicas are swept sequentially in this process).
+        asynchronous : bool, optional
+            Whether the replicas exchange their temperatures asynchronously, by default False.
+            Instead of waiting for all the replicas to finish their sweep, each pair of replicas
+            with neighbouring temperatures is exchanged as soon as both have finished theirs.
+        address : Optional[Tuple[str, int]], optional
+            Host and port on which to wait for nb_workers remote workers (see RemoteReplicaPool),
+            by default None (the workers are local processes).
+        authkey : Optional[bytes], optional
+            Authentication key shared with the remote workers, required with an address,
+            by default None
+        event_log : Optional[EventLog], optional
+            Log recording the swaps, improvements and iterations of the runs as JSON Lines,
+            by default None. The traces of the runs are otherwise only sent to the logger of
+            this module, at the INFO and DEBUG levels.
+        checkpoint_path : Optional[str], optional
+            File to which the state of the runs is periodically saved (see Checkpoint), by default
+            None (no checkpoint). Only synchronous runs can be checkpointed.
+        checkpoint_interval : int, optional
+            Number of iterations between two checkpoints, by default 100
+        seed : Optional[Union[int, np.random.SeedSequence]], optional
+            Seed (or seed sequence) of the random stream of the exchanges, from which an
+            independent stream is spawned for each replica at each run, by default None (seeded
+            from the entropy of the system).
+        temperature_ladder : Optional[TemperatureLadder], optional
+            Strategy placing the temperatures of the replicas between tmin and tmax (see
+            LinearLadder, GeometricLadder and AdaptiveLadder), by default None (a geometric
+            ladder).
+        max_steps : Optional[int], optional
+            Maximum number of Monte Carlo steps of a run, by default None (no limit).
+        time_budget : Optional[float], optional
+            Maximum duration of a run, in seconds, by default None (no limit).
+        patience : Optional[int], optional
+            Maximum number of iterations without improvement of the best energy, by default None
+            (no limit).
         """
+        if nb_workers < 1:
+            raise ValueError("nb_workers must be at least 1.")
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1.")
+        if max_steps is not None and max_steps < 1:
+            raise ValueError("max_steps must be at least 1.")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("time_budget must be positive.")
+        if patience is not None and patience < 1:
+            raise ValueError("patience must be at least 1.")
         self._max_iters = max_iter
+        self._max_steps = max_steps
+        self._time_budget = time_budget
+        self._patience = patience
         self._phi = phi
         self._khi = khi
         if tmin > tmax:
@@ -56,9 +166,23 @@ class REMC:
         self._tmin = tmin
         self._tmax = tmax
         self._rho = rho
+        self._nb_workers = nb_workers
+        self._asynchronous = asynchronous
+        if address is not None and authkey is None:
+            raise ValueError("An authkey is required to use remote workers.")
+        self._address = address
+        self._authkey = authkey
+        self._event_log = event_log
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
         self._conformation_manager = conf_manager
 
-        self._sampled_temperatures = random.sample(range(tmin, tmax + 1), khi)
+        self._seed = seed
+        self._rng = RandomStream(seed)
+        self._temperature_ladder = (
+            temperature_ladder if temperature_ladder is not None else GeometricLadder()
+        )
+        self._sampled_temperatures = self._temperature_ladder.create(tmin, tmax, khi)
 
     @property
     def phi(self) -> int:
@@ -82,6 +206,128 @@ class REMC:
         """
         self._phi = phi
 
+    @property
+    def seed(self) -> Optional[Union[int, np.random.SeedSequence]]:
+        """Getter for the attribute seed of the REMC class.
+
+        Returns
+        -------
+        Optional[Union[int, np.random.SeedSequence]]
+            Seed of the random streams, None if they are seeded from the entropy of the system.
+        """
+        return self._seed
+
+    @property
+    def temperature_ladder(self) -> TemperatureLadder:
+        """Getter for the attribute temperature_ladder of the REMC class.
+
+        Returns
+        -------
+        TemperatureLadder
+            Strategy placing the temperatures of the replicas.
+        """
+        return self._temperature_ladder
+
+    @property
+    def max_iter(self) -> int:
+        """Getter for the attribute max_iter of the REMC class.
+
+        Returns
+        -------
+        int
+            Maximum number of iterations.
+        """
+        return self._max_iters
+
+    @max_iter.setter
+    def max_iter(self, max_iter: int) -> None:
+        """Setter for the attribute max_iter of the REMC class.
+
+        Parameters
+        ----------
+        max_iter : int
+            Maximum number of iterations to be assigned.
+        """
+        self._max_iters = max_iter
+
+    @property
+    def max_steps(self) -> Optional[int]:
+        """Getter for the attribute max_steps of the REMC class.
+
+        Returns
+        -------
+        Optional[int]
+            Maximum number of Monte Carlo steps of a run, None if there is no limit.
+        """
+        return self._max_steps
+
+    @max_steps.setter
+    def max_steps(self, max_steps: Optional[int]) -> None:
+        """Setter for the attribute max_steps of the REMC class.
+
+        Parameters
+        ----------
+        max_steps : Optional[int]
+            Maximum number of Monte Carlo steps of a run to be assigned.
+        """
+        self._max_steps = max_steps
+
+    @property
+    def time_budget(self) -> Optional[float]:
+        """Getter for the attribute time_budget of the REMC class.
+
+        Returns
+        -------
+        Optional[float]
+            Maximum duration of a run, in seconds, None if there is no limit.
+        """
+        return self._time_budget
+
+    @time_budget.setter
+    def time_budget(self, time_budget: Optional[float]) -> None:
+        """Setter for the attribute time_budget of the REMC class.
+
+        Parameters
+        ----------
+        time_budget : Optional[float]
+            Maximum duration of a run, in seconds, to be assigned.
+        """
+        self._time_budget = time_budget
+
+    @property
+    def patience(self) -> Optional[int]:
+        """Getter for the attribute patience of the REMC class.
+
+        Returns
+        -------
+        Optional[int]
+            Maximum number of iterations without improvement of the best energy, None if there
+            is no limit.
+        """
+        return self._patience
+
+    @patience.setter
+    def patience(self, patience: Optional[int]) -> None:
+        """Setter for the attribute patience of the REMC class.
+
+        Parameters
+        ----------
+        patience : Optional[int]
+            Maximum number of iterations without improvement of the best energy to be assigned.
+        """
+        self._patience = patience
+
+    @property
+    def termination_reason(self) -> Optional[TerminationReason]:
+        """Getter for the attribute termination_reason of the REMC class.
+
+        Returns
+        -------
+        Optional[TerminationReason]
+            Reason for which the last run ended, None before the end of the first run.
+        """
+        return self._termination_reason
+
     @property
     def rho(self) -> float:
         """Getter for the attribute rho of the REMC class.
@@ -104,6 +350,153 @@ class REMC:
         """
         self._rho = rho
 
+    @property
+    def nb_workers(self) -> int:
+        """Getter for the attribute nb_workers of the REMC class.
+
+        Returns
+        -------
+        int
+            Number of worker processes sweeping the replicas.
+        """
+        return self._nb_workers
+
+    @nb_workers.setter
+    def nb_workers(self, nb_workers: int) -> None:
+        """Setter for the attribute nb_workers of the REMC class.
+
+        Parameters
+        ----------
+        nb_workers : int
+            Number of worker processes sweeping the replicas to be assigned.
+        """
+        if nb_workers < 1:
+            raise ValueError("nb_workers must be at least 1.")
+        self._nb_workers = nb_workers
+
+    @property
+    def asynchronous(self) -> bool:
+        """Getter for the attribute asynchronous of the REMC class.
+
+        Returns
+        -------
+        bool
+            Whether the replicas exchange their temperatures asynchronously.
+        """
+        return self._asynchronous
+
+    @asynchronous.setter
+    def asynchronous(self, asynchronous: bool) -> None:
+        """Setter for the attribute asynchronous of the REMC class.
+
+        Parameters
+        ----------
+        asynchronous : bool
+            Whether the replicas exchange their temperatures asynchronously to be assigned.
+        """
+        self._asynchronous = asynchronous
+
+    @property
+    def event_log(self) -> Optional[EventLog]:
+        """Getter for the attribute event_log of the REMC class.
+
+        Returns
+        -------
+        Optional[EventLog]
+            Log recording the events of the runs, None if they are not recorded.
+        """
+        return self._event_log
+
+    @event_log.setter
+    def event_log(self, event_log: Optional[EventLog]) -> None:
+        """Setter for the attribute event_log of the REMC class.
+
+        Parameters
+        ----------
+        event_log : Optional[EventLog]
+            Log recording the events of the runs to be assigned.
+        """
+        self._event_log = event_log
+
+    @property
+    def checkpoint_path(self) -> Optional[str]:
+        """Getter for the attribute checkpoint_path of the REMC class.
+
+        Returns
+        -------
+        Optional[str]
+            File to which the state of the runs is periodically saved, None if it is not.
+        """
+        return self._checkpoint_path
+
+    @checkpoint_path.setter
+    def checkpoint_path(self, checkpoint_path: Optional[str]) -> None:
+        """Setter for the attribute checkpoint_path of the REMC class.
+
+        Parameters
+        ----------
+        checkpoint_path : Optional[str]
+            File to which the state of the runs is periodically saved to be assigned.
+        """
+        self._checkpoint_path = checkpoint_path
+
+    @property
+    def checkpoint_interval(self) -> int:
+        """Getter for the attribute checkpoint_interval of the REMC class.
+
+        Returns
+        -------
+        int
+            Number of iterations between two checkpoints.
+        """
+        return self._checkpoint_interval
+
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, checkpoint_interval: int) -> None:
+        """Setter for the attribute checkpoint_interval of the REMC class.
+
+        Parameters
+        ----------
+        checkpoint_interval : int
+            Number of iterations between two checkpoints to be assigned.
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1.")
+        self._checkpoint_interval = checkpoint_interval
+
+    @property
+    def nb_steps(self) -> int:
+        """Getter for the number of Monte Carlo steps of the last run.
+
+        Returns
+        -------
+        int
+            Number of Monte Carlo steps made by all the replicas during the last optimization.
+        """
+        return self._nb_steps
+
+    @property
+    def optimal_replica(self) -> Conformation:
+        """Getter for the best conformation found by the current (or last) run.
+
+        Returns
+        -------
+        Conformation
+            Best conformation found so far.
+        """
+        return self._optimal_replica
+
+    @property
+    def statistics(self) -> Optional[RunStatistics]:
+        """Getter for the statistics of the last run.
+
+        Returns
+        -------
+        Optional[RunStatistics]
+            Counters and phase timings of the last optimization, None before the first one.
+        """
+        return self._statistics
+
     @property
     def conformation_manager(self) -> ConformationManager:
         """Getter for the attribute conformation_manager of the REMC class.
@@ -192,84 +585,635 @@ class REMC:
         """
         self._tmax = tmax
 
-    def optimize(self, conformation: Conformation, e_star: int) -> Conformation:
+    def _accept_exchange(
+        self, rung: int, i: int, j: int, energy_i: int, energy_j: int
+    ) -> bool:
+        """Applies the Metropolis criterion to the exchange of the temperatures of two replicas.
+
+        The exchange is recorded in the statistics of the run and by the temperature ladder.
+
+        Parameters
+        ----------
+        rung : int
+            Lowest of the rungs of the two replicas on the temperature ladder.
+        i : int
+            Index of the first replica.
+        j : int
+            Index of the second replica.
+        energy_i : int
+            Energy of the first replica.
+        energy_j : int
+            Energy of the second replica.
+
+        Returns
+        -------
+        bool
+            True if the temperatures of the replicas must be exchanged, False otherwise.
+        """
+        delta = (
+            1 / self._sampled_temperatures[j] - 1 / self._sampled_temperatures[i]
+        ) * (energy_i - energy_j)
+        accepted = delta <= 0 or self._rng.random() <= math.exp(-delta)
+        self._statistics.record_swap(rung, accepted)
+        self._temperature_ladder.record_swap(rung, accepted)
+        return accepted
+
+    def _exchange_temperatures(self, i: int, j: int) -> None:
+        """Exchanges the temperatures of two replicas.
+
+        Parameters
+        ----------
+        i : int
+            Index of the first replica.
+        j : int
+            Index of the second replica.
+        """
+        self._sampled_temperatures[i], self._sampled_temperatures[j] = (
+            self._sampled_temperatures[j],
+            self._sampled_temperatures[i],
+        )
+        logger.debug(
+            "Temperatures of replicas %d and %d exchanged : %s",
+            i,
+            j,
+            self._sampled_temperatures,
+        )
+        if self._event_log is not None:
+            self._event_log.emit(
+                "swap",
+                replicas=[i, j],
+                temperatures=[
+                    self._sampled_temperatures[i],
+                    self._sampled_temperatures[j],
+                ],
+            )
+
+    def _retune_temperatures(self, ladder: list[int]) -> None:
+        """Lets the temperature ladder retune the temperatures of the replicas.
+
+        Parameters
+        ----------
+        ladder : list[int]
+            Replicas ranked by temperature.
+        """
+        rungs = [self._sampled_temperatures[k] for k in ladder]
+        retuned = self._temperature_ladder.retune(rungs)
+        if retuned == rungs:
+            return
+
+        for k, temperature in zip(ladder, retuned):
+            self._sampled_temperatures[k] = temperature
+        logger.debug("Temperatures retuned : %s", self._sampled_temperatures)
+        if self._event_log is not None:
+            self._event_log.emit("retune", temperatures=list(retuned))
+
+    def optimize(
+        self,
+        conformation: Conformation,
+        e_star: int,
+        checkpoint: Optional[Checkpoint] = None,
+        callback: Optional[Callable[[RunProgress], Optional[bool]]] = None,
+        every: int = 1,
+    ) -> Conformation:
         """Optimizes a conformation using the REMC algorithm.
 
+        See stream for the details of the run.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            Conformation to be optimized.
+        e_star : int
+            Optimal (Theoretical) Energy of the protein in the HP-Model.
+        checkpoint : Optional[Checkpoint], optional
+            Checkpoint of a run to be resumed (see Checkpoint.load), by default None
+        callback : Optional[Callable[[RunProgress], Optional[bool]]], optional
+            Function called with a snapshot of the run every few iterations, by default None.
+            The run stops early when it returns True.
+        every : int, optional
+            Number of iterations between two calls of the callback, by default 1
+
+        Returns
+        -------
+        Conformation
+            Optimized conformation. The counters and timings of the run are then available
+            through the statistics attribute.
+        """
+        progress = self.stream(
+            conformation, e_star, checkpoint, every if callback is not None else None
+        )
+        try:
+            for snapshot in progress:
+                if callback(snapshot):
+                    break
+        finally:
+            progress.close()
+        return self._optimal_replica
+
+    def stream(
+        self,
+        conformation: Conformation,
+        e_star: int,
+        checkpoint: Optional[Checkpoint] = None,
+        every: Optional[int] = 1,
+    ) -> Iterator[RunProgress]:
+        """Optimizes a conformation using the REMC algorithm, yielding snapshots of the run.
+
+        The replicas are swept by worker processes when nb_workers is greater than 1. Their positions
+        and energies are kept in shared memory, which the workers update in place and from which
+        the energies of the exchange step and the best conformation are read. With an address, the
+        workers are remote processes which own their replicas and only send back their energies.
+
+        A synchronous run resumed from a checkpoint continues with the replicas, temperatures,
+        random streams and best conformation of the checkpoint, so it draws the same numbers as
+        the run which was checkpointed.
+
+        The run ends when the best energy reaches e_star, when every replica completed max_iter
+        iterations, or as soon as an iteration exceeds one of the budgets of the run (max_steps,
+        time_budget or patience), the reason being given by the termination_reason attribute.
+
         Parameters
         ----------
         conformation : Conformation
             Conformation to be optimized.
         e_star : int
             Optimal (Theoretical) Energy of the protein in the HP-Model.
+        checkpoint : Optional[Checkpoint], optional
+            Checkpoint of a run to be resumed (see Checkpoint.load), by default None
+        every : Optional[int], optional
+            Number of iterations between two snapshots, by default 1. No snapshot is taken when
+            it is None.
+
+        Yields
+        ------
+        RunProgress
+            Snapshot of the run. Closing the generator stops the run, after which the best
+            conformation found is given by the optimal_replica attribute, and the counters and
+            timings of the run by the statistics attribute.
+        """
+        self._start_time = time.perf_counter()
+        if every is not None and every < 1:
+            raise ValueError("every must be at least 1.")
+        if self._asynchronous and (
+            checkpoint is not None or self._checkpoint_path is not None
+        ):
+            raise ValueError("Asynchronous runs cannot be checkpointed.")
+
+        self._statistics = RunStatistics()
+        self._optimal_energy = conformation.compute_energy()
+        self._optimal_replica = conformation.copy()
+        self._optimal_data = None
+        self._nb_improvements = 0
+        self._nb_steps = 0
+        self._last_improvement = 0
+        self._termination_reason = None
+
+        conformations = None
+        if checkpoint is None:
+            random_streams = self._rng.spawn(self._khi)
+        else:
+            self._rng = copy.deepcopy(checkpoint.random_stream)
+            random_streams = copy.deepcopy(checkpoint.replica_streams)
+            conformations = [
+                self._decode(conformation, data, energy)
+                for data, energy in zip(checkpoint.replicas, checkpoint.energies)
+            ]
+            self._sampled_temperatures = list(checkpoint.temperatures)
+            self._temperature_ladder = copy.deepcopy(checkpoint.temperature_ladder)
+            self._optimal_energy = checkpoint.optimal_energy
+            self._optimal_replica = self._decode(
+                conformation, checkpoint.optimal_replica, checkpoint.optimal_energy
+            )
+            self._nb_improvements = checkpoint.nb_improvements
+            self._nb_steps = checkpoint.nb_steps
+            self._last_improvement = checkpoint.last_improvement
+
+        logger.info("Initial energy : %d", self._optimal_energy)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initial coords : %s", self._optimal_replica.amino_acid_coordinates
+            )
+        logger.info("Initial temperatures : %s", self._sampled_temperatures)
+        if self._event_log is not None:
+            self._event_log.emit(
+                "start",
+                energy=int(self._optimal_energy),
+                temperatures=list(self._sampled_temperatures),
+            )
+
+        if self._address is not None:
+            pool = RemoteReplicaPool(
+                conformation,
+                self._khi,
+                self._phi,
+                self._rho,
+                self._conformation_manager,
+                self._nb_workers,
+                self._address,
+                self._authkey,
+                conformations,
+                random_streams,
+            )
+        else:
+            pool = ReplicaPool(
+                conformation,
+                self._khi,
+                self._phi,
+                self._rho,
+                self._conformation_manager,
+                self._nb_workers,
+                conformations,
+                random_streams,
+            )
+
+        if self._checkpoint_path is not None:
+            self._checkpoint_writer = ThreadPoolExecutor(max_workers=1)
+        stopped = False
+        try:
+            with pool as replicas:
+                try:
+                    if self._asynchronous:
+                        yield from self._optimize_asynchronous(replicas, e_star, every)
+                    else:
+                        yield from self._optimize_synchronous(
+                            replicas, e_star, checkpoint, every
+                        )
+                except GeneratorExit:
+                    # The caller stopped the run
+                    stopped = True
+                self._statistics.replicas = replicas.get_statistics()
+
+            if stopped:
+                self._termination_reason = TerminationReason.STOPPED
+            elif self._optimal_energy <= e_star:
+                self._termination_reason = TerminationReason.E_STAR
+            elif self._termination_reason is None:
+                self._termination_reason = TerminationReason.MAX_ITERATIONS
+            logger.info(
+                "Optimized %d times, new energy : %d (%s)",
+                self._nb_improvements,
+                self._optimal_energy,
+                self._termination_reason,
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "New coords : %s", self._optimal_replica.amino_acid_coordinates
+                )
+            if self._event_log is not None:
+                self._event_log.emit(
+                    "end",
+                    energy=int(self._optimal_energy),
+                    nb_improvements=self._nb_improvements,
+                    nb_steps=self._nb_steps,
+                    nb_iterations=self._statistics.nb_iterations,
+                    stopped=stopped,
+                    reason=str(self._termination_reason),
+                )
+        finally:
+            if self._checkpoint_writer is not None:
+                # The last checkpoint must be on the disk when the run returns
+                self._checkpoint_writer.shutdown(wait=True)
+                self._checkpoint_writer = None
+            if self._event_log is not None:
+                self._event_log.flush()
+
+    def _take_snapshot(
+        self,
+        replicas: ReplicaPool,
+        iteration: int,
+        energies: Optional[list[int]] = None,
+    ) -> RunProgress:
+        """Takes a snapshot of the run.
+
+        Parameters
+        ----------
+        replicas : ReplicaPool
+            Replicas of the run.
+        iteration : int
+            Number of iterations completed by every replica.
+        energies : Optional[list[int]], optional
+            Energy of each replica, by default None (read from the pool).
+
+        Returns
+        -------
+        RunProgress
+            Snapshot of the run.
+        """
+        if energies is None:
+            energies = [replicas.get_energy(k) for k in range(self._khi)]
+        if self._optimal_data is None:
+            # The best conformation is only encoded again after it improved
+            self._optimal_data = self._optimal_replica.encode()
+        return RunProgress(
+            iteration,
+            self._nb_steps,
+            [int(energy) for energy in energies],
+            list(self._sampled_temperatures),
+            int(self._optimal_energy),
+            self._optimal_data,
+        )
+
+    def _decode(
+        self, conformation: Conformation, data: bytes, energy: int
+    ) -> Conformation:
+        """Decodes a conformation saved in a checkpoint.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            Conformation giving the protein and the lattice of the run.
+        data : bytes
+            Compact form of the conformation.
+        energy : int
+            Energy of the conformation.
 
         Returns
         -------
         Conformation
-            Optimized conformation.
+            Decoded conformation.
         """
-        MonteCarlo = SimpleMonteCarlo(self._phi)
+        lattice = type(conformation.lattice)(conformation.lattice.dimensions)
+        decoded = type(conformation).decode(conformation.protein, lattice, data)
+        decoded.computed_energy = energy
+        return decoded
 
-        optimal_energy = conformation.compute_energy()
-        optimal_replica = copy.deepcopy(conformation)
-        replicas = self._khi * [copy.deepcopy(conformation)]
+    def _save_checkpoint(
+        self, replicas: ReplicaPool, energies: list[int], iteration: int, offset: int
+    ) -> None:
+        """Takes a checkpoint of the run and writes it in the background.
 
+        Parameters
+        ----------
+        replicas : ReplicaPool
+            Replicas of the run.
+        energies : list[int]
+            Energy of each replica.
+        iteration : int
+            Next iteration of the run.
+        offset : int
+            Offset of the next exchange step.
+        """
+        checkpoint = Checkpoint(
+            iteration,
+            offset,
+            list(self._sampled_temperatures),
+            tuple(self._optimal_replica.lattice.dimensions),
+            [replicas.get_conformation(k).encode() for k in range(self._khi)],
+            [int(energy) for energy in energies],
+            int(self._optimal_energy),
+            self._optimal_replica.encode(),
+            self._nb_improvements,
+            self._nb_steps,
+            self._last_improvement,
+            copy.deepcopy(self._rng),
+            replicas.get_random_streams(),
+            copy.deepcopy(self._temperature_ladder),
+        )
+        # Only the snapshot is taken in the loop, the file is written by another thread
+        self._checkpoint_writer.submit(checkpoint.save, self._checkpoint_path)
+        logger.debug("Checkpoint taken before iteration %d", iteration)
+
+    def _exceeds_budget(self, iteration: int) -> Optional[TerminationReason]:
+        """Checks the budgets of the run, after an iteration.
+
+        Parameters
+        ----------
+        iteration : int
+            Number of iterations completed by every replica.
+
+        Returns
+        -------
+        Optional[TerminationReason]
+            Budget exceeded by the run, None if the run can go on.
+        """
+        if (
+            self._time_budget is not None
+            and time.perf_counter() - self._start_time >= self._time_budget
+        ):
+            return TerminationReason.TIME_BUDGET
+        if self._max_steps is not None and self._nb_steps >= self._max_steps:
+            return TerminationReason.MAX_STEPS
+        if (
+            self._patience is not None
+            and iteration - self._last_improvement >= self._patience
+        ):
+            return TerminationReason.STAGNATION
+        return None
+
+    def _update_optimum(self, replicas: ReplicaPool, k: int, energy: int) -> None:
+        """Keeps a copy of a replica if it improves the optimal energy.
+
+        Parameters
+        ----------
+        replicas : ReplicaPool
+            Replicas of the run.
+        k : int
+            Index of the replica.
+        energy : int
+            Energy of the replica.
+        """
+        if energy < self._optimal_energy:
+            self._nb_improvements += 1
+            self._optimal_energy = energy
+            self._optimal_replica = replicas.get_conformation(k)
+            self._optimal_data = None
+            logger.info("New optimal energy : %d (replica %d)", energy, k)
+            if self._event_log is not None:
+                self._event_log.emit(
+                    "improvement",
+                    replica=k,
+                    energy=int(energy),
+                    nb_steps=self._nb_steps,
+                    positions=self._optimal_replica.positions.tolist(),
+                )
+
+    def _optimize_synchronous(
+        self,
+        replicas: ReplicaPool,
+        e_star: int,
+        checkpoint: Optional[Checkpoint] = None,
+        every: Optional[int] = None,
+    ) -> Iterator[RunProgress]:
+        """Runs REMC iterations where all the replicas are swept before the exchange step.
+
+        Parameters
+        ----------
+        replicas : ReplicaPool
+            Replicas of the run.
+        e_star : int
+            Optimal (Theoretical) Energy of the protein in the HP-Model.
+        checkpoint : Optional[Checkpoint], optional
+            Checkpoint from which the iterations are resumed, by default None
+        every : Optional[int], optional
+            Number of iterations between two snapshots, by default None (no snapshot).
+
+        Yields
+        ------
+        RunProgress
+            Snapshot of the run.
+        """
         offset = 0
         iters = 1
+        if checkpoint is not None:
+            offset = checkpoint.offset
+            iters = checkpoint.iteration
+        # Replicas ranked by temperature
+        ladder = sorted(range(self._khi), key=lambda k: self._sampled_temperatures[k])
 
-        entered = 0
-
-        print(12 * "####")
-        print(f"=> Initial energy : {str(optimal_energy)}")
-        print(f"=> Initial coords : {str(optimal_replica.amino_acid_coordinates)}")
-        print(f"=> Initial temperatures : {str(self._sampled_temperatures)}")
+        while (self._optimal_energy > e_star) and (iters <= self._max_iters):
+            logger.debug("REMC : iteration %d/%d", iters, self._max_iters)
+            # We optimise the replicas
+            start = time.perf_counter()
+            energies = replicas.sweep(self._sampled_temperatures)
+            self._nb_steps += self._khi * self._phi
+            exchange_start = time.perf_counter()
+            self._statistics.record_sweep_phase(exchange_start - start)
 
-        while (optimal_energy > e_star) and (iters <= self._max_iters):
-            print(f"******REMC : ITERATION {iters}/{self._max_iters}*******")
+            nb_improvements = self._nb_improvements
             for k in range(self._khi):
-                # We optimise the replicas
-                replicas[k] = MonteCarlo.optimize(
-                    replicas[k],
-                    self._sampled_temperatures[k],
-                    self._conformation_manager,
+                self._update_optimum(replicas, k, energies[k])
+            if self._nb_improvements > nb_improvements:
+                self._last_improvement = iters
+            if self._event_log is not None:
+                self._event_log.emit(
+                    "iteration",
+                    iteration=iters,
+                    energies=[int(energy) for energy in energies],
+                    temperatures=list(self._sampled_temperatures),
                 )
 
-                if replicas[k].computed_energy < optimal_energy:
-                    entered += 1
-                    optimal_energy = replicas[k].computed_energy
-                    optimal_replica = copy.deepcopy(replicas[k])
-                    print(f"New optimal energy : {str(optimal_energy)} !")
-
-            i = offset + 1
-            while i + 1 < self._khi:
-                j = i + 1
-                delta = (
-                    1 / self._sampled_temperatures[j]
-                    - 1 / self._sampled_temperatures[i]
-                ) * (replicas[i].computed_energy - replicas[j].computed_energy)
-                if delta <= 0:
-                    self._sampled_temperatures[i], self._sampled_temperatures[j] = (
-                        self._sampled_temperatures[j],
-                        self._sampled_temperatures[i],
+            # Replicas on neighbouring rungs of the ladder are exchanged
+            rank = offset
+            while rank + 1 < self._khi:
+                i, j = ladder[rank], ladder[rank + 1]
+                accepted = self._accept_exchange(rank, i, j, energies[i], energies[j])
+                if accepted:
+                    self._exchange_temperatures(i, j)
+                    ladder[rank], ladder[rank + 1] = j, i
+                rank += 2
+            self._retune_temperatures(ladder)
+
+            self._statistics.record_exchange_phase(time.perf_counter() - exchange_start)
+            iters += 1
+            offset = 1 - offset
+            self._statistics.nb_iterations = iters - 1
+
+            if (
+                self._checkpoint_writer is not None
+                and (iters - 1) % self._checkpoint_interval == 0
+            ):
+                self._save_checkpoint(replicas, energies, iters, offset)
+            if every is not None and (iters - 1) % every == 0:
+                yield self._take_snapshot(replicas, iters - 1, energies)
+
+            self._termination_reason = self._exceeds_budget(iters - 1)
+            if self._termination_reason is not None:
+                break
+
+    def _optimize_asynchronous(
+        self, replicas: ReplicaPool, e_star: int, every: Optional[int] = None
+    ) -> Iterator[RunProgress]:
+        """Runs REMC iterations where each replica only waits for its exchange partner.
+
+        The replicas are ranked by temperature. At the r-th iteration of a replica ranked p, its
+        partner is the replica ranked p + 1 if p and r have the same parity, p - 1 otherwise (as the
+        alternating offset of the synchronous exchange step). The pair is exchanged as soon as both
+        replicas have finished their r-th sweep, then both are swept again, so a slow replica only
+        delays its neighbours on the temperature ladder.
+
+        Parameters
+        ----------
+        replicas : ReplicaPool
+            Replicas of the run.
+        e_star : int
+            Optimal (Theoretical) Energy of the protein in the HP-Model.
+        every : Optional[int], optional
+            Number of iterations completed by every replica between two snapshots, by default
+            None (no snapshot).
+
+        Yields
+        ------
+        RunProgress
+            Snapshot of the run.
+        """
+        # Replicas ranked by temperature, and iteration of each replica
+        ladder = sorted(range(self._khi), key=lambda k: self._sampled_temperatures[k])
+        iterations = [1] * self._khi
+        # Replica waiting for its partner at each rank of the ladder (replica, rank of the partner)
+        waiting = {}
+        # Iteration of the last snapshot
+        last_snapshot = 0
+
+        for k in range(self._khi):
+            replicas.submit(k, self._sampled_temperatures[k])
+
+        while self._optimal_energy > e_star:
+            start = time.perf_counter()
+            finished = replicas.wait_finished()
+            self._nb_steps += len(finished) * self._phi
+            exchange_start = time.perf_counter()
+            self._statistics.record_sweep_phase(exchange_start - start)
+            nb_improvements = self._nb_improvements
+            for k in finished:
+                self._update_optimum(replicas, k, replicas.get_energy(k))
+                if self._event_log is not None:
+                    self._event_log.emit(
+                        "sweep",
+                        replica=k,
+                        iteration=iterations[k],
+                        energy=int(replicas.get_energy(k)),
+                        temperature=self._sampled_temperatures[k],
                     )
-                    print(
-                        f"=> Temperature swipe made : {str(self._sampled_temperatures)}"
+
+            ready = []
+            for k in finished:
+                rank = ladder.index(k)
+                partner_rank = rank + 1 if rank % 2 == iterations[k] % 2 else rank - 1
+
+                if not 0 <= partner_rank < self._khi:
+                    # The replica is at an end of the ladder and has no partner at this iteration
+                    ready.append(k)
+                elif waiting.get(partner_rank, (None, None))[1] == rank:
+                    j, _ = waiting.pop(partner_rank)
+                    accepted = self._accept_exchange(
+                        min(rank, partner_rank),
+                        k,
+                        j,
+                        replicas.get_energy(k),
+                        replicas.get_energy(j),
                     )
+                    if accepted:
+                        self._exchange_temperatures(k, j)
+                        ladder[rank], ladder[partner_rank] = j, k
+                    ready.extend((k, j))
                 else:
-                    q = random.uniform(0, 1)
-                    if q <= math.exp(-delta):
-                        self._sampled_temperatures[i], self._sampled_temperatures[j] = (
-                            self._sampled_temperatures[j],
-                            self._sampled_temperatures[i],
-                        )
-                        print(
-                            f"=> Temperature swipe made : {str(self._sampled_temperatures)}"
-                        )
-                i += 2
+                    waiting[rank] = (k, partner_rank)
 
-            iters += 1
-            offset = 1 - offset
+            for k in ready:
+                iterations[k] += 1
+                if iterations[k] <= self._max_iters:
+                    replicas.submit(k, self._sampled_temperatures[k])
+            self._statistics.record_exchange_phase(time.perf_counter() - exchange_start)
+
+            completed = min(iterations) - 1
+            previous, self._statistics.nb_iterations = (
+                self._statistics.nb_iterations,
+                completed,
+            )
+            for _ in range(completed - previous):
+                self._retune_temperatures(ladder)
+            if self._nb_improvements > nb_improvements:
+                self._last_improvement = completed
+            # The completed iterations can jump past a multiple of every between two passes
+            if every is not None and completed // every > last_snapshot // every:
+                last_snapshot = completed
+                yield self._take_snapshot(replicas, completed)
+
+            self._termination_reason = self._exceeds_budget(completed)
+            if self._termination_reason is not None:
+                break
 
-        print(f"Optimized {entered} times")
-        print(f"New Energy : {str(optimal_energy)}")
-        print(f"New coords : {str(optimal_replica.amino_acid_coordinates)}")
-        return optimal_replica
+            if len(waiting) == 0 and all(
+                iteration > self._max_iters for iteration in iterations
+            ):
+                break
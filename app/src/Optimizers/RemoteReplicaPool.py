@@ -0,0 +1,344 @@
+import argparse
+import multiprocessing.connection
+import socket
+import time
+from collections import deque
+from multiprocessing.connection import Client
+from typing import Optional, Tuple
+
+from ..Controllers.ConformationManager import ConformationManager
+from ..Models.Conformation import Conformation
+from ..Models.RandomStream import RandomStream
+from .ReplicaPool import ReplicaPool
+from .ReplicaStatistics import ReplicaStatistics
+from .SimpleMonteCarlo import SimpleMonteCarlo
+
+
+def run_remote_replica_worker(
+    address: Tuple[str, int], authkey: bytes, timeout: float = 60.0
+) -> None:
+    """Connects to a REMC coordinator and sweeps the replicas it assigns to this worker.
+
+    The coordinator sends the initial conformations and the indices of the replicas once, then
+    only the temperatures of the sweeps. The worker answers with the energies of its replicas,
+    and with their encoded positions when the coordinator asks for them.
+
+    Parameters
+    ----------
+    address : Tuple[str, int]
+        Host and port of the coordinator.
+    authkey : bytes
+        Authentication key shared with the coordinator.
+    timeout : float, optional
+        Time in seconds to wait for the coordinator to accept connections, by default 60.0
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+            break
+        except ConnectionRefusedError:
+            # The coordinator is not listening yet
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+    command, argument = connection.recv()
+    if command != "init":
+        raise ValueError(f"Unexpected command from the coordinator : {command}")
+    conformations, replica_indices, phi, rho, random_streams = argument
+    # The replicas starting from the same conformation are received as a single object
+    replicas = [conformation.copy() for conformation in conformations]
+
+    monte_carlo = SimpleMonteCarlo(phi, rho)
+    conf_manager = ConformationManager(replicas[0].protein)
+    statistics = [ReplicaStatistics() for _ in replica_indices]
+
+    while True:
+        command, argument = connection.recv()
+        if command == "sweep":
+            for i, replica in enumerate(replicas):
+                monte_carlo.optimize(
+                    replica, argument[i], conf_manager, statistics[i], random_streams[i]
+                )
+            connection.send([replica.computed_energy for replica in replicas])
+        elif command == "sweep_one":
+            k, temperature = argument
+            i = k - replica_indices.start
+            monte_carlo.optimize(
+                replicas[i], temperature, conf_manager, statistics[i], random_streams[i]
+            )
+            connection.send((k, replicas[i].computed_energy))
+        elif command == "get":
+            connection.send(replicas[argument - replica_indices.start].encode())
+        elif command == "statistics":
+            connection.send(statistics)
+        elif command == "random_streams":
+            connection.send(random_streams)
+        elif command == "stop":
+            break
+
+    connection.close()
+
+
+class RemoteReplicaPool(ReplicaPool):
+    """Class that holds the replicas of a REMC run in remote workers connected over TCP.
+
+    The workers own their replicas: the coordinator only sends temperatures and receives
+    energies, which is all it needs for the exchange decisions. The positions of a replica are
+    only transferred when it improves the best energy.
+    """
+
+    _address: Tuple[str, int]  # Host and port on which the coordinator listens
+    _authkey: bytes  # Authentication key shared with the workers
+    _listener: Optional[socket.socket]  # Socket accepting the connections of the workers
+    _connect_timeout: float  # Time in seconds given to the workers to connect
+    _energies: list[int]  # Last energy received for each replica
+    _finished: list[int]  # Replicas whose sweep finished during another request
+
+    def __init__(
+        self,
+        conformation: Conformation,
+        nb_replicas: int,
+        phi: int,
+        rho: float,
+        conf_manager: ConformationManager,
+        nb_workers: int,
+        address: Tuple[str, int],
+        authkey: bytes,
+        conformations: Optional[list[Conformation]] = None,
+        random_streams: Optional[list[RandomStream]] = None,
+        connect_timeout: float = 300.0,
+    ) -> None:
+        """Constructor for the RemoteReplicaPool class.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            Initial conformation of the replicas.
+        nb_replicas : int
+            Number of replicas.
+        phi : int
+            Number of search steps of a sweep.
+        rho : float
+            Probability to use pull moves.
+        conf_manager : ConformationManager
+            Conformation manager of the coordinator.
+        nb_workers : int
+            Number of remote workers to wait for.
+        address : Tuple[str, int]
+            Host and port on which the coordinator listens.
+        authkey : bytes
+            Authentication key shared with the workers.
+        conformations : Optional[list[Conformation]], optional
+            Initial conformation of each replica, with its computed energy, by default None
+            (all the replicas start from conformation).
+        random_streams : Optional[list[RandomStream]], optional
+            Random stream of each replica, by default None (independent unseeded streams).
+        connect_timeout : float, optional
+            Time in seconds given to all the workers to connect when the pool starts, by default
+            300.0
+        """
+        if connect_timeout <= 0:
+            raise ValueError("connect_timeout must be positive.")
+        super().__init__(
+            conformation,
+            nb_replicas,
+            phi,
+            rho,
+            conf_manager,
+            nb_workers,
+            conformations,
+            random_streams,
+        )
+        self._address = address
+        self._authkey = authkey
+        self._listener = None
+        self._connect_timeout = connect_timeout
+        self._energies = []
+        self._finished = []
+
+    def start(self) -> None:
+        """Waits for the workers to connect and assigns them their replicas.
+
+        Raises
+        ------
+        TimeoutError
+            If some workers did not connect in time. The pool is closed and the connected workers
+            are stopped.
+        """
+        self._split_replicas()
+        self._energies = [
+            self._get_initial_conformation(k).computed_energy
+            for k in range(self._nb_replicas)
+        ]
+
+        self._listener = socket.create_server(self._address)
+        deadline = time.monotonic() + self._connect_timeout
+        for replicas in self._slices:
+            connection = self._accept(deadline)
+            connection.send(
+                (
+                    "init",
+                    (
+                        [self._get_initial_conformation(k) for k in replicas],
+                        replicas,
+                        self._monte_carlo.phi,
+                        self._monte_carlo.rho,
+                        self._random_streams[replicas.start : replicas.stop],
+                    ),
+                )
+            )
+            self._connections.append(connection)
+
+    def _accept(self, deadline: float) -> multiprocessing.connection.Connection:
+        """Accepts the connection of the next worker.
+
+        Parameters
+        ----------
+        deadline : float
+            Time (from time.monotonic) by which the worker must connect.
+
+        Returns
+        -------
+        multiprocessing.connection.Connection
+            Connection to the worker.
+
+        Raises
+        ------
+        TimeoutError
+            If the worker did not connect by the deadline.
+        """
+        # Listener.accept has no timeout, the socket is accepted here with the handshake of
+        # Listener.accept so that the workers still connect with Client
+        self._listener.settimeout(max(deadline - time.monotonic(), 0.001))
+        try:
+            sock, _ = self._listener.accept()
+        except socket.timeout:
+            nb_workers = len(self._slices)
+            nb_missing = nb_workers - len(self._connections)
+            self.close()
+            raise TimeoutError(
+                f"{nb_missing} of the {nb_workers} remote workers did not connect to "
+                f"{self._address[0]}:{self._address[1]} within {self._connect_timeout} seconds."
+            ) from None
+
+        sock.setblocking(True)
+        connection = multiprocessing.connection.Connection(sock.detach())
+        multiprocessing.connection.deliver_challenge(connection, self._authkey)
+        multiprocessing.connection.answer_challenge(connection, self._authkey)
+        return connection
+
+    def close(self) -> None:
+        """Stops the workers and closes the listener."""
+        super().close()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def sweep(self, temperatures: list[float]) -> list[int]:
+        """Runs a Monte Carlo sweep on every replica.
+
+        Parameters
+        ----------
+        temperatures : list[float]
+            Temperature of each replica.
+
+        Returns
+        -------
+        list[int]
+            Energy of each replica after the sweep.
+        """
+        for connection, replicas in zip(self._connections, self._slices):
+            connection.send(("sweep", [temperatures[k] for k in replicas]))
+
+        for connection, replicas in zip(self._connections, self._slices):
+            self._energies[replicas.start : replicas.stop] = connection.recv()
+        return list(self._energies)
+
+    def wait_finished(self) -> list[int]:
+        """Waits for at least one of the submitted sweeps to finish.
+
+        Returns
+        -------
+        list[int]
+            Indices of the replicas whose sweep is finished.
+        """
+        if len(self._submitted) == 0:
+            raise ValueError("No sweep has been submitted.")
+
+        finished = self._finished
+        self._finished = []
+        if len(finished) == 0:
+            for connection in multiprocessing.connection.wait(self._connections):
+                while connection.poll():
+                    k, energy = connection.recv()
+                    self._energies[k] = energy
+                    finished.append(k)
+        self._submitted = deque(
+            (k, temperature) for k, temperature in self._submitted if k not in finished
+        )
+        return finished
+
+    def get_energy(self, k: int) -> int:
+        """Gets the last known energy of a replica.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+
+        Returns
+        -------
+        int
+            Energy of the replica.
+        """
+        return self._energies[k]
+
+    def get_conformation(self, k: int) -> Conformation:
+        """Gets a copy of the current conformation of a replica from its worker.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+
+        Returns
+        -------
+        Conformation
+            Copy of the conformation of the replica.
+        """
+        connection = self._connections[self._owners[k]]
+        connection.send(("get", k))
+        data = connection.recv()
+        while not isinstance(data, bytes):
+            # A submitted sweep finished before the worker answered
+            finished, energy = data
+            self._energies[finished] = energy
+            self._finished.append(finished)
+            data = connection.recv()
+
+        lattice = type(self._conformation.lattice)(
+            self._conformation.lattice.dimensions
+        )
+        conformation = type(self._conformation).decode(
+            self._conformation.protein, lattice, data
+        )
+        conformation.computed_energy = self._energies[k]
+        return conformation
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs a REMC worker connected to a remote coordinator."
+    )
+    parser.add_argument("host", help="Host of the coordinator.")
+    parser.add_argument("port", type=int, help="Port of the coordinator.")
+    parser.add_argument(
+        "--authkey",
+        required=True,
+        help="Authentication key shared with the coordinator.",
+    )
+    args = parser.parse_args()
+
+    run_remote_replica_worker((args.host, args.port), args.authkey.encode())
@@ -0,0 +1,468 @@
+import copy
+import multiprocessing
+import multiprocessing.connection
+from collections import deque
+from multiprocessing.connection import Connection
+from typing import Optional, Tuple
+
+from ..Controllers.ConformationManager import ConformationManager
+from ..Models.Conformation import Conformation
+from ..Models.RandomStream import RandomStream
+from .ReplicaStatistics import ReplicaStatistics
+from .SharedReplicaState import SharedReplicaState
+from .SimpleMonteCarlo import SimpleMonteCarlo
+
+
+def _run_replica_worker(
+    connection: Connection,
+    conformation: Conformation,
+    state_name: str,
+    nb_replicas: int,
+    replica_indices: range,
+    phi: int,
+    rho: float,
+    random_streams: list[RandomStream],
+) -> None:
+    """Main loop of a worker process holding some replicas of a REMC run.
+
+    The positions and energies of the replicas live in the shared replica state, which the worker
+    mutates in place: the coordinator only sends the temperatures of a sweep (of all the replicas
+    of the worker, or of a single one) and is notified when it is over.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to the coordinator.
+    conformation : Conformation
+        Conformation giving the protein and the lattice of the replicas.
+    state_name : str
+        Name of the shared replica state.
+    nb_replicas : int
+        Total number of replicas in the shared replica state.
+    replica_indices : range
+        Indices of the replicas held by the worker.
+    phi : int
+        Number of search steps of a sweep.
+    rho : float
+        Probability to use pull moves.
+    random_streams : list[RandomStream]
+        Random stream of each replica held by the worker.
+    """
+    protein = conformation.protein
+    dimensions = conformation.lattice.dimensions
+    state = SharedReplicaState(
+        nb_replicas, len(protein.sequence), len(dimensions), name=state_name
+    )
+
+    monte_carlo = SimpleMonteCarlo(phi, rho)
+    conf_manager = ConformationManager(protein)
+    # The positions of the replicas are views on the shared state, moves update it directly
+    replicas = [
+        type(conformation).from_positions(
+            protein, type(conformation.lattice)(dimensions), state.positions[k]
+        )
+        for k in replica_indices
+    ]
+    statistics = [ReplicaStatistics() for _ in replica_indices]
+
+    while True:
+        command, argument = connection.recv()
+        if command == "sweep":
+            for i, k in enumerate(replica_indices):
+                monte_carlo.optimize(
+                    replicas[i],
+                    argument[i],
+                    conf_manager,
+                    statistics[i],
+                    random_streams[i],
+                )
+                state.energies[k] = replicas[i].computed_energy
+            connection.send(None)
+        elif command == "sweep_one":
+            k, temperature = argument
+            i = k - replica_indices.start
+            monte_carlo.optimize(
+                replicas[i],
+                temperature,
+                conf_manager,
+                statistics[i],
+                random_streams[i],
+            )
+            state.energies[k] = replicas[i].computed_energy
+            connection.send(k)
+        elif command == "statistics":
+            connection.send(statistics)
+        elif command == "random_streams":
+            connection.send(random_streams)
+        elif command == "stop":
+            break
+
+    # The views on the shared state must be released before detaching from it
+    del replicas
+    state.close()
+    connection.close()
+
+
+class ReplicaPool:
+    """Class that holds the replicas of a REMC run and sweeps them, possibly in worker processes."""
+
+    _conformation: Conformation  # Initial conformation of the replicas
+    _conformations: Optional[list[Conformation]]  # Initial conformation of each replica
+    _nb_replicas: int  # Number of replicas
+    _nb_workers: int  # Number of worker processes (1: sweeps in this process)
+    _monte_carlo: SimpleMonteCarlo  # Monte Carlo optimizer of the replicas
+    _conf_manager: ConformationManager  # Conformation manager used to compute the moves
+    _replicas: list[Conformation]  # Replicas, when they are swept in this process
+    _statistics: list[ReplicaStatistics]  # Statistics of the replicas of this process
+    _random_streams: list[RandomStream]  # Random stream of each replica
+    _state: Optional[SharedReplicaState]  # State of the replicas swept by workers
+    _processes: list[multiprocessing.Process]  # Worker processes
+    _connections: list[Connection]  # Connections to the worker processes
+    _slices: list[range]  # Indices of the replicas held by each worker process
+    _owners: list[int]  # Index of the worker process holding each replica
+    _submitted: deque[Tuple[int, float]]  # Submitted sweeps (replica, temperature)
+
+    def __init__(
+        self,
+        conformation: Conformation,
+        nb_replicas: int,
+        phi: int,
+        rho: float,
+        conf_manager: ConformationManager,
+        nb_workers: int = 1,
+        conformations: Optional[list[Conformation]] = None,
+        random_streams: Optional[list[RandomStream]] = None,
+    ) -> None:
+        """Constructor for the ReplicaPool class.
+
+        Parameters
+        ----------
+        conformation : Conformation
+            Initial conformation of the replicas.
+        nb_replicas : int
+            Number of replicas.
+        phi : int
+            Number of search steps of a sweep.
+        rho : float
+            Probability to use pull moves.
+        conf_manager : ConformationManager
+            Conformation manager used to compute the moves.
+        nb_workers : int, optional
+            Number of worker processes, by default 1 (the replicas are swept in this process).
+        conformations : Optional[list[Conformation]], optional
+            Initial conformation of each replica, with its computed energy, by default None
+            (all the replicas start from conformation).
+        random_streams : Optional[list[RandomStream]], optional
+            Random stream of each replica, by default None (independent unseeded streams).
+        """
+        if nb_workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+        if conformations is not None and len(conformations) != nb_replicas:
+            raise ValueError("There must be one initial conformation per replica.")
+        if random_streams is None:
+            random_streams = RandomStream().spawn(nb_replicas)
+        elif len(random_streams) != nb_replicas:
+            raise ValueError("There must be one random stream per replica.")
+
+        self._conformation = conformation
+        self._conformations = conformations
+        self._nb_replicas = nb_replicas
+        self._nb_workers = min(nb_workers, nb_replicas)
+        self._monte_carlo = SimpleMonteCarlo(phi, rho)
+        self._conf_manager = conf_manager
+        self._replicas = []
+        self._statistics = []
+        self._random_streams = random_streams
+        self._state = None
+        self._processes = []
+        self._connections = []
+        self._slices = []
+        self._owners = []
+        self._submitted = deque()
+
+    @property
+    def nb_workers(self) -> int:
+        """Getter for the attribute nb_workers of the ReplicaPool class.
+
+        Returns
+        -------
+        int
+            Number of worker processes.
+        """
+        return self._nb_workers
+
+    def __enter__(self) -> "ReplicaPool":
+        """Starts the pool when entering a with block.
+
+        Returns
+        -------
+        ReplicaPool
+            The started pool.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stops the worker processes when leaving a with block."""
+        self.close()
+
+    def _split_replicas(self) -> None:
+        """Splits the replicas in contiguous slices, one per worker."""
+        size, remainder = divmod(self._nb_replicas, self._nb_workers)
+        start = 0
+        for w in range(self._nb_workers):
+            end = start + size + (1 if w < remainder else 0)
+            self._slices.append(range(start, end))
+            self._owners.extend([w] * (end - start))
+            start = end
+
+    def _get_initial_conformation(self, k: int) -> Conformation:
+        """Gets the initial conformation of a replica.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+
+        Returns
+        -------
+        Conformation
+            Initial conformation of the replica.
+        """
+        if self._conformations is None:
+            return self._conformation
+        return self._conformations[k]
+
+    def start(self) -> None:
+        """Creates the replicas, and starts the worker processes holding them if needed."""
+        if self._nb_workers == 1:
+            self._replicas = [
+                self._get_initial_conformation(k).copy()
+                for k in range(self._nb_replicas)
+            ]
+            self._statistics = [ReplicaStatistics() for _ in range(self._nb_replicas)]
+            return
+
+        self._split_replicas()
+
+        self._state = SharedReplicaState(
+            self._nb_replicas,
+            len(self._conformation.protein.sequence),
+            len(self._conformation.lattice.dimensions),
+        )
+        for k in range(self._nb_replicas):
+            initial_conformation = self._get_initial_conformation(k)
+            self._state.positions[k] = initial_conformation.positions
+            self._state.energies[k] = initial_conformation.computed_energy
+
+        for replicas in self._slices:
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_replica_worker,
+                args=(
+                    worker_connection,
+                    self._conformation,
+                    self._state.name,
+                    self._nb_replicas,
+                    replicas,
+                    self._monte_carlo.phi,
+                    self._monte_carlo.rho,
+                    self._random_streams[replicas.start : replicas.stop],
+                ),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._processes.append(process)
+            self._connections.append(connection)
+
+    def close(self) -> None:
+        """Stops the worker processes and releases the shared replica state."""
+        for connection in self._connections:
+            try:
+                connection.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+
+        if self._state is not None:
+            self._state.close()
+            self._state.unlink()
+            self._state = None
+
+        self._processes = []
+        self._connections = []
+        self._slices = []
+        self._owners = []
+        self._submitted.clear()
+
+    def sweep(self, temperatures: list[float]) -> list[int]:
+        """Runs a Monte Carlo sweep on every replica.
+
+        Parameters
+        ----------
+        temperatures : list[float]
+            Temperature of each replica.
+
+        Returns
+        -------
+        list[int]
+            Energy of each replica after the sweep.
+        """
+        if self._nb_workers == 1:
+            for k, replica in enumerate(self._replicas):
+                self._monte_carlo.optimize(
+                    replica,
+                    temperatures[k],
+                    self._conf_manager,
+                    self._statistics[k],
+                    self._random_streams[k],
+                )
+            return [replica.computed_energy for replica in self._replicas]
+
+        # All the workers are started before waiting for any of them
+        for connection, replicas in zip(self._connections, self._slices):
+            connection.send(("sweep", [temperatures[k] for k in replicas]))
+
+        for connection in self._connections:
+            connection.recv()
+        return self._state.energies.tolist()
+
+    def submit(self, k: int, temperature: float) -> None:
+        """Submits a Monte Carlo sweep of a single replica, without waiting for it.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+        temperature : float
+            Temperature of the replica.
+        """
+        self._submitted.append((k, temperature))
+        if len(self._connections) > 0:
+            self._connections[self._owners[k]].send(("sweep_one", (k, temperature)))
+
+    def wait_finished(self) -> list[int]:
+        """Waits for at least one of the submitted sweeps to finish.
+
+        In this process, the oldest submitted sweep is run. Otherwise, the sweeps are run by the
+        workers in parallel and all the ones already finished are collected.
+
+        Returns
+        -------
+        list[int]
+            Indices of the replicas whose sweep is finished.
+        """
+        if len(self._submitted) == 0:
+            raise ValueError("No sweep has been submitted.")
+
+        if self._nb_workers == 1:
+            k, temperature = self._submitted.popleft()
+            self._monte_carlo.optimize(
+                self._replicas[k],
+                temperature,
+                self._conf_manager,
+                self._statistics[k],
+                self._random_streams[k],
+            )
+            return [k]
+
+        finished = []
+        for connection in multiprocessing.connection.wait(self._connections):
+            while connection.poll():
+                finished.append(connection.recv())
+        self._submitted = deque(
+            (k, temperature) for k, temperature in self._submitted if k not in finished
+        )
+        return finished
+
+    def get_energy(self, k: int) -> int:
+        """Gets the current energy of a replica.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+
+        Returns
+        -------
+        int
+            Energy of the replica.
+        """
+        if self._nb_workers == 1:
+            return self._replicas[k].computed_energy
+        return int(self._state.energies[k])
+
+    def get_statistics(self) -> list[ReplicaStatistics]:
+        """Gets the statistics of the replicas.
+
+        Returns
+        -------
+        list[ReplicaStatistics]
+            Statistics of each replica.
+        """
+        if len(self._connections) == 0:
+            return list(self._statistics)
+        return self._gather("statistics")
+
+    def get_random_streams(self) -> list[RandomStream]:
+        """Gets a copy of the random streams of the replicas, in their current state.
+
+        Returns
+        -------
+        list[RandomStream]
+            Random stream of each replica.
+        """
+        if len(self._connections) == 0:
+            return copy.deepcopy(self._random_streams)
+        return self._gather("random_streams")
+
+    def _gather(self, command: str) -> list:
+        """Asks every worker for a list with an item per replica, and concatenates them.
+
+        Parameters
+        ----------
+        command : str
+            Command sent to the workers.
+
+        Returns
+        -------
+        list
+            Item of each replica.
+        """
+        items = []
+        for connection in self._connections:
+            connection.send((command, None))
+            answer = connection.recv()
+            while not isinstance(answer, list):
+                # Answer of a sweep that finished after the end of the run
+                answer = connection.recv()
+            items.extend(answer)
+        return items
+
+    def get_conformation(self, k: int) -> Conformation:
+        """Gets a copy of the current conformation of a replica.
+
+        Parameters
+        ----------
+        k : int
+            Index of the replica.
+
+        Returns
+        -------
+        Conformation
+            Copy of the conformation of the replica.
+        """
+        if self._nb_workers == 1:
+            return self._replicas[k].copy()
+
+        lattice = type(self._conformation.lattice)(
+            self._conformation.lattice.dimensions
+        )
+        conformation = type(self._conformation).from_positions(
+            self._conformation.protein, lattice, self._state.positions[k].copy()
+        )
+        conformation.computed_energy = int(self._state.energies[k])
+        return conformation
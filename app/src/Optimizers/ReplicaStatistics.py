@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+
+from ..Models.MoveType import MoveType
+
+
+@dataclass(slots=True)
+class ReplicaStatistics:
+    """ReplicaStatistics gathers the counters of the Monte Carlo sweeps of a replica."""
+
+    _proposed_moves: dict[MoveType, int] = field(
+        default_factory=dict
+    )  # Number of proposed moves of each type
+    _accepted_moves: dict[MoveType, int] = field(
+        default_factory=dict
+    )  # Number of accepted moves of each type
+    _nb_neighbourhoods: int = 0  # Number of residue neighbourhoods computed
+    _neighbourhood_sizes: int = 0  # Total number of moves in these neighbourhoods
+    _nb_energy_evaluations: int = 0  # Number of energy (and energy delta) evaluations
+    _nb_sweeps: int = 0  # Number of sweeps
+    _sweep_time: float = 0.0  # Time spent in the sweeps, in seconds
+
+    @property
+    def proposed_moves(self) -> dict[MoveType, int]:
+        """Getter for the attribute proposed_moves of the statistics.
+
+        Returns
+        -------
+        dict[MoveType, int]
+            Number of proposed moves of each type.
+        """
+        return self._proposed_moves
+
+    @property
+    def accepted_moves(self) -> dict[MoveType, int]:
+        """Getter for the attribute accepted_moves of the statistics.
+
+        Returns
+        -------
+        dict[MoveType, int]
+            Number of accepted moves of each type.
+        """
+        return self._accepted_moves
+
+    @property
+    def nb_neighbourhoods(self) -> int:
+        """Getter for the attribute nb_neighbourhoods of the statistics.
+
+        Returns
+        -------
+        int
+            Number of residue neighbourhoods computed to propose moves.
+        """
+        return self._nb_neighbourhoods
+
+    @property
+    def mean_neighbourhood_size(self) -> float:
+        """Getter for the mean size of the residue neighbourhoods.
+
+        Returns
+        -------
+        float
+            Mean number of moves in the residue neighbourhoods computed (0 if none was).
+        """
+        if self._nb_neighbourhoods == 0:
+            return 0.0
+        return self._neighbourhood_sizes / self._nb_neighbourhoods
+
+    @property
+    def nb_energy_evaluations(self) -> int:
+        """Getter for the attribute nb_energy_evaluations of the statistics.
+
+        Returns
+        -------
+        int
+            Number of energy (and energy delta) evaluations.
+        """
+        return self._nb_energy_evaluations
+
+    @property
+    def nb_sweeps(self) -> int:
+        """Getter for the attribute nb_sweeps of the statistics.
+
+        Returns
+        -------
+        int
+            Number of sweeps.
+        """
+        return self._nb_sweeps
+
+    @property
+    def sweep_time(self) -> float:
+        """Getter for the attribute sweep_time of the statistics.
+
+        Returns
+        -------
+        float
+            Time spent in the sweeps, in seconds.
+        """
+        return self._sweep_time
+
+    def record_neighbourhood(self, size: int) -> None:
+        """Records the computation of a residue neighbourhood.
+
+        Parameters
+        ----------
+        size : int
+            Number of moves in the neighbourhood.
+        """
+        self._nb_neighbourhoods += 1
+        self._neighbourhood_sizes += size
+
+    def record_move(self, move_type: MoveType, accepted: bool) -> None:
+        """Records a proposed move.
+
+        Parameters
+        ----------
+        move_type : MoveType
+            Type of the move.
+        accepted : bool
+            Whether the move was accepted.
+        """
+        self._proposed_moves[move_type] = self._proposed_moves.get(move_type, 0) + 1
+        if accepted:
+            self._accepted_moves[move_type] = self._accepted_moves.get(move_type, 0) + 1
+
+    def record_energy_evaluation(self) -> None:
+        """Records an energy (or energy delta) evaluation."""
+        self._nb_energy_evaluations += 1
+
+    def record_sweep(self, duration: float) -> None:
+        """Records a sweep.
+
+        Parameters
+        ----------
+        duration : float
+            Duration of the sweep, in seconds.
+        """
+        self._nb_sweeps += 1
+        self._sweep_time += duration
+
+    def as_dict(self) -> dict[str, object]:
+        """Returns the statistics as a JSON-serialisable dictionary.
+
+        Returns
+        -------
+        dict[str, object]
+            Counters of the replica (move types are given by name).
+        """
+        return {
+            "proposed_moves": {str(t): n for t, n in self._proposed_moves.items()},
+            "accepted_moves": {str(t): n for t, n in self._accepted_moves.items()},
+            "nb_neighbourhoods": self._nb_neighbourhoods,
+            "mean_neighbourhood_size": self.mean_neighbourhood_size,
+            "nb_energy_evaluations": self._nb_energy_evaluations,
+            "nb_sweeps": self._nb_sweeps,
+            "sweep_time": self._sweep_time,
+        }
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RunProgress:
+    """RunProgress is a snapshot of a REMC run, streamed to the callers while it runs."""
+
+    _iteration: int  # Number of iterations completed by every replica
+    _nb_steps: int  # Number of Monte Carlo steps made so far
+    _energies: list[int]  # Energy of each replica
+    _temperatures: list[float]  # Temperature of each replica
+    _best_energy: int  # Best energy found so far
+    _best_conformation: bytes  # Encoded best conformation found so far
+
+    @property
+    def iteration(self) -> int:
+        """Getter for the attribute iteration of the snapshot.
+
+        Returns
+        -------
+        int
+            Number of iterations completed by every replica.
+        """
+        return self._iteration
+
+    @property
+    def nb_steps(self) -> int:
+        """Getter for the attribute nb_steps of the snapshot.
+
+        Returns
+        -------
+        int
+            Number of Monte Carlo steps made so far.
+        """
+        return self._nb_steps
+
+    @property
+    def energies(self) -> list[int]:
+        """Getter for the attribute energies of the snapshot.
+
+        Returns
+        -------
+        list[int]
+            Energy of each replica.
+        """
+        return self._energies
+
+    @property
+    def temperatures(self) -> list[float]:
+        """Getter for the attribute temperatures of the snapshot.
+
+        Returns
+        -------
+        list[float]
+            Temperature of each replica.
+        """
+        return self._temperatures
+
+    @property
+    def best_energy(self) -> int:
+        """Getter for the attribute best_energy of the snapshot.
+
+        Returns
+        -------
+        int
+            Best energy found so far.
+        """
+        return self._best_energy
+
+    @property
+    def best_conformation(self) -> bytes:
+        """Getter for the attribute best_conformation of the snapshot.
+
+        Returns
+        -------
+        bytes
+            Best conformation found so far, in compact form (see Conformation.decode).
+        """
+        return self._best_conformation
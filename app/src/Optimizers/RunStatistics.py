@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from typing import Tuple
+
+from .ReplicaStatistics import ReplicaStatistics
+
+
+@dataclass(slots=True)
+class RunStatistics:
+    """RunStatistics gathers the counters and phase timings of a REMC run."""
+
+    _replicas: list[ReplicaStatistics] = field(
+        default_factory=list
+    )  # Statistics of each replica
+    _swap_attempts: dict[Tuple[int, int], int] = field(
+        default_factory=dict
+    )  # Number of exchanges attempted for each pair of neighbouring rungs of the ladder
+    _swap_acceptances: dict[Tuple[int, int], int] = field(
+        default_factory=dict
+    )  # Number of exchanges accepted for each pair of neighbouring rungs of the ladder
+    _sweep_time: float = 0.0  # Time spent waiting for the sweeps, in seconds
+    _exchange_time: float = 0.0  # Time spent in the exchange steps, in seconds
+    _nb_iterations: int = 0  # Number of iterations
+
+    @property
+    def replicas(self) -> list[ReplicaStatistics]:
+        """Getter for the attribute replicas of the statistics.
+
+        Returns
+        -------
+        list[ReplicaStatistics]
+            Statistics of each replica.
+        """
+        return self._replicas
+
+    @replicas.setter
+    def replicas(self, replicas: list[ReplicaStatistics]) -> None:
+        """Setter for the attribute replicas of the statistics.
+
+        Parameters
+        ----------
+        replicas : list[ReplicaStatistics]
+            Statistics of each replica to be assigned.
+        """
+        self._replicas = replicas
+
+    @property
+    def swap_attempts(self) -> dict[Tuple[int, int], int]:
+        """Getter for the attribute swap_attempts of the statistics.
+
+        Returns
+        -------
+        dict[Tuple[int, int], int]
+            Number of exchanges attempted for each pair of neighbouring rungs (i, i + 1).
+        """
+        return self._swap_attempts
+
+    @property
+    def swap_acceptances(self) -> dict[Tuple[int, int], int]:
+        """Getter for the attribute swap_acceptances of the statistics.
+
+        Returns
+        -------
+        dict[Tuple[int, int], int]
+            Number of exchanges accepted for each pair of neighbouring rungs (i, i + 1).
+        """
+        return self._swap_acceptances
+
+    @property
+    def sweep_time(self) -> float:
+        """Getter for the attribute sweep_time of the statistics.
+
+        Returns
+        -------
+        float
+            Time spent waiting for the sweeps of the replicas, in seconds.
+        """
+        return self._sweep_time
+
+    @property
+    def exchange_time(self) -> float:
+        """Getter for the attribute exchange_time of the statistics.
+
+        Returns
+        -------
+        float
+            Time spent in the exchange steps, in seconds.
+        """
+        return self._exchange_time
+
+    @property
+    def nb_iterations(self) -> int:
+        """Getter for the attribute nb_iterations of the statistics.
+
+        Returns
+        -------
+        int
+            Number of iterations completed by every replica.
+        """
+        return self._nb_iterations
+
+    @nb_iterations.setter
+    def nb_iterations(self, nb_iterations: int) -> None:
+        """Setter for the attribute nb_iterations of the statistics.
+
+        Parameters
+        ----------
+        nb_iterations : int
+            Number of iterations completed by every replica to be assigned.
+        """
+        self._nb_iterations = nb_iterations
+
+    def record_swap(self, rung: int, accepted: bool) -> None:
+        """Records an attempted exchange between two neighbouring rungs of the temperature ladder.
+
+        The rungs are counted from the lowest temperature, so the counters of a pair stay together
+        when an adaptive ladder retunes its temperatures.
+
+        Parameters
+        ----------
+        rung : int
+            Lowest of the two rungs.
+        accepted : bool
+            Whether the exchange was accepted.
+        """
+        pair = (rung, rung + 1)
+        self._swap_attempts[pair] = self._swap_attempts.get(pair, 0) + 1
+        if accepted:
+            self._swap_acceptances[pair] = self._swap_acceptances.get(pair, 0) + 1
+
+    def record_sweep_phase(self, duration: float) -> None:
+        """Records a sweep phase of the coordinator.
+
+        Parameters
+        ----------
+        duration : float
+            Duration of the phase, in seconds.
+        """
+        self._sweep_time += duration
+
+    def record_exchange_phase(self, duration: float) -> None:
+        """Records an exchange phase of the coordinator.
+
+        Parameters
+        ----------
+        duration : float
+            Duration of the phase, in seconds.
+        """
+        self._exchange_time += duration
+
+    def as_dict(self) -> dict[str, object]:
+        """Returns the statistics as a JSON-serialisable dictionary.
+
+        Returns
+        -------
+        dict[str, object]
+            Counters and timings of the run (pairs of rungs are given as "i-j").
+        """
+        return {
+            "replicas": [replica.as_dict() for replica in self._replicas],
+            "swap_attempts": {
+                f"{i}-{j}": n for (i, j), n in self._swap_attempts.items()
+            },
+            "swap_acceptances": {
+                f"{i}-{j}": n for (i, j), n in self._swap_acceptances.items()
+            },
+            "sweep_time": self._sweep_time,
+            "exchange_time": self._exchange_time,
+            "nb_iterations": self._nb_iterations,
+        }
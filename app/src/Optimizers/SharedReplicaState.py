@@ -0,0 +1,103 @@
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+
+class SharedReplicaState:
+    """Class that lays out the state of all the replicas of a REMC run in one shared memory block.
+
+    The block holds the energies of the replicas (khi 64-bit integers) followed by their positions
+    ((khi, n, d) 64-bit integers), so that processes attached to it read and mutate the replicas
+    in place, without any serialisation.
+    """
+
+    _memory: shared_memory.SharedMemory  # Shared memory block
+    _energies: np.ndarray  # (khi,) view of the energies of the replicas
+    _positions: np.ndarray  # (khi, n, d) view of the positions of the replicas
+
+    def __init__(
+        self,
+        nb_replicas: int,
+        nb_residues: int,
+        nb_dimensions: int,
+        name: Optional[str] = None,
+    ) -> None:
+        """Constructor for the SharedReplicaState class.
+
+        Parameters
+        ----------
+        nb_replicas : int
+            Number of replicas.
+        nb_residues : int
+            Number of residues of the protein.
+        nb_dimensions : int
+            Number of dimensions of the lattice.
+        name : Optional[str], optional
+            Name of an existing block to attach to, by default None (a new block is created).
+        """
+        itemsize = np.dtype(int).itemsize
+        nb_energies = nb_replicas
+        nb_coordinates = nb_replicas * nb_residues * nb_dimensions
+
+        if name is None:
+            self._memory = shared_memory.SharedMemory(
+                create=True, size=(nb_energies + nb_coordinates) * itemsize
+            )
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+
+        self._energies = np.ndarray((nb_energies,), dtype=int, buffer=self._memory.buf)
+        self._positions = np.ndarray(
+            (nb_replicas, nb_residues, nb_dimensions),
+            dtype=int,
+            buffer=self._memory.buf,
+            offset=nb_energies * itemsize,
+        )
+
+    @property
+    def name(self) -> str:
+        """Getter for the name of the shared memory block.
+
+        Returns
+        -------
+        str
+            Name of the block, used by other processes to attach to it.
+        """
+        return self._memory.name
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Getter for the energies of the replicas.
+
+        Returns
+        -------
+        np.ndarray
+            (khi,) view of the energies of the replicas.
+        """
+        return self._energies
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Getter for the positions of the replicas.
+
+        Returns
+        -------
+        np.ndarray
+            (khi, n, d) view of the positions of the replicas. Row k is the positions array of
+            the k-th replica, and can be used as such by a conformation.
+        """
+        return self._positions
+
+    def close(self) -> None:
+        """Detaches the process from the shared memory block.
+
+        The views on the block must not be used anymore.
+        """
+        del self._energies
+        del self._positions
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block, once every process is detached from it."""
+        self._memory.unlink()
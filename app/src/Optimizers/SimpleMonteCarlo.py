@@ -1,15 +1,19 @@
-import copy
 import math
-import random
+import time
+from typing import Optional
 
 from ..Controllers.ConformationManager import ConformationManager
 from ..Models.Conformation import Conformation
+from ..Models.RandomStream import RandomStream
+from .ReplicaStatistics import ReplicaStatistics
 
 
 class SimpleMonteCarlo:
     """Class for Monte Carlo optimization algorithm in the AB-Initio context."""
 
     _phi: int  # Number of search steps.
+    _rho: float = 0.0  # Probability to use pull moves
+    _rng: RandomStream  # Random stream used when none is given
 
     @property
     def phi(self) -> int:
@@ -33,7 +37,29 @@ class SimpleMonteCarlo:
         """
         self._phi = phi
 
-    def __init__(self, phi: int) -> None:
+    @property
+    def rho(self) -> float:
+        """Getter for the attribute rho of the MonteCarlo class.
+
+        Returns
+        -------
+        float
+            Probability to use pull moves.
+        """
+        return self._rho
+
+    @rho.setter
+    def rho(self, rho: float) -> None:
+        """Setter for the attribute rho of the MonteCarlo class.
+
+        Parameters
+        ----------
+        rho : float
+            Probability to use pull moves to be assigned.
+        """
+        self._rho = rho
+
+    def __init__(self, phi: int, rho: float = 0.0, seed: Optional[int] = None) -> None:
         """Constructor for the MonteCarlo class.
 
         Parameters
@@ -42,17 +68,26 @@ class SimpleMonteCarlo:
             Number of search steps.
         rho : float, optional
             Probability to use pull moves, by default 0.0
+        seed : Optional[int], optional
+            Seed of the random stream used when optimize is given none, by default None
         """
         self._phi = phi
+        self._rho = rho
+        self._rng = RandomStream(seed)
 
     def optimize(
         self,
         conformation: Conformation,
         temperature: float,
         conf_manager: ConformationManager,
+        statistics: Optional[ReplicaStatistics] = None,
+        rng: Optional[RandomStream] = None,
     ) -> Conformation:
         """Optimizes a conformation using the Monte Carlo algorithm.
 
+        The conformation is modified in place: accepted moves are applied to it and rejected moves
+        are never applied, since their energy change is evaluated beforehand.
+
         Parameters
         ----------
         conformation : Conformation
@@ -61,54 +96,61 @@ class SimpleMonteCarlo:
             Temperature of the replica.
         conf_manager : ConformationManager
             Conformation manager that is used to compute the neigbourhood.
+        statistics : Optional[ReplicaStatistics], optional
+            Statistics of the replica, updated with the counters of the sweep, by default None
+        rng : Optional[RandomStream], optional
+            Random stream of the replica, by default None (the stream of the optimizer).
 
         Returns
         -------
         Conformation
-            Optimized conformation.
+            Optimized conformation (the given conformation).
         """
-        optimal_conformation = copy.deepcopy(conformation)
-
+        start = time.perf_counter()
+        if rng is None:
+            rng = self._rng
+
+        # The energy is computed once, then updated incrementally with each accepted move.
+        try:
+            conformation.compute_energy()
+        except Exception as e:
+            raise e
+        if statistics is not None:
+            statistics.record_energy_evaluation()
+
+        record_neighbourhood = (
+            statistics.record_neighbourhood if statistics is not None else None
+        )
         for i in range(self._phi):
-            neighbourhood = []
-
-            # We compute the neighbourhood of the conformation
+            # We sample a random move from the neighbourhood of the conformation
             try:
-                neighbourhood = conf_manager.compute_vhsd_neighbourhood(
-                    optimal_conformation
+                move = conf_manager.propose_move(
+                    conformation, self._rho, record_neighbourhood, rng
                 )
-                # TODO : Compute pull moves.
             except Exception as e:
                 raise e
 
-            if len(neighbourhood) == 0:
-                return optimal_conformation
+            if move is None:
+                break
 
-            # We select a random conformation from the neighbourhood.
-            random_conformation = copy.deepcopy(random.choice(neighbourhood))
+            # Energy change of the move
+            delta = conformation.compute_energy_delta(move.as_dict())
 
-            # We compute the energy of the conformations.
-            try:
-                random_conformation.compute_energy()
-                optimal_conformation.compute_energy()
-            except Exception as e:
-                raise e
+            accepted = delta < 0
+            if not accepted:
+                # Metropolis criterion
+                q = rng.random()
+                threshold = math.exp(-delta / temperature)
+                accepted = q <= threshold
 
-            if (
-                random_conformation.computed_energy
-                < optimal_conformation.computed_energy
-            ):
-                optimal_conformation = copy.deepcopy(random_conformation)
-            else:
-                q = random.uniform(0, 1)
-                threshold = math.exp(
-                    -(
-                        random_conformation.computed_energy
-                        - optimal_conformation.computed_energy
-                    )
-                    / temperature
-                )
-                if q > threshold:
-                    optimal_conformation = copy.deepcopy(random_conformation)
+            if accepted:
+                conformation.apply_move(move, delta)
+
+            if statistics is not None:
+                statistics.record_energy_evaluation()
+                statistics.record_move(move.move_type, accepted)
+
+        if statistics is not None:
+            statistics.record_sweep(time.perf_counter() - start)
 
-        return optimal_conformation
+        return conformation
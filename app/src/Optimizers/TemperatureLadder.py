@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+
+class TemperatureLadder(ABC):
+    """TemperatureLadder is an abstract class that represents a strategy placing the temperatures
+    of the replicas of REMC between a minimum and a maximum temperature.
+
+    The rungs of a ladder are its temperatures in increasing order, two replicas being exchanged
+    only when their temperatures are on neighbouring rungs. A ladder may also retune its rungs
+    during the run, from the exchanges attempted between them.
+    """
+
+    @abstractmethod
+    def create(self, tmin: float, tmax: float, nb_rungs: int) -> list[float]:
+        """Creates the rungs of the ladder.
+
+        Parameters
+        ----------
+        tmin : float
+            Minimum temperature.
+        tmax : float
+            Maximum temperature.
+        nb_rungs : int
+            Number of rungs (one per replica).
+
+        Returns
+        -------
+        list[float]
+            Temperatures of the rungs, in increasing order.
+        """
+        pass
+
+    def record_swap(self, rung: int, accepted: bool) -> None:
+        """Records an exchange attempted between two neighbouring rungs.
+
+        Parameters
+        ----------
+        rung : int
+            Lowest of the two rungs.
+        accepted : bool
+            Whether the exchange was accepted.
+        """
+        pass
+
+    def retune(self, rungs: list[float]) -> list[float]:
+        """Retunes the rungs of the ladder, once every replica completed an iteration.
+
+        Parameters
+        ----------
+        rungs : list[float]
+            Temperatures of the rungs, in increasing order.
+
+        Returns
+        -------
+        list[float]
+            New temperatures of the rungs, in increasing order. The rungs are kept by default.
+        """
+        return rungs
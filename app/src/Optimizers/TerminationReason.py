@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class TerminationReason(Enum):
+    """Reasons for which a REMC run terminates."""
+
+    E_STAR = "e_star"  # The optimal energy of the protein was reached
+    MAX_ITERATIONS = "max_iterations"  # Every replica completed its iterations
+    MAX_STEPS = "max_steps"  # The Monte Carlo steps exceeded their budget
+    TIME_BUDGET = "time_budget"  # The wall-clock time exceeded its budget
+    STAGNATION = "stagnation"  # The best energy did not improve for too many iterations
+    STOPPED = "stopped"  # The caller stopped the run
+
+    def __str__(self) -> str:
+        """Returns a string representation of the reason.
+
+        Returns
+        -------
+        str
+            String representation of the reason.
+        """
+        return self.value
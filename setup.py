@@ -20,7 +20,7 @@ setup(
         "Programming Language :: Python :: 3.10.11",
         "Operating System :: OS Independent",
     ],
-    install_requires=["numpy >= 1.25.2", "plotly >= 5.16.1", "streamlit >= 1.26.0"],
+    install_requires=["numpy >= 1.25.2", "plotly >= 5.16.1", "streamlit >= 1.27.0"],
     extras_require={
         "dev": [
             "mkdocs >= 1.5.2",
@@ -0,0 +1,65 @@
+import pytest
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.AdaptiveLadder import AdaptiveLadder
+from app.src.Optimizers.Checkpoint import Checkpoint
+from app.src.Optimizers.REMC import REMC
+from tests.utils import make_protein, random_sequence
+
+PROTEIN = make_protein(random_sequence(24, 1), 2)
+
+
+def _run(max_iter, nb_workers, checkpoint_path, checkpoint=None):
+    """Runs REMC on the test protein, checkpointing every 5 iterations."""
+    conf_manager = ConformationManager(PROTEIN)
+    conformation = conf_manager.create_initial_conformation((48, 48), RandomStream(0))
+    remc = REMC(
+        30,
+        5,
+        160,
+        220,
+        conf_manager,
+        max_iter=max_iter,
+        rho=0.5,
+        nb_workers=nb_workers,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=5,
+        seed=3,
+        temperature_ladder=AdaptiveLadder(interval=2),
+    )
+    snapshots = [
+        (progress.iteration, progress.energies, progress.temperatures)
+        for progress in remc.stream(conformation, -100, checkpoint)
+    ]
+    return remc, snapshots
+
+
+@pytest.mark.parametrize("nb_workers, interrupted_workers", [(1, 1), (2, 2), (2, 1)])
+def test_resumed_run_matches_straight_run(tmp_path, nb_workers, interrupted_workers):
+    straight, straight_snapshots = _run(10, nb_workers, str(tmp_path / "straight.pkl"))
+
+    # The number of workers can change when the run is resumed
+    _run(5, interrupted_workers, str(tmp_path / "interrupted.pkl"))
+    checkpoint = Checkpoint.load(str(tmp_path / "interrupted.pkl"))
+    assert checkpoint.iteration == 6
+    resumed, resumed_snapshots = _run(
+        10, nb_workers, str(tmp_path / "resumed.pkl"), checkpoint
+    )
+
+    assert resumed_snapshots == straight_snapshots[5:]
+    assert resumed.nb_steps == straight.nb_steps
+    assert resumed.optimal_replica.computed_energy == (
+        straight.optimal_replica.computed_energy
+    )
+    assert (
+        resumed.optimal_replica.positions == straight.optimal_replica.positions
+    ).all()
+
+    # The replicas end in the same state
+    straight_end = Checkpoint.load(str(tmp_path / "straight.pkl"))
+    resumed_end = Checkpoint.load(str(tmp_path / "resumed.pkl"))
+    assert resumed_end.iteration == straight_end.iteration == 11
+    assert resumed_end.replicas == straight_end.replicas
+    assert resumed_end.energies == straight_end.energies
+    assert resumed_end.temperatures == straight_end.temperatures
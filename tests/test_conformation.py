@@ -0,0 +1,25 @@
+import numpy as np
+
+from tests.utils import make_protein, random_conformation
+
+
+def test_positions_setter_releases_old_cells():
+    protein = make_protein("HPHPPHHPHH", 2)
+    conformation = random_conformation(protein, (30, 30), seed=1)
+
+    conformation.positions = np.array([(i, 0) for i in range(10)])
+
+    assert conformation.lattice.occupied_cells == {(i, 0) for i in range(10)}
+    assert conformation.get_residue_index((3, 0)) == 3
+
+
+def test_amino_acid_coordinates_setter_releases_old_cells():
+    protein = make_protein("HPHPPHHPHH", 3)
+    conformation = random_conformation(protein, (30, 30, 30), seed=2)
+
+    conformation.amino_acid_coordinates = {
+        (i, 1, 2): amino_acid for i, amino_acid in enumerate(protein.sequence)
+    }
+
+    assert conformation.lattice.occupied_cells == {(i, 1, 2) for i in range(10)}
+    assert conformation.is_valid()
@@ -0,0 +1,67 @@
+import numpy as np
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.Conformation2D import Conformation2D
+from app.src.Models.Lattice2D import Lattice2D
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.ReplicaStatistics import ReplicaStatistics
+from tests.utils import make_protein
+
+
+class LastDrawStream(RandomStream):
+    """Random stream always drawing the last residue and the last move slot."""
+
+    def randrange(self, stop: int) -> int:
+        return stop - 1
+
+
+def _straight_chain(length, lattice_dims):
+    protein = make_protein("HP" * (length // 2) + "H" * (length % 2), 2)
+    positions = np.array([(i, lattice_dims[1] // 2) for i in range(length)])
+    conformation = Conformation2D.from_positions(
+        protein, Lattice2D(lattice_dims), positions
+    )
+    conformation.compute_energy()
+    return protein, conformation
+
+
+def test_propose_move_falls_back_to_enumeration():
+    protein, conformation = _straight_chain(10, (12, 11))
+    conf_manager = ConformationManager(protein)
+    statistics = ReplicaStatistics()
+
+    # The last residue of a straight chain has two end moves, the last slot of the draws is empty
+    move = conf_manager.propose_move(
+        conformation,
+        record_neighbourhood=statistics.record_neighbourhood,
+        rng=LastDrawStream(0),
+    )
+
+    moves = [
+        residue_move
+        for index in range(10)
+        for residue_move in conf_manager.compute_residue_moves(conformation, index)
+    ]
+    assert move in moves
+    # One neighbourhood per rejected draw, then one per residue for the enumeration
+    assert statistics.nb_neighbourhoods == 2 * 10
+
+
+def test_propose_move_without_neighbour():
+    protein, conformation = _straight_chain(3, (3, 1))
+    conf_manager = ConformationManager(protein)
+
+    assert conf_manager.propose_move(conformation, rng=RandomStream(0)) is None
+    assert conf_manager.propose_move(conformation, rho=1.0, rng=RandomStream(0)) is None
+
+
+def test_initial_conformation_is_reproducible():
+    protein = make_protein("HPPHHPHPPHHPHHHP", 3)
+    conformations = [
+        ConformationManager(protein).create_initial_conformation(
+            (16, 16, 16), RandomStream(7)
+        )
+        for _ in range(2)
+    ]
+
+    assert (conformations[0].positions == conformations[1].positions).all()
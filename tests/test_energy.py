@@ -0,0 +1,33 @@
+import pytest
+
+from tests.utils import (
+    compact_conformation,
+    load_proteins,
+    make_protein,
+    random_conformation,
+    random_sequence,
+)
+
+PROTEINS = load_proteins()
+LATTICE_DIMS = {2: (100, 100), 3: (50, 50, 50)}
+
+
+@pytest.mark.parametrize("dimension", [2, 3])
+@pytest.mark.parametrize("protein", PROTEINS, ids=lambda protein: protein.name)
+def test_energy_of_article_proteins(protein, dimension):
+    for seed in range(3):
+        conformation = random_conformation(protein, LATTICE_DIMS[dimension], seed)
+        assert conformation.compute_energy() == conformation.compute_energy_pairwise()
+
+    conformation = compact_conformation(protein, LATTICE_DIMS[dimension], seed=0)
+    assert conformation.compute_energy() < 0
+    assert conformation.compute_energy() == conformation.compute_energy_pairwise()
+
+
+@pytest.mark.parametrize("dimension", [2, 3])
+@pytest.mark.parametrize("seed", range(10))
+def test_energy_of_random_walks(dimension, seed):
+    protein = make_protein(random_sequence(20 + 5 * seed, seed), dimension)
+    conformation = random_conformation(protein, LATTICE_DIMS[dimension], seed)
+
+    assert conformation.compute_energy() == conformation.compute_energy_pairwise()
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from app.gui.JobManager import JobManager
+from tests.utils import make_protein, random_sequence
+
+PROTEIN = make_protein(random_sequence(20, 0), 2)
+PROTEIN.e_star = -100
+
+
+def _hyperparameters(max_iter):
+    # The long jobs are cut short by the time budget should a cancellation be missed
+    return {
+        "phi": 20,
+        "khi": 4,
+        "tmin": 160,
+        "tmax": 220,
+        "max_iter": max_iter,
+        "rho": 0.5,
+        "nb_workers": 1,
+        "asynchronous": False,
+        "ladder": "geometric",
+        "time_budget": 60,
+        "patience": 0,
+        "seed": 0,
+    }
+
+
+def _wait(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "The job manager did not answer in time"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def job_manager():
+    manager = JobManager(nb_processes=1)
+    yield manager
+    manager.shutdown()
+
+
+def test_submitted_job_runs_to_completion(job_manager):
+    job_id = job_manager.submit(PROTEIN, (40, 40), _hyperparameters(20))
+
+    _wait(lambda: job_manager.get_status(job_id) == "done")
+
+    assert job_manager.get_progress(job_id) == {
+        "iteration": 20,
+        "max_iter": 20,
+        "best_energy": job_manager.get_result(job_id)["energy"],
+    }
+    result = job_manager.get_result(job_id)
+    assert not result["cancelled"]
+    assert result["termination_reason"] == "max_iterations"
+    assert result["lattice_dims"] == (40, 40)
+    assert result["energy"] <= result["initial_energy"]
+
+
+def test_same_seed_gives_same_result(job_manager):
+    job_ids = [
+        job_manager.submit(PROTEIN, (40, 40), _hyperparameters(10)) for _ in range(2)
+    ]
+
+    _wait(lambda: all(job_manager.get_status(job) == "done" for job in job_ids))
+
+    first, second = (job_manager.get_result(job) for job in job_ids)
+    assert first == second
+
+
+def test_cancelled_running_job_stops(job_manager):
+    job_id = job_manager.submit(PROTEIN, (40, 40), _hyperparameters(2000))
+    _wait(lambda: job_manager.get_progress(job_id) is not None)
+
+    job_manager.cancel(job_id)
+    _wait(lambda: job_manager.get_status(job_id) == "done")
+
+    result = job_manager.get_result(job_id)
+    assert result["cancelled"]
+    assert result["termination_reason"] == "stopped"
+    assert job_manager.get_progress(job_id)["iteration"] < 2000
+
+
+def test_cancelled_pending_job_never_runs(job_manager):
+    running = job_manager.submit(PROTEIN, (40, 40), _hyperparameters(2000))
+    pending = job_manager.submit(PROTEIN, (40, 40), _hyperparameters(10))
+    _wait(lambda: job_manager.get_status(running) == "running")
+
+    job_manager.cancel(pending)
+    job_manager.cancel(running)
+
+    assert job_manager.get_status(pending) == "cancelled"
+    _wait(lambda: job_manager.get_status(running) == "done")
+    assert job_manager.get_progress(pending) is None
+
+
+def test_forgotten_job_is_released(job_manager):
+    job_id = job_manager.submit(PROTEIN, (40, 40), _hyperparameters(2000))
+    _wait(lambda: job_manager.get_progress(job_id) is not None)
+
+    job_manager.forget(job_id)
+
+    assert job_manager.get_status(job_id) == "unknown"
+    # The shared entries are removed once the job has seen that it is cancelled
+    _wait(lambda: job_manager.get_progress(job_id) is None)
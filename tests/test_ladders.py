@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.AdaptiveLadder import AdaptiveLadder
+
+# Exchanges are harder at low temperatures: the acceptance ratio of a gap g above rung k is
+# exp(-STIFFNESS[k] * g)
+STIFFNESS = [6.0, 4.0, 3.0, 2.0, 1.5]
+
+
+def _acceptance_ratios(rungs):
+    return [
+        math.exp(-stiffness * math.log(rungs[k + 1] / rungs[k]))
+        for k, stiffness in enumerate(STIFFNESS)
+    ]
+
+
+def _retune(ladder, rungs, nb_retunings, rng=None):
+    """Retunes a ladder, with random exchanges or, without a random stream, exact ratios."""
+    for _ in range(nb_retunings):
+        for rung, ratio in enumerate(_acceptance_ratios(rungs)):
+            for attempt in range(200):
+                if rng is None:
+                    ladder.record_swap(rung, attempt < round(200 * ratio))
+                else:
+                    ladder.record_swap(rung, rng.random() < ratio)
+        rungs = ladder.retune(rungs)
+        yield rungs
+
+
+@pytest.mark.parametrize("tmax", [2.0, 10.0, 1000.0])
+@pytest.mark.parametrize("gain", [0.5, 1.0, 5.0])
+def test_adaptive_ladder_stays_sorted_within_bounds(tmax, gain):
+    ladder = AdaptiveLadder(interval=1, gain=gain)
+    rungs = ladder.create(1.0, tmax, len(STIFFNESS) + 1)
+
+    for rungs in _retune(ladder, rungs, 100, RandomStream(0)):
+        assert rungs[0] == 1.0
+        assert all(low < high for low, high in zip(rungs, rungs[1:]))
+        assert rungs[-1] <= tmax
+
+
+def test_adaptive_ladder_reaches_target_ratio():
+    ladder = AdaptiveLadder(target_ratio=0.23, interval=1)
+    rungs = ladder.create(1.0, 1000.0, len(STIFFNESS) + 1)
+
+    *_, rungs = _retune(ladder, rungs, 100)
+
+    assert rungs[-1] < 1000.0
+    assert _acceptance_ratios(rungs) == pytest.approx([0.23] * len(STIFFNESS), abs=0.01)
+
+
+def test_adaptive_ladder_evens_out_ratios_between_pinned_ends():
+    # The target ratio cannot be reached within [1, 3] with 6 rungs
+    ladder = AdaptiveLadder(target_ratio=0.23, interval=1)
+    rungs = ladder.create(1.0, 3.0, len(STIFFNESS) + 1)
+
+    *_, rungs = _retune(ladder, rungs, 100)
+
+    assert rungs[0] == 1.0
+    assert rungs[-1] == pytest.approx(3.0)
+    ratios = _acceptance_ratios(rungs)
+    assert min(ratios) > 0.23
+    assert max(ratios) - min(ratios) < 0.01
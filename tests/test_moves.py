@@ -0,0 +1,115 @@
+import pytest
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.MoveType import MoveType
+from app.src.Models.RandomStream import RandomStream
+from tests.utils import compact_conformation, make_protein, random_sequence
+
+LATTICES = [(2, (40, 40)), (3, (16, 16, 16))]
+
+
+def _collect_moves(conformation, conf_manager):
+    """Gathers every VHSd and pull move of a conformation, grouped by type."""
+    moves = {move_type: [] for move_type in MoveType}
+    for index in range(len(conformation.protein.sequence)):
+        for move in conf_manager.compute_residue_moves(conformation, index):
+            moves[move.move_type].append(move)
+        for move in conf_manager.compute_residue_pull_moves(conformation, index):
+            moves[move.move_type].append(move)
+    return moves
+
+
+def _check_move(conformation, move):
+    """Checks the energy delta of a move against a full recompute, then undoes it."""
+    positions = conformation.positions.copy()
+    occupied_cells = set(conformation.lattice.occupied_cells)
+    energy = conformation.compute_energy()
+
+    delta = conformation.compute_energy_delta(move.as_dict())
+    conformation.apply_move(move, delta)
+    assert conformation.is_valid()
+    assert conformation.computed_energy == energy + delta
+    assert conformation.compute_energy() == energy + delta
+    assert conformation.compute_energy_pairwise() == energy + delta
+
+    conformation.undo_move(move, delta)
+    assert (conformation.positions == positions).all()
+    assert conformation.lattice.occupied_cells == occupied_cells
+    assert conformation.computed_energy == energy
+    assert conformation.compute_energy() == energy
+
+
+@pytest.mark.parametrize("dimension, lattice_dims", LATTICES)
+@pytest.mark.parametrize("seed", range(4))
+def test_energy_delta_matches_full_recompute(dimension, lattice_dims, seed):
+    protein = make_protein(random_sequence(30, seed), dimension)
+    conformation = compact_conformation(protein, lattice_dims, seed)
+    moves = _collect_moves(conformation, ConformationManager(protein))
+
+    for move_type in (MoveType.END, MoveType.CORNER, MoveType.PULL):
+        assert moves[move_type], f"No {move_type} move to check"
+    for move_list in moves.values():
+        for move in move_list:
+            _check_move(conformation, move)
+
+
+@pytest.mark.parametrize("dimension, lattice_dims", LATTICES)
+def test_energy_delta_of_multi_residue_moves(dimension, lattice_dims):
+    checked = {MoveType.CRANKSHAFT: 0, MoveType.PULL: 0}
+    for seed in range(8):
+        protein = make_protein(random_sequence(30, seed), dimension)
+        conformation = compact_conformation(protein, lattice_dims, seed)
+        moves = _collect_moves(conformation, ConformationManager(protein))
+        for move_type in checked:
+            for move in moves[move_type]:
+                # Only the moves relocating several residues
+                if len(move.residue_indices) > 1:
+                    _check_move(conformation, move)
+                    checked[move_type] += 1
+
+    assert checked[MoveType.CRANKSHAFT] > 0
+    # Pull moves dragging the chain along, not only their first two residues
+    assert checked[MoveType.PULL] > 0
+
+
+def _assert_self_avoiding_walk(conformation):
+    """Checks that the residues are in distinct cells of the lattice, each one adjacent to the next."""
+    positions = [tuple(position) for position in conformation.positions.tolist()]
+    assert len(set(positions)) == len(positions)
+    assert all(conformation.lattice.is_inside(position) for position in positions)
+    for first, second in zip(positions, positions[1:]):
+        assert sum(abs(a - b) for a, b in zip(first, second)) == 1
+
+
+@pytest.mark.parametrize("dimension, lattice_dims", LATTICES)
+@pytest.mark.parametrize("seed", range(3))
+def test_pull_moves_are_valid(dimension, lattice_dims, seed):
+    protein = make_protein(random_sequence(25, seed), dimension)
+    conformation = compact_conformation(protein, lattice_dims, seed)
+    conf_manager = ConformationManager(protein)
+
+    for index in range(len(protein.sequence)):
+        pulls = conformation.lattice.compute_pull_moves(index, conformation.positions)
+        # Each move is proposed once
+        assert len({frozenset(pull.items()) for pull in pulls}) == len(pulls)
+
+        for move in conf_manager.compute_residue_pull_moves(conformation, index):
+            delta = conformation.compute_energy_delta(move.as_dict())
+            conformation.apply_move(move, delta)
+            _assert_self_avoiding_walk(conformation)
+            conformation.undo_move(move, delta)
+            _assert_self_avoiding_walk(conformation)
+
+
+@pytest.mark.parametrize("dimension, lattice_dims", LATTICES)
+def test_proposed_pull_moves_are_valid(dimension, lattice_dims):
+    protein = make_protein(random_sequence(25, 0), dimension)
+    conformation = compact_conformation(protein, lattice_dims, 0)
+    conf_manager = ConformationManager(protein)
+    rng = RandomStream(0)
+
+    for _ in range(300):
+        move = conf_manager.propose_move(conformation, rho=1.0, rng=rng)
+        conformation.apply_move(move, conformation.compute_energy_delta(move.as_dict()))
+        _assert_self_avoiding_walk(conformation)
+        assert conformation.computed_energy == conformation.compute_energy()
@@ -0,0 +1,208 @@
+import pytest
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.AdaptiveLadder import AdaptiveLadder
+from app.src.Optimizers.Checkpoint import Checkpoint
+from app.src.Optimizers.REMC import REMC
+from app.src.Optimizers.TerminationReason import TerminationReason
+from tests.utils import make_protein, random_sequence
+
+PROTEIN = make_protein(random_sequence(20, 0), 2)
+
+
+def _make_remc(**parameters):
+    """Creates REMC for the test protein, with 4 replicas of 20 steps by default."""
+    conf_manager = ConformationManager(PROTEIN)
+    conformation = conf_manager.create_initial_conformation((40, 40), RandomStream(0))
+    parameters = {"max_iter": 30, "seed": 0, **parameters}
+    return REMC(20, 4, 160, 220, conf_manager, **parameters), conformation
+
+
+def _run(e_star=-100, checkpoint=None, **parameters):
+    """Runs REMC on the test protein."""
+    remc, conformation = _make_remc(**parameters)
+    remc.optimize(conformation, e_star, checkpoint)
+    return remc
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_swaps_are_counted_by_rungs(asynchronous):
+    protein = make_protein(random_sequence(20, 0), 2)
+    conf_manager = ConformationManager(protein)
+    conformation = conf_manager.create_initial_conformation((40, 40), RandomStream(0))
+    remc = REMC(
+        20,
+        4,
+        160,
+        220,
+        conf_manager,
+        max_iter=20,
+        asynchronous=asynchronous,
+        seed=0,
+        # The temperatures change during the run, the rungs do not
+        temperature_ladder=AdaptiveLadder(interval=2),
+    )
+
+    remc.optimize(conformation, -100)
+
+    statistics = remc.statistics
+    assert set(statistics.swap_attempts) == {(0, 1), (1, 2), (2, 3)}
+    assert set(statistics.swap_acceptances) <= set(statistics.swap_attempts)
+    assert sum(statistics.swap_attempts.values()) > 0
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_max_iterations(asynchronous):
+    remc = _run(asynchronous=asynchronous, max_iter=5)
+
+    assert remc.termination_reason == TerminationReason.MAX_ITERATIONS
+    assert remc.nb_steps >= 5 * 4 * 20
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_e_star_stops_the_run(asynchronous):
+    # Every conformation reaches the optimal energy of 0
+    remc = _run(0, asynchronous=asynchronous)
+
+    assert remc.termination_reason == TerminationReason.E_STAR
+    assert remc.statistics.nb_iterations <= 1
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_max_steps_budget(asynchronous):
+    remc = _run(asynchronous=asynchronous, max_iter=1000, max_steps=500)
+
+    assert remc.termination_reason == TerminationReason.MAX_STEPS
+    # The budget is checked once all the replicas completed an iteration
+    assert 500 <= remc.nb_steps < 500 + 2 * 4 * 20
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_time_budget(asynchronous):
+    remc = _run(asynchronous=asynchronous, max_iter=10**6, time_budget=0.2)
+
+    assert remc.termination_reason == TerminationReason.TIME_BUDGET
+    assert remc.statistics.nb_iterations < 10**6
+
+
+def test_patience_budget():
+    remc = _run(max_iter=1000, patience=5)
+
+    assert remc.termination_reason == TerminationReason.STAGNATION
+    assert remc.statistics.nb_iterations < 1000
+
+
+def test_patience_continues_across_resume(tmp_path):
+    path = str(tmp_path / "checkpoint.pkl")
+    straight = _run(max_iter=1000, patience=5)
+    nb_iterations = straight.statistics.nb_iterations
+
+    # The run is interrupted one iteration before it stagnates, then resumed
+    _run(
+        max_iter=nb_iterations - 1,
+        patience=5,
+        checkpoint_path=path,
+        checkpoint_interval=1,
+    )
+    resumed = _run(checkpoint=Checkpoint.load(path), max_iter=1000, patience=5)
+
+    assert resumed.termination_reason == TerminationReason.STAGNATION
+    assert resumed.statistics.nb_iterations == nb_iterations
+    assert resumed.nb_steps == straight.nb_steps
+
+
+class _RecordingREMC(REMC):
+    """REMC recording the number of completed iterations each time its budgets are checked."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.completed = []
+
+    def _exceeds_budget(self, iteration):
+        self.completed.append(iteration)
+        return super()._exceeds_budget(iteration)
+
+
+@pytest.mark.parametrize("every", [1, 2, 3])
+def test_asynchronous_snapshots(every):
+    conf_manager = ConformationManager(PROTEIN)
+    conformation = conf_manager.create_initial_conformation((40, 40), RandomStream(0))
+    remc = _RecordingREMC(
+        20, 6, 160, 220, conf_manager, max_iter=30, nb_workers=3, asynchronous=True
+    )
+
+    snapshots = [
+        progress.iteration for progress in remc.stream(conformation, -100, every=every)
+    ]
+
+    # A snapshot is taken as soon as the completed iterations reach a multiple of every, even
+    # when they jump past it
+    expected = []
+    for completed in remc.completed:
+        if completed // every > (expected[-1] if expected else 0) // every:
+            expected.append(completed)
+    assert snapshots == expected
+    assert snapshots[-1] // every == 30 // every
+
+
+def _stream(every, asynchronous=False, max_iter=10):
+    remc, conformation = _make_remc(asynchronous=asynchronous, max_iter=max_iter)
+    return remc, remc.stream(conformation, -100, every=every)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+@pytest.mark.parametrize("every", [1, 3, 10])
+def test_snapshot_cadence(asynchronous, every):
+    remc, progress = _stream(every, asynchronous)
+
+    snapshots = list(progress)
+
+    assert [snapshot.iteration for snapshot in snapshots] == list(
+        range(every, 11, every)
+    )
+    assert snapshots[-1].best_energy == remc.optimal_replica.computed_energy
+    assert all(len(snapshot.energies) == 4 for snapshot in snapshots)
+
+
+def test_no_snapshot_without_cadence():
+    remc, progress = _stream(None)
+
+    assert list(progress) == []
+    assert remc.termination_reason == TerminationReason.MAX_ITERATIONS
+
+
+def test_cadence_must_be_positive():
+    _, progress = _stream(0)
+
+    with pytest.raises(ValueError):
+        next(progress)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_callback_stops_the_run(asynchronous):
+    snapshots = []
+
+    def callback(snapshot):
+        snapshots.append(snapshot.iteration)
+        return snapshot.iteration >= 4
+
+    remc, conformation = _make_remc(asynchronous=asynchronous, max_iter=50)
+    remc.optimize(conformation, -100, callback=callback, every=2)
+
+    assert snapshots == [2, 4]
+    assert remc.termination_reason == TerminationReason.STOPPED
+    assert remc.statistics.nb_iterations < 50
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_closing_the_stream_stops_the_run(asynchronous):
+    remc, progress = _stream(1, asynchronous, max_iter=50)
+
+    first = next(progress)
+    progress.close()
+
+    assert first.iteration == 1
+    assert remc.termination_reason == TerminationReason.STOPPED
+    assert remc.optimal_replica.computed_energy <= first.best_energy
+    assert remc.statistics.nb_iterations < 50
@@ -0,0 +1,96 @@
+import socket
+import threading
+
+import pytest
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.RemoteReplicaPool import (
+    RemoteReplicaPool,
+    run_remote_replica_worker,
+)
+from app.src.Optimizers.ReplicaStatistics import ReplicaStatistics
+from app.src.Optimizers.SimpleMonteCarlo import SimpleMonteCarlo
+from tests.utils import make_protein, random_sequence
+
+
+def _free_address():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()
+
+
+def test_start_times_out_on_missing_workers():
+    protein = make_protein(random_sequence(12, 0), 2)
+    conf_manager = ConformationManager(protein)
+    conformation = conf_manager.create_initial_conformation((24, 24), RandomStream(0))
+    conformation.compute_energy()
+    address = _free_address()
+    pool = RemoteReplicaPool(
+        conformation,
+        4,
+        10,
+        0.0,
+        conf_manager,
+        3,
+        address,
+        b"secret",
+        connect_timeout=1.0,
+    )
+
+    # A single worker connects, it is stopped when the pool gives up
+    worker = threading.Thread(
+        target=run_remote_replica_worker, args=(address, b"secret", 5.0)
+    )
+    worker.start()
+    with pytest.raises(TimeoutError, match="2 of the 3 remote workers"):
+        pool.start()
+    worker.join(timeout=5.0)
+
+    assert not worker.is_alive()
+
+
+def test_remote_workers_sweep_as_local_replicas():
+    protein = make_protein(random_sequence(12, 0), 2)
+    conf_manager = ConformationManager(protein)
+    conformation = conf_manager.create_initial_conformation((24, 24), RandomStream(0))
+    conformation.compute_energy()
+    temperatures = [160.0, 190.0, 220.0, 250.0]
+    address = _free_address()
+    pool = RemoteReplicaPool(
+        conformation,
+        4,
+        10,
+        0.5,
+        conf_manager,
+        2,
+        address,
+        b"secret",
+        random_streams=RandomStream(1).spawn(4),
+        connect_timeout=5.0,
+    )
+    workers = [
+        threading.Thread(
+            target=run_remote_replica_worker, args=(address, b"secret", 5.0)
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+
+    replicas = [conformation.copy() for _ in temperatures]
+    random_streams = RandomStream(1).spawn(4)
+    with pool:
+        energies = pool.sweep(temperatures)
+        positions = [pool.get_conformation(k).positions for k in range(4)]
+    for worker in workers:
+        worker.join(timeout=5.0)
+
+    monte_carlo = SimpleMonteCarlo(10, 0.5)
+    for replica, temperature, rng in zip(replicas, temperatures, random_streams):
+        monte_carlo.optimize(
+            replica, temperature, conf_manager, ReplicaStatistics(), rng
+        )
+    assert energies == [replica.computed_energy for replica in replicas]
+    assert all((a == b.positions).all() for a, b in zip(positions, replicas))
+    assert not any(worker.is_alive() for worker in workers)
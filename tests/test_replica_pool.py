@@ -0,0 +1,133 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.REMC import REMC
+from app.src.Optimizers.ReplicaPool import ReplicaPool
+from app.src.Optimizers.SharedReplicaState import SharedReplicaState
+from tests.utils import make_protein, random_conformation, random_sequence
+
+PROTEIN = make_protein(random_sequence(24, 2), 3)
+TEMPERATURES = [160.0, 175.0, 190.0, 205.0, 220.0]
+
+
+def _make_pool(nb_workers):
+    conformation = random_conformation(PROTEIN, (24, 24, 24), seed=0)
+    return ReplicaPool(
+        conformation,
+        len(TEMPERATURES),
+        30,
+        0.5,
+        ConformationManager(PROTEIN),
+        nb_workers,
+        random_streams=RandomStream(4).spawn(len(TEMPERATURES)),
+    )
+
+
+def _sweep(pool, nb_sweeps):
+    """Sweeps the replicas of a pool, then gathers their energies and positions."""
+    with pool:
+        energies = [pool.sweep(TEMPERATURES) for _ in range(nb_sweeps)]
+        positions = [
+            pool.get_conformation(k).positions.copy() for k in range(len(TEMPERATURES))
+        ]
+        computed = [
+            pool.get_conformation(k).compute_energy() for k in range(len(TEMPERATURES))
+        ]
+    return energies, positions, computed
+
+
+@pytest.mark.parametrize("nb_workers", [2, 3])
+def test_workers_sweep_as_a_single_process(nb_workers):
+    energies, positions, computed = _sweep(_make_pool(1), 4)
+    worker_energies, worker_positions, worker_computed = _sweep(
+        _make_pool(nb_workers), 4
+    )
+
+    assert [list(map(int, e)) for e in worker_energies] == [
+        list(map(int, e)) for e in energies
+    ]
+    assert all(np.array_equal(a, b) for a, b in zip(worker_positions, positions))
+    # The energies kept in the shared block are those of the positions
+    assert worker_computed == list(map(int, worker_energies[-1]))
+
+
+@pytest.mark.parametrize("nb_workers", [2, 3])
+def test_multi_worker_run_matches_single_process_run(nb_workers):
+    def run(nb_workers):
+        conf_manager = ConformationManager(PROTEIN)
+        conformation = random_conformation(PROTEIN, (24, 24, 24), seed=0)
+        remc = REMC(
+            30,
+            5,
+            160,
+            220,
+            conf_manager,
+            max_iter=8,
+            rho=0.5,
+            nb_workers=nb_workers,
+            seed=5,
+        )
+        snapshots = [
+            (progress.iteration, progress.energies, progress.temperatures)
+            for progress in remc.stream(conformation, -100)
+        ]
+        return remc, snapshots
+
+    single, single_snapshots = run(1)
+    multi, multi_snapshots = run(nb_workers)
+
+    assert multi_snapshots == single_snapshots
+    assert multi.nb_steps == single.nb_steps
+    assert np.array_equal(
+        multi.optimal_replica.positions, single.optimal_replica.positions
+    )
+
+
+def _is_unlinked(name):
+    try:
+        memory = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return True
+    memory.close()
+    return False
+
+
+def test_shared_block_is_unlinked_on_close():
+    pool = _make_pool(2)
+    pool.start()
+    name = pool._state.name
+    pool.sweep(TEMPERATURES)
+
+    pool.close()
+
+    assert _is_unlinked(name)
+
+
+def test_shared_block_is_unlinked_on_exception():
+    pool = _make_pool(2)
+    with pytest.raises(RuntimeError):
+        with pool:
+            name = pool._state.name
+            pool.sweep(TEMPERATURES)
+            raise RuntimeError("The run failed")
+
+    assert _is_unlinked(name)
+
+
+def test_shared_state_is_seen_by_attached_processes():
+    state = SharedReplicaState(3, 4, 2)
+    attached = SharedReplicaState(3, 4, 2, name=state.name)
+
+    state.energies[1] = -7
+    state.positions[2] = np.arange(8).reshape(4, 2)
+
+    assert attached.energies[1] == -7
+    assert np.array_equal(attached.positions[2], np.arange(8).reshape(4, 2))
+    attached.close()
+    state.close()
+    state.unlink()
+    assert _is_unlinked(state.name)
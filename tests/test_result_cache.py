@@ -0,0 +1,47 @@
+from app.gui.ResultCache import ResultCache
+from tests.utils import make_protein
+
+HYPERPARAMETERS = {
+    "phi": 500,
+    "khi": 5,
+    "tmin": 160,
+    "tmax": 220,
+    "max_iter": 100,
+    "rho": 0.5,
+    "asynchronous": False,
+    "ladder": "geometric",
+    "time_budget": None,
+    "patience": None,
+    "seed": 0,
+}
+
+
+def test_key_depends_on_exchange_schedule():
+    protein = make_protein("HPHPPHHPHH", 2)
+
+    key = ResultCache.make_key(protein, (20, 20), HYPERPARAMETERS)
+
+    assert key == ResultCache.make_key(protein, (20, 20), dict(HYPERPARAMETERS))
+    assert key != ResultCache.make_key(
+        protein, (20, 20), {**HYPERPARAMETERS, "asynchronous": True}
+    )
+
+
+def test_key_depends_on_optimal_energy():
+    protein = make_protein("HPHPPHHPHH", 2)
+    key = ResultCache.make_key(protein, (20, 20), HYPERPARAMETERS)
+
+    protein.e_star = -4
+
+    assert key != ResultCache.make_key(protein, (20, 20), HYPERPARAMETERS)
+
+
+def test_cached_result_is_returned(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = ResultCache.make_key(make_protein("HPHPPHHPHH", 2), (20, 20), HYPERPARAMETERS)
+
+    result = {"energy": -3, "conformation": b"\x00\x01", "lattice_dims": (20, 20)}
+
+    assert cache.get(key) is None
+    cache.put(key, result)
+    assert cache.get(key) == result
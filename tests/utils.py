@@ -0,0 +1,121 @@
+import os
+from typing import Tuple
+
+from app.src.Controllers.ConformationManager import ConformationManager
+from app.src.DataHandlers.JSONProteinIO import JSONProteinIO
+from app.src.Models.AminoAcidHP import AminoAcidHP
+from app.src.Models.Conformation import Conformation
+from app.src.Models.Polarity import Polarity
+from app.src.Models.ProteinHP import ProteinHP
+from app.src.Models.ProteinModel import ProteinModel
+from app.src.Models.RandomStream import RandomStream
+from app.src.Optimizers.SimpleMonteCarlo import SimpleMonteCarlo
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "app", "data")
+
+
+def load_proteins() -> list[ProteinHP]:
+    """Loads the proteins of the article (S1 and S2 sets).
+
+    Returns
+    -------
+    list[ProteinHP]
+        Proteins of the data directory.
+    """
+    return JSONProteinIO(os.path.join(DATA_PATH, "proteins.json")).load_proteins(
+        ProteinModel.HYDROPHOBIC_POLAR
+    )
+
+
+def make_protein(sequence: str, dimension: int) -> ProteinHP:
+    """Creates a protein from its HP sequence.
+
+    Parameters
+    ----------
+    sequence : str
+        Polarities of the residues, as a string of H and P.
+    dimension : int
+        Dimension of the lattice of the protein.
+
+    Returns
+    -------
+    ProteinHP
+        Protein of the sequence.
+    """
+    polarities = {"H": Polarity.HYDROPHOBIC, "P": Polarity.POLAR}
+    amino_acids = [
+        AminoAcidHP(i, "", "", polarities[polarity])
+        for i, polarity in enumerate(sequence)
+    ]
+    return ProteinHP(sequence, amino_acids, 0, dimension)
+
+
+def random_conformation(
+    protein: ProteinHP, lattice_dims: Tuple[int, ...], seed: int
+) -> Conformation:
+    """Creates a random valid conformation of a protein.
+
+    Parameters
+    ----------
+    protein : ProteinHP
+        Protein of the conformation.
+    lattice_dims : Tuple[int, ...]
+        Dimensions of the lattice.
+    seed : int
+        Seed of the random walk.
+
+    Returns
+    -------
+    Conformation
+        Random self-avoiding walk of the protein.
+    """
+    conformation = ConformationManager(protein).create_initial_conformation(
+        lattice_dims, RandomStream(seed)
+    )
+    conformation.compute_energy()
+    return conformation
+
+
+def random_sequence(length: int, seed: int) -> str:
+    """Draws a random HP sequence.
+
+    Parameters
+    ----------
+    length : int
+        Number of residues.
+    seed : int
+        Seed of the draw.
+
+    Returns
+    -------
+    str
+        Random string of H and P.
+    """
+    rng = RandomStream(seed)
+    return "".join(rng.choice("HP") for _ in range(length))
+
+
+def compact_conformation(
+    protein: ProteinHP, lattice_dims: Tuple[int, ...], seed: int
+) -> Conformation:
+    """Creates a compact conformation of a protein, with many H-H contacts.
+
+    Parameters
+    ----------
+    protein : ProteinHP
+        Protein of the conformation.
+    lattice_dims : Tuple[int, ...]
+        Dimensions of the lattice.
+    seed : int
+        Seed of the random walk and of the Monte Carlo steps folding it.
+
+    Returns
+    -------
+    Conformation
+        Conformation folded by a short Monte Carlo run at low temperature.
+    """
+    conformation = random_conformation(protein, lattice_dims, seed)
+    SimpleMonteCarlo(500, rho=0.5, seed=seed).optimize(
+        conformation, 0.3, ConformationManager(protein)
+    )
+    return conformation